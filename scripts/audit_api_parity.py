@@ -22,7 +22,7 @@ from __future__ import annotations
 import re
 import sys
 from pathlib import Path
-from typing import Dict, List, Set, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
 DOCS_PATH = REPO_ROOT / "docs" / "reference" / "resolve_scripting_api.txt"
@@ -33,6 +33,8 @@ GRANULAR_DIR = REPO_ROOT / "src" / "granular"
 # we extract; the class name comes from the section heading above the method.
 CLASS_HEADING_RE = re.compile(r"^([A-Z][A-Za-z]+)\s*$")
 METHOD_RE = re.compile(r"^\s+([A-Z][A-Za-z0-9_]+)\s*\(")
+# A `.MethodName(` call site anywhere in source.
+CALL_RE = re.compile(r"\.([A-Z][A-Za-z0-9_]+)\(")
 
 # Methods to ignore in the "missing from both layers" check. These are either:
 # - intrinsic Python object methods we don't want to wrap
@@ -79,32 +81,42 @@ def parse_documented_methods(docs_path: Path) -> Dict[str, Set[str]]:
     return classes
 
 
-def collect_source_text() -> str:
-    """Concatenate every Python file under src/ for substring searches."""
-    parts: List[str] = []
+def read_sources() -> List[Tuple[Path, str]]:
+    """Read every Python file under src/ once, as (path, text) pairs.
+
+    All three checks work from this list, so each file is opened a single
+    time; unreadable files are skipped rather than stat-ed up front.
+    """
+    sources: List[Tuple[Path, str]] = []
     for py_path in (REPO_ROOT / "src").rglob("*.py"):
         if "__pycache__" in py_path.parts:
             continue
         try:
-            parts.append(py_path.read_text())
+            sources.append((py_path, py_path.read_text()))
         except (OSError, UnicodeDecodeError):
             continue
-    return "\n".join(parts)
+    return sources
+
+
+def collect_source_text(sources: Optional[List[Tuple[Path, str]]] = None) -> str:
+    """Concatenate every Python file under src/ for substring searches."""
+    if sources is None:
+        sources = read_sources()
+    return "\n".join(text for _path, text in sources)
 
 
-def find_broken_api_imports() -> List[Tuple[Path, int, str]]:
+def find_broken_api_imports(
+    sources: Optional[List[Tuple[Path, str]]] = None,
+) -> List[Tuple[Path, int, str]]:
     """Find any `from api.X import Y` lines (the v2.3.2 bug class)."""
+    if sources is None:
+        sources = read_sources()
     hits: List[Tuple[Path, int, str]] = []
     pattern = re.compile(r"^\s*from\s+api\.\w+\s+import\s+")
-    for py_path in (REPO_ROOT / "src").rglob("*.py"):
-        if "__pycache__" in py_path.parts:
-            continue
-        try:
-            for i, line in enumerate(py_path.read_text().splitlines(), 1):
-                if pattern.search(line):
-                    hits.append((py_path.relative_to(REPO_ROOT), i, line.strip()))
-        except (OSError, UnicodeDecodeError):
-            continue
+    for py_path, text in sources:
+        for i, line in enumerate(text.splitlines(), 1):
+            if pattern.search(line):
+                hits.append((py_path.relative_to(REPO_ROOT), i, line.strip()))
     return hits
 
 
@@ -119,15 +131,18 @@ def find_methods_missing_from_source(
     or incomplete dict-key forwarding. Those are checked separately at
     development time, not in CI.
     """
+    # A simple but effective signal: look for ".MethodName(" anywhere in
+    # src/. Compound dispatchers and granular wrappers both call
+    # `obj.MethodName(...)` — so this catches both layers in one pass. The
+    # call sites are collected once rather than rescanning the whole source
+    # for every documented method.
+    called = set(CALL_RE.findall(source_text))
     missing: Dict[str, Set[str]] = {}
     for cls, methods in docs.items():
         for method in methods:
             if method in IGNORE_METHODS:
                 continue
-            # A simple but effective signal: look for ".MethodName(" anywhere
-            # in src/. Compound dispatchers and granular wrappers both call
-            # `obj.MethodName(...)` — so this catches both layers in one pass.
-            if f".{method}(" not in source_text:
+            if method not in called:
                 missing.setdefault(cls, set()).add(method)
     return missing
 
@@ -165,6 +180,7 @@ ALLOWLIST_UNDOCUMENTED: Set[str] = {
 def find_undocumented_method_wrappers(
     docs: Dict[str, Set[str]],
     source_text: str,
+    sources: Optional[List[Tuple[Path, str]]] = None,
 ) -> List[Tuple[str, str, int]]:
     """Find calls to .MethodName( in source where MethodName is NOT documented
     in any class of the API docs and not in the allowlist. Likely candidates
@@ -190,43 +206,39 @@ def find_undocumented_method_wrappers(
                      "Modify", "Duplicate", "Merge", "Split", "Trim", "Slip",
                      "Slide", "Scale", "Rotate", "Flip", "Crop")
 
-    # Find every .MethodName( call site
-    call_pattern = re.compile(r"\.([A-Z][A-Za-z0-9_]+)\(")
+    if sources is None:
+        sources = read_sources()
     suspicious: List[Tuple[str, str, int]] = []
     seen: Set[str] = set()
 
-    for py_path in (REPO_ROOT / "src").rglob("*.py"):
-        if "__pycache__" in py_path.parts:
-            continue
-        try:
-            for i, line in enumerate(py_path.read_text().splitlines(), 1):
-                for m in call_pattern.finditer(line):
-                    name = m.group(1)
-                    if name in documented or name in seen:
-                        continue
-                    if not any(name.startswith(p) for p in skip_prefixes):
-                        continue
-                    seen.add(name)
-                    suspicious.append((str(py_path.relative_to(REPO_ROOT)), name, i))
-        except (OSError, UnicodeDecodeError):
-            continue
+    for py_path, text in sources:
+        for i, line in enumerate(text.splitlines(), 1):
+            for m in CALL_RE.finditer(line):
+                name = m.group(1)
+                if name in documented or name in seen:
+                    continue
+                if not any(name.startswith(p) for p in skip_prefixes):
+                    continue
+                seen.add(name)
+                suspicious.append((str(py_path.relative_to(REPO_ROOT)), name, i))
     return suspicious
 
 
 def main() -> int:
-    if not DOCS_PATH.exists():
+    try:
+        docs = parse_documented_methods(DOCS_PATH)
+    except FileNotFoundError:
         print(f"FAIL: API docs not found at {DOCS_PATH}", file=sys.stderr)
         return 1
-
-    docs = parse_documented_methods(DOCS_PATH)
-    source_text = collect_source_text()
+    sources = read_sources()
+    source_text = collect_source_text(sources)
 
     failures = 0
 
     print("=" * 70)
     print("Check 1: broken `from api.X import` imports (v2.3.2 bug class)")
     print("=" * 70)
-    broken = find_broken_api_imports()
+    broken = find_broken_api_imports(sources)
     if broken:
         for path, line_no, snippet in broken:
             print(f"  FAIL {path}:{line_no}  {snippet}")
@@ -251,7 +263,7 @@ def main() -> int:
     print("=" * 70)
     print("Check 3: wrappers calling undocumented Resolve methods (advisory)")
     print("=" * 70)
-    suspicious = find_undocumented_method_wrappers(docs, source_text)
+    suspicious = find_undocumented_method_wrappers(docs, source_text, sources)
     if suspicious:
         # Advisory only — these may legitimately be helper methods on non-Resolve
         # objects (e.g., MCP framework, FastMCP). Print but do not count as failure.
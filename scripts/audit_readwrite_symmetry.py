@@ -7,7 +7,9 @@ asymmetries. The goal is to find write-without-read gaps before users have to 
 the repeatable feature-discovery method behind R5.
 
 Reads the `_unknown(action, [...])` lists in src/server.py, which enumerate every
-action a tool accepts. Prints a markdown report.
+action a tool accepts, from the parsed syntax tree: nothing is imported or run,
+and lists that splice a module-level constant (`[*_KERNEL_ACTIONS, ...]`) are
+expanded rather than silently truncated. Prints a markdown report.
 """
 import ast
 import os
@@ -25,10 +27,36 @@ HIGH_SIGNAL = ("set_",)
 LOW_SIGNAL = ("add_", "create_", "insert_", "apply_", "import_")
 
 
+def _string_list(node, consts):
+    """String elements of a list/tuple node, with `*NAME` splats of known constants."""
+    names = []
+    for elt in getattr(node, "elts", ()):
+        if isinstance(elt, ast.Constant) and isinstance(elt.value, str):
+            names.append(elt.value)
+        elif isinstance(elt, ast.Starred) and isinstance(elt.value, ast.Name):
+            names.extend(consts.get(elt.value.id, ()))
+    return names
+
+
 def _action_lists(src: str):
     """Yield lists of action-name string literals from each _unknown(action, [...])."""
-    for m in re.finditer(r"_unknown\(action,\s*\[(.*?)\]\)", src, re.DOTALL):
-        names = re.findall(r'"([a-z][a-z0-9_]*)"', m.group(1))
+    tree = ast.parse(src)
+    consts = {}
+    for node in tree.body:
+        if (isinstance(node, ast.Assign) and len(node.targets) == 1
+                and isinstance(node.targets[0], ast.Name)
+                and isinstance(node.value, (ast.List, ast.Tuple))):
+            consts[node.targets[0].id] = _string_list(node.value, consts)
+    for node in ast.walk(tree):
+        if not (isinstance(node, ast.Call) and isinstance(node.func, ast.Name)
+                and node.func.id == "_unknown" and len(node.args) >= 2):
+            continue
+        arg = node.args[1]
+        if isinstance(arg, ast.Name):
+            names = list(consts.get(arg.id, ()))
+        else:
+            names = _string_list(arg, consts)
+        names = [n for n in names if re.fullmatch(r"[a-z][a-z0-9_]*", n)]
         if names:
             yield names
 
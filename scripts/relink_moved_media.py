@@ -23,7 +23,8 @@ Two things are measured, and the second is the one that matters:
     that fails, because it produces a plausible wrong answer.
 
 The original fixture in `resolve_roundtrip_fixture/` is never touched; the
-staging directories are separate copies, and are cleaned up at the end.
+staging directories hold hard links to it (copies across volumes), and are
+cleaned up at the end.
 """
 
 from __future__ import annotations
@@ -81,7 +82,12 @@ def connect(timeout: float = 420.0) -> Any:
 
 
 def stage() -> List[Path]:
-    """Fresh copies in their own directory, so the fixture is never moved."""
+    """Fresh links in their own directory, so the fixture is never moved.
+
+    Nothing writes to the staged media — it is only imported, renamed with its
+    directory, and deleted — so a hard link stands in for a copy without
+    duplicating the footage. Unlinking a staged name leaves the fixture intact.
+    """
     for path in (STAGE_FROM, STAGE_TO):
         shutil.rmtree(path, ignore_errors=True)
     STAGE_FROM.mkdir(parents=True, exist_ok=True)
@@ -97,7 +103,10 @@ def stage() -> List[Path]:
                  "-timecode", "01:00:00:00", "-y", str(source)],
                 check=True, timeout=300)
         target = STAGE_FROM / source.name
-        shutil.copy2(source, target)
+        try:
+            os.link(source, target)
+        except OSError:  # cross-device, or a filesystem without hard links
+            shutil.copy2(source, target)
         out.append(target)
     return out
 
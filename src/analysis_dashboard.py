@@ -11942,6 +11942,9 @@ def _safe_id(obj: Any) -> Optional[str]:
 # talks to it acquires this re-entrant lock for the full duration of its calls.
 _RESOLVE_API_LOCK = threading.RLock()
 _RESOLVE_ENV_READY = False
+# (module, error) from the one DaVinciResolveScript import attempt this process
+# makes once its environment is ready; None until then.
+_DVR_IMPORT: Optional[Tuple[Any, Optional[str]]] = None
 
 
 def _serialize_resolve(func):
@@ -11967,6 +11970,27 @@ def _bridge_requested() -> bool:
         return False
 
 
+def _load_dvr_script() -> Tuple[Any, Optional[str]]:
+    """Import Blackmagic's module, deciding availability once per process.
+
+    A failed import is not cached by Python, so retrying it searched sys.path
+    again on every connection. The outcome is kept once the environment setup
+    has succeeded; before that a later attempt may still find the module.
+    """
+    global _DVR_IMPORT
+    if _DVR_IMPORT is not None:
+        return _DVR_IMPORT
+    try:
+        import DaVinciResolveScript as _dvr_script  # type: ignore
+
+        outcome: Tuple[Any, Optional[str]] = (_dvr_script, None)
+    except Exception as exc:
+        outcome = (None, str(exc))
+    if _RESOLVE_ENV_READY:
+        _DVR_IMPORT = outcome
+    return outcome
+
+
 def _connect_resolve_read_only() -> Tuple[Any, Optional[str]]:
     global _RESOLVE_ENV_READY
     with _RESOLVE_API_LOCK:
@@ -11994,14 +12018,9 @@ def _connect_resolve_read_only() -> Tuple[Any, Optional[str]]:
             except Exception as exc:
                 if not bridge_on:
                     return None, f"Resolve scripting API unavailable: {exc}"
-        dvr_script = None
-        try:
-            import DaVinciResolveScript as _dvr_script  # type: ignore
-
-            dvr_script = _dvr_script
-        except Exception as exc:
-            if not bridge_on:
-                return None, f"Resolve scripting API unavailable: {exc}"
+        dvr_script, import_error = _load_dvr_script()
+        if import_error and not bridge_on:
+            return None, f"Resolve scripting API unavailable: {import_error}"
         try:
             resolve = connect_resolve(dvr_script)
         except Exception as exc:
@@ -15101,6 +15120,10 @@ def _inventory_prefs() -> Tuple[int, Optional[set]]:
 
 class Handler(BaseHTTPRequestHandler):
     state: DashboardState
+    # Every response carries Content-Length, so HTTP/1.1 keep-alive is safe and
+    # the panel's polling reuses one loopback connection instead of paying a
+    # TCP handshake (and a fresh handler thread) per request.
+    protocol_version = "HTTP/1.1"
 
     def log_message(self, fmt: str, *args: Any) -> None:
         return
@@ -1,13 +1,17 @@
 """Shared bootstrap and helpers for the granular Resolve MCP server."""
 
+import functools
+import inspect
 import logging
 import os
 import platform
 import subprocess
 import sys
 import tempfile
+import threading
 import time
-from typing import Any, Dict, List, Optional, Union
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
 
 CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
 SRC_DIR = os.path.dirname(CURRENT_DIR)
@@ -48,8 +52,15 @@ from src.utils.render_ids import (
     render_codec_id_from_codecs,
     render_format_id_from_formats,
 )
+from src.utils.render_catalogue import (
+    cached_render_codecs,
+    cached_render_formats,
+    cached_render_presets,
+    invalidate_render_catalogue,
+)
 from src.utils.resolve_connection import connect_resolve
 from src.utils.project_properties import (
+    STRING_PROPERTIES,
     get_all_project_properties,
     get_color_settings,
     get_project_info,
@@ -57,11 +68,14 @@ from src.utils.project_properties import (
     get_project_property,
     get_superscale_settings,
     get_timeline_format_settings,
+    invalidate_settings_snapshot,
+    read_setting,
     set_color_science_mode,
     set_color_space,
     set_project_property,
     set_superscale_settings,
     set_timeline_format,
+    settings_snapshot,
 )
 
 paths = get_resolve_paths()
@@ -234,33 +248,36 @@ mcp.tool = _tool_with_default_annotations
 
 resolve = None
 dvr_script = None
+_dvr_script_attempted = False
 #: `dvr_script` may be None when Resolve is not installed; every use passes it
 #: to `connect_resolve()`, which treats None as "not available" and returns None.
 _OPTIONAL_DEPENDENCY_CONTRACT = (
     "DaVinciResolveScript: always routed through connect_resolve(), which is None-tolerant"
 )
 
-try:
-    import DaVinciResolveScript as dvr_script  # type: ignore
 
-    resolve = connect_resolve(dvr_script)
-    if resolve:
-        logger.info(
-            f"Connected to DaVinci Resolve: {resolve.GetProductName()} {resolve.GetVersionString()}"
-        )
-    else:
-        logger.error("Failed to get Resolve object. Is DaVinci Resolve running?")
-except ImportError as exc:
-    logger.error(f"Failed to import DaVinciResolveScript: {exc}")
-    logger.error("Check that DaVinci Resolve is installed and running.")
-    logger.error(f"RESOLVE_SCRIPT_API: {RESOLVE_API_PATH}")
-    logger.error(f"RESOLVE_SCRIPT_LIB: {RESOLVE_LIB_PATH}")
-    logger.error(f"RESOLVE_MODULES_PATH: {RESOLVE_MODULES_PATH}")
-    logger.error(f"sys.path: {sys.path}")
-    resolve = None
-except Exception as exc:
-    logger.error(f"Unexpected error initializing Resolve: {exc}")
-    resolve = None
+def _load_dvr_script():
+    """Import DaVinciResolveScript on the first connection attempt, once per process.
+
+    Importing the granular modules (tool listing, tests, CLI help) no longer
+    loads Blackmagic's native bridge or connects; get_resolve() does both on
+    the first tool call. A failed import is not retried until restart.
+    """
+    global dvr_script, _dvr_script_attempted
+    if not _dvr_script_attempted:
+        _dvr_script_attempted = True
+        try:
+            import DaVinciResolveScript as _dvr_script  # type: ignore
+
+            dvr_script = _dvr_script
+        except ImportError as exc:
+            logger.error(f"Failed to import DaVinciResolveScript: {exc}")
+            logger.error("Check that DaVinci Resolve is installed and running.")
+            logger.error(f"RESOLVE_SCRIPT_API: {RESOLVE_API_PATH}")
+            logger.error(f"RESOLVE_SCRIPT_LIB: {RESOLVE_LIB_PATH}")
+            logger.error(f"RESOLVE_MODULES_PATH: {RESOLVE_MODULES_PATH}")
+            logger.error(f"sys.path: {sys.path}")
+    return dvr_script
 
 
 def _normalize_cdl(cdl):
@@ -308,20 +325,34 @@ def _resolve_safe_dir(path):
 def _is_resolve_handle_live(candidate) -> bool:
     """Return True when a cached Resolve handle still answers root API calls."""
     try:
-        get_version = getattr(candidate, "GetVersion", None)
-        if not callable(get_version):
-            return False
-        return bool(get_version())
+        # Runs before every tool call; a handle without a callable GetVersion
+        # raises here and is reported stale by the handler below.
+        return bool(candidate.GetVersion())
     except Exception as exc:
         logger.warning(f"Cached Resolve handle is stale: {exc}")
         return False
 
 
+# Pause before re-probing a handle that failed once. A probe retried
+# back-to-back lands on the same busy moment that failed the first; 50ms is
+# enough for the bridge to finish a short request and bounds the cost of a
+# handle that really is dead.
+_HANDLE_RECHECK_DELAY = 0.05
+
+
+def _resolve_handle_survives(candidate) -> bool:
+    """True when the handle answers, allowing one delayed re-probe after a miss."""
+    if _is_resolve_handle_live(candidate):
+        return True
+    time.sleep(_HANDLE_RECHECK_DELAY)
+    return _is_resolve_handle_live(candidate)
+
+
 def _try_connect():
     """Attempt to connect to Resolve once. Returns resolve object or None."""
     global resolve
     try:
-        candidate = connect_resolve(dvr_script)
+        candidate = connect_resolve(_load_dvr_script())
         if candidate and _is_resolve_handle_live(candidate):
             resolve = candidate
             logger.info(f"Connected: {resolve.GetProductName()} {resolve.GetVersionString()}")
@@ -362,25 +393,146 @@ def _launch_resolve():
     logger.warning("Resolve did not respond within 60s after launch")
     return False
 
+#: Serialises granular tool bodies on the single-threaded Resolve bridge. The
+#: server's threaded dispatch runs every tool under it, and resolve_batch()
+#: holds it for the whole block. Re-entrant, so a batch opened inside a tool
+#: body does not deadlock on its own dispatch.
+dispatch_lock = threading.RLock()
+#: Per-thread batch state. While depth > 0 the handle pinned by resolve_batch()
+#: is reused without the per-call GetVersion liveness probe, and index rebuilds
+#: requested via mark_batch_dirty() wait for the outermost batch to exit. Kept
+#: per thread so a batch never leaks its handle or its deferrals into calls
+#: running on another worker thread.
+_batch_state = threading.local()
+_batch_flushers: Dict[str, Any] = {}
+
+
+def _batch():
+    state = _batch_state.__dict__
+    if "depth" not in state:
+        state.update(depth=0, resolve=None, dirty=set())
+    return state
+
+
+def register_batch_flush(key, rebuild):
+    """Register the rebuild callback that mark_batch_dirty(key) should run."""
+    _batch_flushers[key] = rebuild
+
+
+def mark_batch_dirty(key):
+    """Rebuild the index registered under `key`, or defer it inside a batch."""
+    batch = _batch()
+    if batch["depth"]:
+        batch["dirty"].add(key)
+        return
+    rebuild = _batch_flushers.get(key)
+    if rebuild is not None:
+        rebuild()
+
+
+def _flush_batch(batch):
+    dirty, batch["dirty"] = batch["dirty"], set()
+    for key in sorted(dirty):
+        rebuild = _batch_flushers.get(key)
+        if rebuild is None:
+            continue
+        try:
+            rebuild()
+        except Exception as exc:
+            logger.warning(f"Deferred rebuild of {key!r} failed: {exc}")
+
+
+@contextmanager
+def resolve_batch():
+    """Hold the Resolve handle warm across a sequence of granular calls.
+
+    The scripting API has no transactions, but a workflow such as create
+    folder + import media + set properties otherwise pays the round-trip
+    liveness probe on every call. Inside the block it runs once, other tool
+    calls wait on `dispatch_lock`, and deferred index rebuilds run in a single
+    flush on exit. Nesting is allowed and only the outermost exit flushes.
+    """
+    with dispatch_lock:
+        batch = _batch()
+        outermost = batch["depth"] == 0
+        if outermost:
+            batch["resolve"] = get_resolve()
+        batch["depth"] += 1
+        try:
+            yield batch["resolve"]
+        finally:
+            batch["depth"] -= 1
+            if outermost:
+                batch["resolve"] = None
+                _flush_batch(batch)
+
+
+#: ProjectManager memo, keyed on the identity of the Resolve handle it came from.
+#: A reconnect yields a new handle, so a stale manager is never served.
+_handle_cache = {"resolve": None, "pm": None}
+#: resolve.EXPORT_* style enum values read from the handle in `resolve`; each
+#: name costs one lookup per handle instead of a hasattr + getattr per call.
+_constant_cache: Dict[str, Any] = {"resolve": None, "values": {}}
+
+
 def get_resolve():
     """Lazy connection to Resolve — connects on first tool call, auto-launches if needed."""
     global resolve
-    if resolve is not None and _is_resolve_handle_live(resolve):
+    batch = _batch()
+    if batch["depth"] and batch["resolve"] is not None:
+        return batch["resolve"]
+    # A single failed probe can be a bridge busy with another request rather
+    # than a dead app; a delayed second probe is far cheaper than a fresh
+    # scriptapp handshake, so the handle is kept unless it fails both.
+    if resolve is not None and _resolve_handle_survives(resolve):
         return resolve
     resolve = None
+    invalidate_handle_cache()
     if _try_connect():
         return resolve
     logger.info("Resolve not running, attempting to launch automatically...")
     _launch_resolve()
     return resolve
 
+def _project_manager_of(r):
+    """ProjectManager for `r`, fetched once per Resolve handle."""
+    if _handle_cache["resolve"] is r and _handle_cache["pm"] is not None:
+        return _handle_cache["pm"]
+    pm = r.GetProjectManager()
+    _handle_cache["resolve"], _handle_cache["pm"] = (r, pm) if pm else (None, None)
+    return pm
+
+
+def invalidate_handle_cache():
+    """Forget the memoised ProjectManager; the next lookup re-fetches it."""
+    _handle_cache["resolve"] = None
+    _handle_cache["pm"] = None
+    _constant_cache["resolve"] = None
+    _constant_cache["values"] = {}
+
+
+def _resolve_constant(name):
+    """`resolve.<name>` when the handle defines it, else `name` unchanged."""
+    r = get_resolve()
+    if r is None or not isinstance(name, str):
+        return name
+    if _constant_cache["resolve"] is not r:
+        _constant_cache["resolve"], _constant_cache["values"] = r, {}
+    values = _constant_cache["values"]
+    if name not in values:
+        try:
+            values[name] = getattr(r, name, name)
+        except Exception:
+            logger.debug("Could not resolve constant %r", name, exc_info=True)
+            return name
+    return values[name]
+
 def get_project_manager():
     """Get ProjectManager with lazy connection and null guard."""
     r = get_resolve()
     if not r:
         return None
-    pm = r.GetProjectManager()
-    return pm
+    return _project_manager_of(r)
 
 def get_current_project():
     """Get current project with lazy connection and null guards."""
@@ -436,13 +588,54 @@ def get_all_media_pool_folders(media_pool):
     process_folder(root_folder)
     return folders
 
-def _get_mp():
+# The two failures nearly every tool can report. Shared rather than rebuilt per
+# call: tools return them as-is and nothing downstream mutates a result dict.
+_ERR_NOT_CONNECTED = {"error": "Not connected to DaVinci Resolve"}
+_ERR_NO_PROJECT = {"error": "No project currently open"}
+
+
+def _require_project():
+    """Return (project, None) for the open project, or (None, error dict)."""
     resolve = get_resolve()
     if resolve is None:
-        return None, None, {"error": "Not connected to DaVinci Resolve"}
-    project = resolve.GetProjectManager().GetCurrentProject()
+        return None, _ERR_NOT_CONNECTED
+    project = _project_manager_of(resolve).GetCurrentProject()
     if not project:
-        return None, None, {"error": "No project currently open"}
+        return None, _ERR_NO_PROJECT
+    return project, None
+
+def with_project(func=None, *, error=None):
+    """Call `func` with the open project as its first argument.
+
+    Replaces the `_require_project()` preamble for tools whose body only needs
+    the project. The wrapper advertises `func`'s signature minus that first
+    parameter, so FastMCP builds the same tool schema as before. With
+    `error="Failed to ..."` the wrapper also stands in for the body's outer
+    `try/except Exception`, returning `{"error": f"{error}: {exc}"}`.
+    """
+    if func is None:
+        return functools.partial(with_project, error=error)
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        project, err = _require_project()
+        if err:
+            return err
+        if error is None:
+            return func(project, *args, **kwargs)
+        try:
+            return func(project, *args, **kwargs)
+        except Exception as exc:
+            return {"error": f"{error}: {exc}"}
+
+    wrapper.__signature__ = signature.replace(parameters=list(signature.parameters.values())[1:])
+    return wrapper
+
+def _get_mp():
+    project, err = _require_project()
+    if err:
+        return None, None, err
     mp = project.GetMediaPool()
     if not mp:
         return project, None, {"error": "Failed to get MediaPool"}
@@ -720,12 +913,9 @@ def _navigate_to_folder(mp, folder_path):
     return current
 
 def _get_timeline():
-    resolve = get_resolve()
-    if resolve is None:
-        return None, None, {"error": "Not connected to DaVinci Resolve"}
-    project = resolve.GetProjectManager().GetCurrentProject()
-    if not project:
-        return None, None, {"error": "No project currently open"}
+    project, err = _require_project()
+    if err:
+        return None, None, err
     tl = project.GetCurrentTimeline()
     if not tl:
         return project, None, {"error": "No current timeline"}
@@ -740,6 +930,49 @@ def _get_timeline_item(track_type="video", track_index=1, item_index=0):
         return None, {"error": f"No item at index {item_index} on {track_type} track {track_index}"}
     return items[item_index], None
 
+#: Timeline name -> 1-based index for the current project. Built by one scan and
+#: reused until a hit fails verification or a name is missing, so renames,
+#: deletions and project switches cost a rescan rather than a wrong answer.
+_timeline_index: Dict[str, int] = {}
+
+
+def _rebuild_timeline_index(project, want=None):
+    """Re-scan `project` into the index; return the first timeline named `want`."""
+    _timeline_index.clear()
+    found = None
+    for i in range(1, (project.GetTimelineCount() or 0) + 1):
+        tl = project.GetTimelineByIndex(i)
+        if not tl:
+            continue
+        name = tl.GetName()
+        _timeline_index.setdefault(name, i)
+        if found is None and name == want:
+            found = tl
+    return found
+
+
+def find_timeline_by_name(project, name):
+    """Return the timeline named `name` in `project`, or None.
+
+    A cached index makes a hit two round-trips (fetch + name check) instead of
+    a scan over every timeline. The name check guards against a stale index.
+    """
+    idx = _timeline_index.get(name)
+    if idx is not None:
+        tl = project.GetTimelineByIndex(idx)
+        if tl and tl.GetName() == name:
+            return tl
+    return _rebuild_timeline_index(project, name)
+
+
+def invalidate_timeline_index():
+    """Forget the name -> index map after timelines are added or removed."""
+    _timeline_index.clear()
+
+
+register_batch_flush("timelines", invalidate_timeline_index)
+
+
 def _has_method(obj, method_name):
     return callable(getattr(obj, method_name, None))
 
@@ -40,10 +40,10 @@ def export_folder(folder_name: str, export_path: str, export_type: str = "DRB")
     
     # Check if directory exists, create if not
     export_dir = os.path.dirname(export_path)
-    if not os.path.exists(export_dir) and export_dir:
+    if export_dir:
         try:
-            os.makedirs(export_dir)
-        except Exception as e:
+            os.makedirs(export_dir, exist_ok=True)
+        except OSError as e:
             return f"Error creating directory for export: {str(e)}"
     
     # Export the folder
@@ -310,6 +310,7 @@ _MARKER_COLORS = [
     "Blue", "Cyan", "Green", "Yellow", "Red", "Pink", "Purple", "Fuchsia",
     "Rose", "Lavender", "Sky", "Mint", "Lemon", "Sand", "Cocoa", "Cream",
 ]
+_MARKER_COLOR_SET = frozenset(_MARKER_COLORS)
 
 
 @mcp.tool()
@@ -385,7 +386,7 @@ def folder_analyze_for_slate(folder_path: str = "", marker_color: str = "Blue")
         return err
     if not hasattr(folder, "AnalyzeForSlate"):
         return {"error": "AnalyzeForSlate requires DaVinci Resolve 21+"}
-    if marker_color not in _MARKER_COLORS:
+    if marker_color not in _MARKER_COLOR_SET:
         return {"error": f"Invalid marker_color '{marker_color}'. Valid: {', '.join(_MARKER_COLORS)}"}
     return {"success": bool(folder.AnalyzeForSlate(marker_color))}
 
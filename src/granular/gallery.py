@@ -5,14 +5,9 @@ from src.granular.common import *  # noqa: F401,F403
 resolve = ResolveProxy()
 
 @mcp.tool(annotations=READ_ONLY_TOOL)
-def get_gallery_album_name() -> Dict[str, Any]:
+@with_project
+def get_gallery_album_name(project) -> Dict[str, Any]:
     """Get the name of the current gallery album."""
-    resolve = get_resolve()
-    if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
-    project = resolve.GetProjectManager().GetCurrentProject()
-    if not project:
-        return {"error": "No project open"}
     gallery = project.GetGallery()
     if not gallery:
         return {"error": "Failed to get Gallery"}
@@ -21,18 +16,13 @@ def get_gallery_album_name() -> Dict[str, Any]:
 
 
 @mcp.tool()
-def set_gallery_album_name(name: str) -> Dict[str, Any]:
+@with_project
+def set_gallery_album_name(project, name: str) -> Dict[str, Any]:
     """Set the name of the current gallery album.
 
     Args:
         name: New album name.
     """
-    resolve = get_resolve()
-    if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
-    project = resolve.GetProjectManager().GetCurrentProject()
-    if not project:
-        return {"error": "No project open"}
     gallery = project.GetGallery()
     if not gallery:
         return {"error": "Failed to get Gallery"}
@@ -41,14 +31,9 @@ def set_gallery_album_name(name: str) -> Dict[str, Any]:
 
 
 @mcp.tool()
-def get_gallery_still_albums() -> Dict[str, Any]:
+@with_project
+def get_gallery_still_albums(project) -> Dict[str, Any]:
     """Get list of all gallery still albums."""
-    resolve = get_resolve()
-    if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
-    project = resolve.GetProjectManager().GetCurrentProject()
-    if not project:
-        return {"error": "No project open"}
     gallery = project.GetGallery()
     if not gallery:
         return {"error": "Failed to get Gallery"}
@@ -57,14 +42,9 @@ def get_gallery_still_albums() -> Dict[str, Any]:
 
 
 @mcp.tool()
-def get_gallery_power_grade_albums() -> Dict[str, Any]:
+@with_project
+def get_gallery_power_grade_albums(project) -> Dict[str, Any]:
     """Get list of all gallery power grade albums."""
-    resolve = get_resolve()
-    if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
-    project = resolve.GetProjectManager().GetCurrentProject()
-    if not project:
-        return {"error": "No project open"}
     gallery = project.GetGallery()
     if not gallery:
         return {"error": "Failed to get Gallery"}
@@ -73,14 +53,9 @@ def get_gallery_power_grade_albums() -> Dict[str, Any]:
 
 
 @mcp.tool()
-def get_current_still_album() -> Dict[str, Any]:
+@with_project
+def get_current_still_album(project) -> Dict[str, Any]:
     """Get the current still album."""
-    resolve = get_resolve()
-    if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
-    project = resolve.GetProjectManager().GetCurrentProject()
-    if not project:
-        return {"error": "No project open"}
     gallery = project.GetGallery()
     if not gallery:
         return {"error": "Failed to get Gallery"}
@@ -89,18 +64,13 @@ def get_current_still_album() -> Dict[str, Any]:
 
 
 @mcp.tool()
-def set_current_still_album(album_index: int) -> Dict[str, Any]:
+@with_project
+def set_current_still_album(project, album_index: int) -> Dict[str, Any]:
     """Set the current still album by index.
 
     Args:
         album_index: 0-based index of the album in GetGalleryStillAlbums() list.
     """
-    resolve = get_resolve()
-    if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
-    project = resolve.GetProjectManager().GetCurrentProject()
-    if not project:
-        return {"error": "No project open"}
     gallery = project.GetGallery()
     if not gallery:
         return {"error": "Failed to get Gallery"}
@@ -112,18 +82,13 @@ def set_current_still_album(album_index: int) -> Dict[str, Any]:
 
 
 @mcp.tool()
-def create_gallery_still_album(album_name: str = "") -> Dict[str, Any]:
+@with_project
+def create_gallery_still_album(project, album_name: str = "") -> Dict[str, Any]:
     """Create a new gallery still album.
 
     Args:
         album_name: Optional name for the new album.
     """
-    resolve = get_resolve()
-    if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
-    project = resolve.GetProjectManager().GetCurrentProject()
-    if not project:
-        return {"error": "No project open"}
     gallery = project.GetGallery()
     if not gallery:
         return {"error": "Failed to get Gallery"}
@@ -135,18 +100,13 @@ def create_gallery_still_album(album_name: str = "") -> Dict[str, Any]:
 
 
 @mcp.tool()
-def create_gallery_power_grade_album(album_name: str = "") -> Dict[str, Any]:
+@with_project
+def create_gallery_power_grade_album(project, album_name: str = "") -> Dict[str, Any]:
     """Create a new gallery power grade album.
 
     Args:
         album_name: Optional name for the new album.
     """
-    resolve = get_resolve()
-    if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
-    project = resolve.GetProjectManager().GetCurrentProject()
-    if not project:
-        return {"error": "No project open"}
     gallery = project.GetGallery()
     if not gallery:
         return {"error": "Failed to get Gallery"}
@@ -158,18 +118,13 @@ def create_gallery_power_grade_album(album_name: str = "") -> Dict[str, Any]:
 
 
 @mcp.tool()
-def get_album_stills(album_index: int = 0) -> Dict[str, Any]:
+@with_project
+def get_album_stills(project, album_index: int = 0) -> Dict[str, Any]:
     """Get list of stills in a gallery album.
 
     Args:
         album_index: 0-based index of the album. Default: 0.
     """
-    resolve = get_resolve()
-    if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
-    project = resolve.GetProjectManager().GetCurrentProject()
-    if not project:
-        return {"error": "No project open"}
     gallery = project.GetGallery()
     if not gallery:
         return {"error": "Failed to get Gallery"}
@@ -181,19 +136,14 @@ def get_album_stills(album_index: int = 0) -> Dict[str, Any]:
 
 
 @mcp.tool()
-def get_still_label(album_index: int, still_index: int) -> Dict[str, Any]:
+@with_project
+def get_still_label(project, album_index: int, still_index: int) -> Dict[str, Any]:
     """Get the label of a still in a gallery album.
 
     Args:
         album_index: 0-based album index.
         still_index: 0-based still index.
     """
-    resolve = get_resolve()
-    if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
-    project = resolve.GetProjectManager().GetCurrentProject()
-    if not project:
-        return {"error": "No project open"}
     gallery = project.GetGallery()
     albums = gallery.GetGalleryStillAlbums()
     if not albums or album_index >= len(albums):
@@ -206,7 +156,8 @@ def get_still_label(album_index: int, still_index: int) -> Dict[str, Any]:
 
 
 @mcp.tool()
-def set_still_label(album_index: int, still_index: int, label: str) -> Dict[str, Any]:
+@with_project
+def set_still_label(project, album_index: int, still_index: int, label: str) -> Dict[str, Any]:
     """Set the label of a still in a gallery album.
 
     Args:
@@ -214,12 +165,6 @@ def set_still_label(album_index: int, still_index: int, label: str) -> Dict[str,
         still_index: 0-based still index.
         label: New label for the still.
     """
-    resolve = get_resolve()
-    if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
-    project = resolve.GetProjectManager().GetCurrentProject()
-    if not project:
-        return {"error": "No project open"}
     gallery = project.GetGallery()
     albums = gallery.GetGalleryStillAlbums()
     if not albums or album_index >= len(albums):
@@ -232,19 +177,14 @@ def set_still_label(album_index: int, still_index: int, label: str) -> Dict[str,
 
 
 @mcp.tool()
-def import_stills_to_album(album_index: int, file_paths: List[str]) -> Dict[str, Any]:
+@with_project
+def import_stills_to_album(project, album_index: int, file_paths: List[str]) -> Dict[str, Any]:
     """Import stills from file paths into a gallery album.
 
     Args:
         album_index: 0-based album index.
         file_paths: List of absolute file paths to import.
     """
-    resolve = get_resolve()
-    if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
-    project = resolve.GetProjectManager().GetCurrentProject()
-    if not project:
-        return {"error": "No project open"}
     gallery = project.GetGallery()
     albums = gallery.GetGalleryStillAlbums()
     if not albums or album_index >= len(albums):
@@ -254,7 +194,8 @@ def import_stills_to_album(album_index: int, file_paths: List[str]) -> Dict[str,
 
 
 @mcp.tool()
-def export_stills_from_album(album_index: int, folder_path: str, file_prefix: str = "still", format: str = "dpx") -> Dict[str, Any]:
+@with_project
+def export_stills_from_album(project, album_index: int, folder_path: str, file_prefix: str = "still", format: str = "dpx") -> Dict[str, Any]:
     """Export stills from a gallery album.
 
     Args:
@@ -263,12 +204,6 @@ def export_stills_from_album(album_index: int, folder_path: str, file_prefix: st
         file_prefix: Filename prefix. Default: 'still'.
         format: File format (dpx, cin, tif, jpg, png, ppm, bmp, xpm, drx). Default: 'dpx'.
     """
-    resolve = get_resolve()
-    if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
-    project = resolve.GetProjectManager().GetCurrentProject()
-    if not project:
-        return {"error": "No project open"}
     gallery = project.GetGallery()
     albums = gallery.GetGalleryStillAlbums()
     if not albums or album_index >= len(albums):
@@ -281,19 +216,14 @@ def export_stills_from_album(album_index: int, folder_path: str, file_prefix: st
 
 
 @mcp.tool()
-def delete_stills_from_album(album_index: int, still_indices: List[int]) -> Dict[str, Any]:
+@with_project
+def delete_stills_from_album(project, album_index: int, still_indices: List[int]) -> Dict[str, Any]:
     """Delete stills from a gallery album.
 
     Args:
         album_index: 0-based album index.
         still_indices: List of 0-based still indices to delete.
     """
-    resolve = get_resolve()
-    if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
-    project = resolve.GetProjectManager().GetCurrentProject()
-    if not project:
-        return {"error": "No project open"}
     gallery = project.GetGallery()
     albums = gallery.GetGalleryStillAlbums()
     if not albums or album_index >= len(albums):
@@ -47,7 +47,7 @@ def graph_set_lut(node_index: int, lut_path: str, item_index: int = 0, track_typ
         relocated = ensure_lut_in_master(lut_path)
         if relocated:
             try:
-                project = resolve.GetProjectManager().GetCurrentProject()
+                _, project = get_current_project()
                 if project:
                     project.RefreshLUTList()
             except Exception:
@@ -244,18 +244,13 @@ def graph_reset_all_grades(item_index: int = 0, track_type: str = "video", track
 
 
 @mcp.tool()
-def get_color_group_clips(group_name: str) -> Dict[str, Any]:
+@with_project
+def get_color_group_clips(project, group_name: str) -> Dict[str, Any]:
     """Get clips in a color group for the current timeline.
 
     Args:
         group_name: Name of the color group.
     """
-    resolve = get_resolve()
-    if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
-    project = resolve.GetProjectManager().GetCurrentProject()
-    if not project:
-        return {"error": "No project open"}
     groups = project.GetColorGroupsList()
     target = None
     if groups:
@@ -272,18 +267,13 @@ def get_color_group_clips(group_name: str) -> Dict[str, Any]:
 
 
 @mcp.tool()
-def get_color_group_pre_clip_node_graph(group_name: str) -> Dict[str, Any]:
+@with_project
+def get_color_group_pre_clip_node_graph(project, group_name: str) -> Dict[str, Any]:
     """Get the pre-clip node graph for a color group.
 
     Args:
         group_name: Name of the color group.
     """
-    resolve = get_resolve()
-    if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
-    project = resolve.GetProjectManager().GetCurrentProject()
-    if not project:
-        return {"error": "No project open"}
     groups = project.GetColorGroupsList()
     target = None
     if groups:
@@ -300,18 +290,13 @@ def get_color_group_pre_clip_node_graph(group_name: str) -> Dict[str, Any]:
 
 
 @mcp.tool()
-def get_color_group_post_clip_node_graph(group_name: str) -> Dict[str, Any]:
+@with_project
+def get_color_group_post_clip_node_graph(project, group_name: str) -> Dict[str, Any]:
     """Get the post-clip node graph for a color group.
 
     Args:
         group_name: Name of the color group.
     """
-    resolve = get_resolve()
-    if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
-    project = resolve.GetProjectManager().GetCurrentProject()
-    if not project:
-        return {"error": "No project open"}
     groups = project.GetColorGroupsList()
     target = None
     if groups:
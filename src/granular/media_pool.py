@@ -344,7 +344,7 @@ def auto_sync_audio(
     """
     r = get_resolve()
     if r is None:
-        return {"error": "Not connected to DaVinci Resolve"}
+        return _ERR_NOT_CONNECTED
     _, mp, err = _get_mp()
     if err:
         return err
@@ -421,14 +421,19 @@ def delete_timelines_by_id(timeline_ids: List[str]) -> Dict[str, Any]:
     project, mp, err = _get_mp()
     if err:
         return err
+    wanted = set(timeline_ids)
     timelines = []
     for i in range(1, project.GetTimelineCount() + 1):
         tl = project.GetTimelineByIndex(i)
-        if tl and tl.GetUniqueId() in timeline_ids:
+        if tl and tl.GetUniqueId() in wanted:
             timelines.append(tl)
+            if len(timelines) == len(wanted):
+                break
     if not timelines:
         return {"error": "No matching timelines found"}
     result = mp.DeleteTimelines(timelines)
+    # Deletion shifts the indices of every later timeline.
+    mark_batch_dirty("timelines")
     return {"success": bool(result), "deleted_count": len(timelines)}
 
 
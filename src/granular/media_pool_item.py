@@ -915,6 +915,7 @@ _MARKER_COLORS = [
     "Blue", "Cyan", "Green", "Yellow", "Red", "Pink", "Purple", "Fuchsia",
     "Rose", "Lavender", "Sky", "Mint", "Lemon", "Sand", "Cocoa", "Cream",
 ]
+_MARKER_COLOR_SET = frozenset(_MARKER_COLORS)
 
 
 @mcp.tool()
@@ -990,7 +991,7 @@ def analyze_clip_for_slate(clip_id: str, marker_color: str = "Blue") -> Dict[str
         return {"error": f"Clip {clip_id} not found"}
     if not hasattr(clip, "AnalyzeForSlate"):
         return {"error": "AnalyzeForSlate requires DaVinci Resolve 21+"}
-    if marker_color not in _MARKER_COLORS:
+    if marker_color not in _MARKER_COLOR_SET:
         return {"error": f"Invalid marker_color '{marker_color}'. Valid: {', '.join(_MARKER_COLORS)}"}
     return {"success": bool(clip.AnalyzeForSlate(marker_color))}
 
@@ -9,7 +9,7 @@ def get_mounted_volumes() -> Dict[str, Any]:
     """Get list of mounted volumes displayed in Resolve's Media Storage."""
     resolve = get_resolve()
     if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
+        return _ERR_NOT_CONNECTED
     ms = resolve.GetMediaStorage()
     if not ms:
         return {"error": "Failed to get MediaStorage"}
@@ -26,7 +26,7 @@ def get_media_storage_subfolders(folder_path: str) -> Dict[str, Any]:
     """
     resolve = get_resolve()
     if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
+        return _ERR_NOT_CONNECTED
     ms = resolve.GetMediaStorage()
     if not ms:
         return {"error": "Failed to get MediaStorage"}
@@ -43,7 +43,7 @@ def get_media_storage_files(folder_path: str) -> Dict[str, Any]:
     """
     resolve = get_resolve()
     if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
+        return _ERR_NOT_CONNECTED
     ms = resolve.GetMediaStorage()
     if not ms:
         return {"error": "Failed to get MediaStorage"}
@@ -60,7 +60,7 @@ def reveal_in_media_storage(file_path: str) -> Dict[str, Any]:
     """
     resolve = get_resolve()
     if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
+        return _ERR_NOT_CONNECTED
     ms = resolve.GetMediaStorage()
     if not ms:
         return {"error": "Failed to get MediaStorage"}
@@ -83,7 +83,7 @@ def add_items_to_media_pool_from_storage(
     """
     resolve = get_resolve()
     if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
+        return _ERR_NOT_CONNECTED
     ms = resolve.GetMediaStorage()
     if not ms:
         return {"error": "Failed to get MediaStorage"}
@@ -115,15 +115,15 @@ def add_clip_mattes_to_media_pool(media_pool_item_id: str, matte_paths: List[str
     """
     resolve = get_resolve()
     if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
+        return _ERR_NOT_CONNECTED
     ms = resolve.GetMediaStorage()
     if not ms:
         return {"error": "Failed to get MediaStorage"}
 
     # Find the media pool item by ID
-    project = resolve.GetProjectManager().GetCurrentProject()
+    project = _project_manager_of(resolve).GetCurrentProject()
     if not project:
-        return {"error": "No project currently open"}
+        return _ERR_NO_PROJECT
     mp = project.GetMediaPool()
     root = mp.GetRootFolder()
 
@@ -158,14 +158,14 @@ def add_timeline_mattes_to_media_pool(timeline_item_index: int, matte_paths: Lis
     """
     resolve = get_resolve()
     if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
+        return _ERR_NOT_CONNECTED
     ms = resolve.GetMediaStorage()
     if not ms:
         return {"error": "Failed to get MediaStorage"}
 
-    project = resolve.GetProjectManager().GetCurrentProject()
+    project = _project_manager_of(resolve).GetCurrentProject()
     if not project:
-        return {"error": "No project currently open"}
+        return _ERR_NO_PROJECT
     timeline = project.GetCurrentTimeline()
     if not timeline:
         return {"error": "No current timeline"}
@@ -1,9 +1,15 @@
 """Project, render, cache, cloud, and project-property tools."""
 
+import re
+
 from src.granular.common import *  # noqa: F401,F403
 
 resolve = ResolveProxy()
 
+# A number in string form: optional sign, then digits with an optional fraction
+# or a bare fraction. `frac`/`lead` tell a float apart from an int.
+_NUMERIC_SETTING_RE = re.compile(r"-?(?:\d+(?P<frac>\.\d*)?|(?P<lead>\.\d+))")
+
 @mcp.resource("resolve://projects")
 def list_projects() -> List[str]:
     """List all available projects in the current database."""
@@ -28,17 +34,11 @@ def get_current_project_name() -> str:
 
 
 @mcp.resource("resolve://project-settings")
-def get_project_settings() -> Dict[str, Any]:
+@with_project(error="Failed to get project settings")
+def get_project_settings(current_project) -> Dict[str, Any]:
     """Get all project settings from the current project."""
-    pm, current_project = get_current_project()
-    if not current_project:
-        return {"error": "No project currently open"}
-    
-    try:
-        # Get all settings
-        return current_project.GetSetting('')
-    except Exception as e:
-        return {"error": f"Failed to get project settings: {str(e)}"}
+    settings = settings_snapshot(current_project)
+    return dict(settings) if settings is not None else current_project.GetSetting('')
 
 
 @mcp.resource("resolve://project-setting/{setting_name}")
@@ -50,11 +50,11 @@ def get_project_setting(setting_name: str) -> Dict[str, Any]:
     """
     pm, current_project = get_current_project()
     if not current_project:
-        return {"error": "No project currently open"}
+        return _ERR_NO_PROJECT
     
     try:
         # Get specific setting
-        value = current_project.GetSetting(setting_name)
+        value = read_setting(current_project, setting_name)
         return {setting_name: value}
     except Exception as e:
         return {"error": f"Failed to get project setting '{setting_name}': {str(e)}"}
@@ -72,30 +72,31 @@ def set_project_setting(setting_name: str, setting_value: Any) -> str:
     if not current_project:
         return "Error: No project currently open"
     
+    invalidate_settings_snapshot(current_project)
     try:
-        # Convert setting_value to string if it's not already
-        if not isinstance(setting_value, str):
-            setting_value = str(setting_value)
-            
         # Try to determine if this should be a numeric value
-        # DaVinci Resolve sometimes expects numeric values for certain settings
-        try:
-            # Check if it's a number in string form
-            if setting_value.isdigit() or (setting_value.startswith('-') and setting_value[1:].isdigit()):
-                # It's an integer
-                numeric_value = int(setting_value)
-                # Try with numeric value first
-                if current_project.SetSetting(setting_name, numeric_value):
-                    return f"Successfully set project setting '{setting_name}' to numeric value {numeric_value}"
-            elif '.' in setting_value and setting_value.replace('.', '', 1).replace('-', '', 1).isdigit():
-                # It's a float
-                numeric_value = float(setting_value)
-                # Try with float value
-                if current_project.SetSetting(setting_name, numeric_value):
-                    return f"Successfully set project setting '{setting_name}' to numeric value {numeric_value}"
-        except (ValueError, TypeError):
-            # Not a number or conversion failed, continue with string value
-            pass
+        # DaVinci Resolve sometimes expects numeric values for certain settings.
+        # Settings declared as strings skip the numeric attempt: it can only
+        # fail there, and each failed attempt is a wasted SetSetting round-trip.
+        numeric_value = None
+        if type(setting_value) in (int, float):
+            # Already numeric: no need to print it and parse it back
+            if setting_name not in STRING_PROPERTIES:
+                numeric_value = setting_value
+            setting_value = str(setting_value)
+        else:
+            if not isinstance(setting_value, str):
+                setting_value = str(setting_value)
+            match = None if setting_name in STRING_PROPERTIES else _NUMERIC_SETTING_RE.fullmatch(setting_value)
+            if match:
+                if match.group("frac") is None and match.group("lead") is None:
+                    numeric_value = int(setting_value)
+                else:
+                    numeric_value = float(setting_value)
+        if numeric_value is not None:
+            # Try with numeric value first
+            if current_project.SetSetting(setting_name, numeric_value):
+                return f"Successfully set project setting '{setting_name}' to numeric value {numeric_value}"
             
         # Fall back to string value if numeric didn't work or wasn't applicable
         result = current_project.SetSetting(setting_name, setting_value)
@@ -121,7 +122,7 @@ def open_project(name: str) -> str:
     if not name:
         return "Error: Project name cannot be empty"
     
-    project_manager = resolve.GetProjectManager()
+    project_manager = _project_manager_of(resolve)
     if not project_manager:
         return "Error: Failed to get Project Manager"
     
@@ -152,7 +153,7 @@ def create_project(name: str, media_location_path: str = None) -> str:
     if not name:
         return "Error: Project name cannot be empty"
     
-    project_manager = resolve.GetProjectManager()
+    project_manager = _project_manager_of(resolve)
     if not project_manager:
         return "Error: Failed to get Project Manager"
     
@@ -204,8 +205,8 @@ def save_project() -> str:
         # Method 2: Try project manager save method
         if not success:
             try:
-                if hasattr(project_manager, "SaveProject"):
-                    result = project_manager.SaveProject()
+                if hasattr(pm, "SaveProject"):
+                    result = pm.SaveProject()
                     if result:
                         logger.info(f"Project '{project_name}' saved using ProjectManager.SaveProject method")
                         success = True
@@ -223,7 +224,7 @@ def save_project() -> str:
                 temp_file = os.path.join(temp_dir, f"{project_name}_temp.drp")
                 
                 # Try to export the project, which should trigger a save
-                result = project_manager.ExportProject(project_name, temp_file)
+                result = pm.ExportProject(project_name, temp_file)
                 if result:
                     logger.info(f"Project '{project_name}' saved via temporary export to {temp_file}")
                     # Try to clean up temp file
@@ -275,34 +276,50 @@ def close_project() -> str:
         return f"Error closing project: {str(e)}"
 
 
+_CACHE_SETTING_KEYS = (
+    "CacheMode",
+    "CacheClipMode",
+    "OptimizedMediaMode",
+    "ProxyMode",
+    "ProxyQuality",
+    "TimelineCacheMode",
+    "LocalCachePath",
+    "NetworkCachePath",
+)
+# Tool-facing names -> SetSetting values, in the order error messages list them.
+_CACHE_MODE_VALUES = {"auto": "0", "on": "1", "off": "2"}
+_PROXY_QUALITY_VALUES = {"quarter": "0", "half": "1", "threeQuarter": "2", "full": "3"}
+_CACHE_PATH_SETTINGS = {"local": "LocalCachePath", "network": "NetworkCachePath"}
+
+
 @mcp.resource("resolve://cache/settings")
-def get_cache_settings() -> Dict[str, Any]:
+@with_project(error="Failed to get cache settings")
+def get_cache_settings(current_project) -> Dict[str, Any]:
     """Get current cache settings from the project."""
+    settings_snapshot(current_project)
+    return {key: read_setting(current_project, key) for key in _CACHE_SETTING_KEYS}
+
+
+def _set_cache_mode_setting(setting_key: str, label: str, mode: str) -> str:
+    """Shared body of the three auto/on/off cache-mode tools below."""
     pm, current_project = get_current_project()
     if not current_project:
-        return {"error": "No project currently open"}
+        return "Error: No project currently open"
+    
+    # Validate mode
+    mode = mode.lower()
+    if mode not in _CACHE_MODE_VALUES:
+        return f"Error: Invalid {label}. Must be one of: {', '.join(_CACHE_MODE_VALUES)}"
     
     try:
-        # Get all cache-related settings
-        settings = {}
-        cache_keys = [
-            "CacheMode", 
-            "CacheClipMode",
-            "OptimizedMediaMode",
-            "ProxyMode", 
-            "ProxyQuality",
-            "TimelineCacheMode",
-            "LocalCachePath",
-            "NetworkCachePath"
-        ]
-        
-        for key in cache_keys:
-            value = current_project.GetSetting(key)
-            settings[key] = value
-            
-        return settings
+        invalidate_settings_snapshot(current_project)
+        result = current_project.SetSetting(setting_key, _CACHE_MODE_VALUES[mode])
+        if result:
+            return f"Successfully set {label} to '{mode}'"
+        else:
+            return f"Failed to set {label} to '{mode}'"
     except Exception as e:
-        return {"error": f"Failed to get cache settings: {str(e)}"}
+        return f"Error setting {label}: {str(e)}"
 
 
 @mcp.tool()
@@ -312,31 +329,7 @@ def set_cache_mode(mode: str) -> str:
     Args:
         mode: Cache mode to set. Options: 'auto', 'on', 'off'
     """
-    pm, current_project = get_current_project()
-    if not current_project:
-        return "Error: No project currently open"
-    
-    # Validate mode
-    valid_modes = ["auto", "on", "off"]
-    mode = mode.lower()
-    if mode not in valid_modes:
-        return f"Error: Invalid cache mode. Must be one of: {', '.join(valid_modes)}"
-    
-    # Convert mode to API value
-    mode_map = {
-        "auto": "0",
-        "on": "1",
-        "off": "2"
-    }
-    
-    try:
-        result = current_project.SetSetting("CacheMode", mode_map[mode])
-        if result:
-            return f"Successfully set cache mode to '{mode}'"
-        else:
-            return f"Failed to set cache mode to '{mode}'"
-    except Exception as e:
-        return f"Error setting cache mode: {str(e)}"
+    return _set_cache_mode_setting("CacheMode", "cache mode", mode)
 
 
 @mcp.tool()
@@ -346,31 +339,7 @@ def set_optimized_media_mode(mode: str) -> str:
     Args:
         mode: Optimized media mode to set. Options: 'auto', 'on', 'off'
     """
-    pm, current_project = get_current_project()
-    if not current_project:
-        return "Error: No project currently open"
-    
-    # Validate mode
-    valid_modes = ["auto", "on", "off"]
-    mode = mode.lower()
-    if mode not in valid_modes:
-        return f"Error: Invalid optimized media mode. Must be one of: {', '.join(valid_modes)}"
-    
-    # Convert mode to API value
-    mode_map = {
-        "auto": "0",
-        "on": "1",
-        "off": "2"
-    }
-    
-    try:
-        result = current_project.SetSetting("OptimizedMediaMode", mode_map[mode])
-        if result:
-            return f"Successfully set optimized media mode to '{mode}'"
-        else:
-            return f"Failed to set optimized media mode to '{mode}'"
-    except Exception as e:
-        return f"Error setting optimized media mode: {str(e)}"
+    return _set_cache_mode_setting("OptimizedMediaMode", "optimized media mode", mode)
 
 
 @mcp.tool()
@@ -380,31 +349,7 @@ def set_proxy_mode(mode: str) -> str:
     Args:
         mode: Proxy mode to set. Options: 'auto', 'on', 'off'
     """
-    pm, current_project = get_current_project()
-    if not current_project:
-        return "Error: No project currently open"
-    
-    # Validate mode
-    valid_modes = ["auto", "on", "off"]
-    mode = mode.lower()
-    if mode not in valid_modes:
-        return f"Error: Invalid proxy mode. Must be one of: {', '.join(valid_modes)}"
-    
-    # Convert mode to API value
-    mode_map = {
-        "auto": "0",
-        "on": "1",
-        "off": "2"
-    }
-    
-    try:
-        result = current_project.SetSetting("ProxyMode", mode_map[mode])
-        if result:
-            return f"Successfully set proxy mode to '{mode}'"
-        else:
-            return f"Failed to set proxy mode to '{mode}'"
-    except Exception as e:
-        return f"Error setting proxy mode: {str(e)}"
+    return _set_cache_mode_setting("ProxyMode", "proxy mode", mode)
 
 
 @mcp.tool()
@@ -419,20 +364,12 @@ def set_proxy_quality(quality: str) -> str:
         return "Error: No project currently open"
     
     # Validate quality
-    valid_qualities = ["quarter", "half", "threeQuarter", "full"]
-    if quality not in valid_qualities:
-        return f"Error: Invalid proxy quality. Must be one of: {', '.join(valid_qualities)}"
-    
-    # Convert quality to API value
-    quality_map = {
-        "quarter": "0",
-        "half": "1",
-        "threeQuarter": "2",
-        "full": "3"
-    }
+    if quality not in _PROXY_QUALITY_VALUES:
+        return f"Error: Invalid proxy quality. Must be one of: {', '.join(_PROXY_QUALITY_VALUES)}"
     
     try:
-        result = current_project.SetSetting("ProxyQuality", quality_map[quality])
+        invalidate_settings_snapshot(current_project)
+        result = current_project.SetSetting("ProxyQuality", _PROXY_QUALITY_VALUES[quality])
         if result:
             return f"Successfully set proxy quality to '{quality}'"
         else:
@@ -454,18 +391,18 @@ def set_cache_path(path_type: str, path: str) -> str:
         return "Error: No project currently open"
     
     # Validate path_type
-    valid_path_types = ["local", "network"]
     path_type = path_type.lower()
-    if path_type not in valid_path_types:
-        return f"Error: Invalid path type. Must be one of: {', '.join(valid_path_types)}"
+    if path_type not in _CACHE_PATH_SETTINGS:
+        return f"Error: Invalid path type. Must be one of: {', '.join(_CACHE_PATH_SETTINGS)}"
     
     # Check if directory exists
     if not os.path.exists(path):
         return f"Error: Path '{path}' does not exist"
     
-    setting_key = "LocalCachePath" if path_type == "local" else "NetworkCachePath"
+    setting_key = _CACHE_PATH_SETTINGS[path_type]
     
     try:
+        invalidate_settings_snapshot(current_project)
         result = current_project.SetSetting(setting_key, path)
         if result:
             return f"Successfully set {path_type} cache path to '{path}'"
@@ -475,7 +412,9 @@ def set_cache_path(path_type: str, path: str) -> str:
         return f"Error setting cache path: {str(e)}"
 
 
-
+# The cloud helpers take the Resolve handle as their first argument, and that
+# must be looked up per call (it is re-acquired after a restart), so these stay
+# thin wrappers rather than registering the helpers as tools directly.
 @mcp.tool()
 def create_cloud_project_tool(
     project_name: Optional[str] = None,
@@ -573,7 +512,7 @@ def get_project_properties_endpoint() -> Dict[str, Any]:
     """Get all project properties for the current project."""
     pm, current_project = get_current_project()
     if not current_project:
-        return {"error": "No project currently open"}
+        return _ERR_NO_PROJECT
     
     return get_all_project_properties(current_project)
 
@@ -587,7 +526,7 @@ def get_project_property_endpoint(property_name: str) -> Dict[str, Any]:
     """
     pm, current_project = get_current_project()
     if not current_project:
-        return {"error": "No project currently open"}
+        return _ERR_NO_PROJECT
     
     value = get_project_property(current_project, property_name)
     return {property_name: value}
@@ -618,7 +557,7 @@ def get_timeline_format() -> Dict[str, Any]:
     """Get timeline format settings for the current project."""
     pm, current_project = get_current_project()
     if not current_project:
-        return {"error": "No project currently open"}
+        return _ERR_NO_PROJECT
     
     return get_timeline_format_settings(current_project)
 
@@ -651,7 +590,7 @@ def get_superscale_settings_endpoint() -> Dict[str, Any]:
     """Get SuperScale settings for the current project."""
     pm, current_project = get_current_project()
     if not current_project:
-        return {"error": "No project currently open"}
+        return _ERR_NO_PROJECT
     
     return get_superscale_settings(current_project)
 
@@ -689,7 +628,7 @@ def get_color_settings_endpoint() -> Dict[str, Any]:
     """Get color science and color space settings for the current project."""
     pm, current_project = get_current_project()
     if not current_project:
-        return {"error": "No project currently open"}
+        return _ERR_NO_PROJECT
     
     return get_color_settings(current_project)
 
@@ -741,7 +680,7 @@ def get_project_metadata_endpoint() -> Dict[str, Any]:
     """Get metadata for the current project."""
     pm, current_project = get_current_project()
     if not current_project:
-        return {"error": "No project currently open"}
+        return _ERR_NO_PROJECT
     
     return get_project_metadata(current_project)
 
@@ -751,7 +690,7 @@ def get_project_info_endpoint() -> Dict[str, Any]:
     """Get comprehensive information about the current project."""
     pm, current_project = get_current_project()
     if not current_project:
-        return {"error": "No project currently open"}
+        return _ERR_NO_PROJECT
     
     return get_project_info(current_project)
 
@@ -769,8 +708,8 @@ def archive_project(project_name: str, archive_path: str, archive_src_media: boo
     """
     resolve = get_resolve()
     if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
-    pm = resolve.GetProjectManager()
+        return _ERR_NOT_CONNECTED
+    pm = _project_manager_of(resolve)
     result = pm.ArchiveProject(project_name, archive_path, archive_src_media, archive_render_cache, archive_proxy_media)
     return {"success": bool(result), "project_name": project_name, "archive_path": archive_path}
 
@@ -784,8 +723,8 @@ def delete_project(project_name: str) -> Dict[str, Any]:
     """
     resolve = get_resolve()
     if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
-    pm = resolve.GetProjectManager()
+        return _ERR_NOT_CONNECTED
+    pm = _project_manager_of(resolve)
     # DeleteProject is flaky (silently returns False when the target is/was
     # current, transient first-attempt failures); route through the retry+switch
     # guard (#19).
@@ -803,8 +742,8 @@ def create_project_folder(folder_name: str) -> Dict[str, Any]:
     """
     resolve = get_resolve()
     if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
-    pm = resolve.GetProjectManager()
+        return _ERR_NOT_CONNECTED
+    pm = _project_manager_of(resolve)
     result = pm.CreateFolder(folder_name)
     return {"success": bool(result), "folder_name": folder_name}
 
@@ -818,8 +757,8 @@ def delete_project_folder(folder_name: str) -> Dict[str, Any]:
     """
     resolve = get_resolve()
     if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
-    pm = resolve.GetProjectManager()
+        return _ERR_NOT_CONNECTED
+    pm = _project_manager_of(resolve)
     result = pm.DeleteFolder(folder_name)
     return {"success": bool(result), "folder_name": folder_name}
 
@@ -829,8 +768,8 @@ def get_project_folder_list() -> Dict[str, Any]:
     """Get list of folders in the current project folder location."""
     resolve = get_resolve()
     if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
-    pm = resolve.GetProjectManager()
+        return _ERR_NOT_CONNECTED
+    pm = _project_manager_of(resolve)
     folders = pm.GetFolderListInCurrentFolder()
     return {"folders": folders if folders else []}
 
@@ -840,8 +779,8 @@ def goto_root_project_folder() -> Dict[str, Any]:
     """Navigate to the root project folder."""
     resolve = get_resolve()
     if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
-    pm = resolve.GetProjectManager()
+        return _ERR_NOT_CONNECTED
+    pm = _project_manager_of(resolve)
     result = pm.GotoRootFolder()
     return {"success": bool(result)}
 
@@ -851,8 +790,8 @@ def goto_parent_project_folder() -> Dict[str, Any]:
     """Navigate up one level in the project folder hierarchy."""
     resolve = get_resolve()
     if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
-    pm = resolve.GetProjectManager()
+        return _ERR_NOT_CONNECTED
+    pm = _project_manager_of(resolve)
     result = pm.GotoParentFolder()
     return {"success": bool(result)}
 
@@ -862,8 +801,8 @@ def get_current_project_folder() -> Dict[str, Any]:
     """Get the name of the current project folder."""
     resolve = get_resolve()
     if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
-    pm = resolve.GetProjectManager()
+        return _ERR_NOT_CONNECTED
+    pm = _project_manager_of(resolve)
     folder = pm.GetCurrentFolder()
     return {"current_folder": folder}
 
@@ -877,8 +816,8 @@ def open_project_folder(folder_name: str) -> Dict[str, Any]:
     """
     resolve = get_resolve()
     if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
-    pm = resolve.GetProjectManager()
+        return _ERR_NOT_CONNECTED
+    pm = _project_manager_of(resolve)
     result = pm.OpenFolder(folder_name)
     return {"success": bool(result), "folder_name": folder_name}
 
@@ -892,8 +831,8 @@ def import_project_from_file(file_path: str) -> Dict[str, Any]:
     """
     resolve = get_resolve()
     if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
-    pm = resolve.GetProjectManager()
+        return _ERR_NOT_CONNECTED
+    pm = _project_manager_of(resolve)
     result = pm.ImportProject(file_path)
     return {"success": bool(result), "file_path": file_path}
 
@@ -909,8 +848,8 @@ def export_project_to_file(project_name: str, file_path: str, with_stills_and_lu
     """
     resolve = get_resolve()
     if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
-    pm = resolve.GetProjectManager()
+        return _ERR_NOT_CONNECTED
+    pm = _project_manager_of(resolve)
     result = pm.ExportProject(project_name, file_path, with_stills_and_luts)
     return {"success": bool(result), "project_name": project_name, "file_path": file_path}
 
@@ -924,8 +863,8 @@ def restore_project(file_path: str) -> Dict[str, Any]:
     """
     resolve = get_resolve()
     if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
-    pm = resolve.GetProjectManager()
+        return _ERR_NOT_CONNECTED
+    pm = _project_manager_of(resolve)
     result = pm.RestoreProject(file_path)
     return {"success": bool(result), "file_path": file_path}
 
@@ -935,8 +874,8 @@ def get_current_database() -> Dict[str, Any]:
     """Get information about the current database."""
     resolve = get_resolve()
     if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
-    pm = resolve.GetProjectManager()
+        return _ERR_NOT_CONNECTED
+    pm = _project_manager_of(resolve)
     db = pm.GetCurrentDatabase()
     return db if db else {"error": "Failed to get current database"}
 
@@ -946,8 +885,8 @@ def get_database_list() -> Dict[str, Any]:
     """Get list of all available databases."""
     resolve = get_resolve()
     if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
-    pm = resolve.GetProjectManager()
+        return _ERR_NOT_CONNECTED
+    pm = _project_manager_of(resolve)
     dbs = pm.GetDatabaseList()
     return {"databases": dbs if dbs else []}
 
@@ -961,42 +900,32 @@ def set_current_database(db_info: Dict[str, str]) -> Dict[str, Any]:
     """
     resolve = get_resolve()
     if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
-    pm = resolve.GetProjectManager()
+        return _ERR_NOT_CONNECTED
+    pm = _project_manager_of(resolve)
     result = pm.SetCurrentDatabase(db_info)
     return {"success": bool(result), "database": db_info}
 
 
 @mcp.tool()
-def set_project_name(name: str) -> Dict[str, Any]:
+@with_project
+def set_project_name(project, name: str) -> Dict[str, Any]:
     """Rename the current project.
 
     Args:
         name: New name for the project.
     """
-    resolve = get_resolve()
-    if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
-    project = resolve.GetProjectManager().GetCurrentProject()
-    if not project:
-        return {"error": "No project currently open"}
     result = project.SetName(name)
     return {"success": bool(result), "name": name}
 
 
 @mcp.tool()
-def get_timeline_by_index(index: int) -> Dict[str, Any]:
+@with_project
+def get_timeline_by_index(project, index: int) -> Dict[str, Any]:
     """Get a timeline by its 1-based index.
 
     Args:
         index: 1-based timeline index.
     """
-    resolve = get_resolve()
-    if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
-    project = resolve.GetProjectManager().GetCurrentProject()
-    if not project:
-        return {"error": "No project currently open"}
     tl = project.GetTimelineByIndex(index)
     if tl:
         return {"name": tl.GetName(), "start_frame": tl.GetStartFrame(), "end_frame": tl.GetEndFrame(), "unique_id": tl.GetUniqueId()}
@@ -1004,165 +933,118 @@ def get_timeline_by_index(index: int) -> Dict[str, Any]:
 
 
 @mcp.tool()
-def get_project_preset_list() -> Dict[str, Any]:
+@with_project
+def get_project_preset_list(project) -> Dict[str, Any]:
     """Get list of available project presets."""
-    resolve = get_resolve()
-    if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
-    project = resolve.GetProjectManager().GetCurrentProject()
-    if not project:
-        return {"error": "No project currently open"}
     presets = project.GetPresetList()
     return {"presets": presets if presets else []}
 
 
 @mcp.tool()
-def set_project_preset(preset_name: str) -> Dict[str, Any]:
+@with_project
+def set_project_preset(project, preset_name: str) -> Dict[str, Any]:
     """Apply a project preset to the current project.
 
     Args:
         preset_name: Name of the preset to apply.
     """
-    resolve = get_resolve()
-    if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
-    project = resolve.GetProjectManager().GetCurrentProject()
-    if not project:
-        return {"error": "No project currently open"}
     result = project.SetPreset(preset_name)
     return {"success": bool(result), "preset_name": preset_name}
 
 
 @mcp.tool()
-def delete_render_job(job_id: str) -> Dict[str, Any]:
+@with_project
+def delete_render_job(project, job_id: str) -> Dict[str, Any]:
     """Delete a specific render job by its ID.
 
     Args:
         job_id: The unique ID of the render job to delete.
     """
-    resolve = get_resolve()
-    if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
-    project = resolve.GetProjectManager().GetCurrentProject()
-    if not project:
-        return {"error": "No project currently open"}
     result = project.DeleteRenderJob(job_id)
     return {"success": bool(result), "job_id": job_id}
 
 
 @mcp.tool()
-def get_render_job_list() -> Dict[str, Any]:
+@with_project
+def get_render_job_list(project) -> Dict[str, Any]:
     """Get list of all render jobs in the queue."""
-    resolve = get_resolve()
-    if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
-    project = resolve.GetProjectManager().GetCurrentProject()
-    if not project:
-        return {"error": "No project currently open"}
     jobs = project.GetRenderJobList()
     return {"render_jobs": jobs if jobs else []}
 
 
 @mcp.tool()
-def start_rendering_jobs(job_ids: Optional[List[str]] = None, is_interactive_mode: bool = False) -> Dict[str, Any]:
+@with_project
+def start_rendering_jobs(project, job_ids: Optional[List[str]] = None, is_interactive_mode: bool = False) -> Dict[str, Any]:
     """Start rendering jobs. If no job IDs specified, renders all queued jobs.
 
     Args:
         job_ids: Optional list of job IDs to render. If None, renders all.
         is_interactive_mode: If True, enables interactive rendering mode.
     """
-    resolve = get_resolve()
-    if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
-    project = resolve.GetProjectManager().GetCurrentProject()
-    if not project:
-        return {"error": "No project currently open"}
     if job_ids:
-        result = project.StartRendering(job_ids, is_interactive_mode)
+        result = project.StartRendering(list(dict.fromkeys(job_ids)), is_interactive_mode)
     else:
         result = project.StartRendering(is_interactive_mode)
     return {"success": bool(result)}
 
 
 @mcp.tool()
-def stop_rendering() -> Dict[str, Any]:
+@with_project
+def stop_rendering(project) -> Dict[str, Any]:
     """Stop the current rendering process."""
-    resolve = get_resolve()
-    if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
-    project = resolve.GetProjectManager().GetCurrentProject()
-    if not project:
-        return {"error": "No project currently open"}
     project.StopRendering()
     return {"success": True}
 
 
 @mcp.tool()
-def is_rendering_in_progress() -> Dict[str, Any]:
+@with_project
+def is_rendering_in_progress(project) -> Dict[str, Any]:
     """Check if rendering is currently in progress."""
-    resolve = get_resolve()
-    if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
-    project = resolve.GetProjectManager().GetCurrentProject()
-    if not project:
-        return {"error": "No project currently open"}
     result = project.IsRenderingInProgress()
     return {"is_rendering": bool(result)}
 
 
 @mcp.tool()
-def load_render_preset(preset_name: str) -> Dict[str, Any]:
+@with_project
+def load_render_preset(project, preset_name: str) -> Dict[str, Any]:
     """Load a render preset by name.
 
     Args:
         preset_name: Name of the render preset to load.
     """
-    resolve = get_resolve()
-    if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
-    project = resolve.GetProjectManager().GetCurrentProject()
-    if not project:
-        return {"error": "No project currently open"}
     result = project.LoadRenderPreset(preset_name)
     return {"success": bool(result), "preset_name": preset_name}
 
 
 @mcp.tool()
-def save_as_new_render_preset(preset_name: str) -> Dict[str, Any]:
+@with_project
+def save_as_new_render_preset(project, preset_name: str) -> Dict[str, Any]:
     """Save current render settings as a new preset.
 
     Args:
         preset_name: Name for the new render preset.
     """
-    resolve = get_resolve()
-    if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
-    project = resolve.GetProjectManager().GetCurrentProject()
-    if not project:
-        return {"error": "No project currently open"}
+    invalidate_render_catalogue(project, "presets")
     result = project.SaveAsNewRenderPreset(preset_name)
     return {"success": bool(result), "preset_name": preset_name}
 
 
 @mcp.tool()
-def delete_render_preset(preset_name: str) -> Dict[str, Any]:
+@with_project
+def delete_render_preset(project, preset_name: str) -> Dict[str, Any]:
     """Delete a render preset.
 
     Args:
         preset_name: Name of the render preset to delete.
     """
-    resolve = get_resolve()
-    if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
-    project = resolve.GetProjectManager().GetCurrentProject()
-    if not project:
-        return {"error": "No project currently open"}
+    invalidate_render_catalogue(project, "presets")
     result = project.DeleteRenderPreset(preset_name)
     return {"success": bool(result), "preset_name": preset_name}
 
 
 @mcp.tool()
-def set_render_settings(settings: Dict[str, Any]) -> Dict[str, Any]:
+@with_project
+def set_render_settings(project, settings: Dict[str, Any]) -> Dict[str, Any]:
     """Set render settings for the current project.
 
     Mirrors Project.SetRenderSettings({settings}) per docs lines 765-799.
@@ -1180,81 +1062,55 @@ def set_render_settings(settings: Dict[str, Any]) -> Dict[str, Any]:
             TimelineStartTimecode (str), ReplaceExistingFilesInPlace (bool),
             ExportSubtitle (bool), SubtitleFormat ("BurnIn", "EmbeddedCaptions", "SeparateFile").
     """
-    resolve = get_resolve()
-    if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
-    project = resolve.GetProjectManager().GetCurrentProject()
-    if not project:
-        return {"error": "No project currently open"}
     result = project.SetRenderSettings(settings)
     return {"success": bool(result)}
 
 
 @mcp.tool()
-def get_render_job_status(job_id: str) -> Dict[str, Any]:
+@with_project
+def get_render_job_status(project, job_id: str) -> Dict[str, Any]:
     """Get the status of a specific render job.
 
     Args:
         job_id: The unique ID of the render job.
     """
-    resolve = get_resolve()
-    if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
-    project = resolve.GetProjectManager().GetCurrentProject()
-    if not project:
-        return {"error": "No project currently open"}
     status = project.GetRenderJobStatus(job_id)
     return status if status else {"error": f"No render job with ID {job_id}"}
 
 
 @mcp.tool()
-def get_render_formats() -> Dict[str, Any]:
+@with_project
+def get_render_formats(project) -> Dict[str, Any]:
     """Get all available render formats."""
-    resolve = get_resolve()
-    if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
-    project = resolve.GetProjectManager().GetCurrentProject()
-    if not project:
-        return {"error": "No project currently open"}
-    formats = project.GetRenderFormats()
-    return {"formats": formats if formats else {}}
+    return {"formats": cached_render_formats(project)}
 
 
 @mcp.tool()
-def get_render_codecs(format_name: str) -> Dict[str, Any]:
+@with_project
+def get_render_codecs(project, format_name: str) -> Dict[str, Any]:
     """Get available codecs for a given render format.
 
     Args:
         format_name: Render format id or display name (e.g. 'mov', 'QuickTime').
     """
-    resolve = get_resolve()
-    if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
-    project = resolve.GetProjectManager().GetCurrentProject()
-    if not project:
-        return {"error": "No project currently open"}
     # GetRenderCodecs needs the format *id*; GetRenderFormats returns
     # {display_name: id}, so an unnormalized display name yields {} (issue #59).
-    format_id = render_format_id_from_formats(project.GetRenderFormats() or {}, format_name)
-    codecs = project.GetRenderCodecs(format_id)
-    return {"format": format_name, "format_id": format_id, "codecs": codecs if codecs else {}}
+    format_id = render_format_id_from_formats(cached_render_formats(project), format_name)
+    codecs = cached_render_codecs(project, format_id)
+    return {"format": format_name, "format_id": format_id, "codecs": codecs}
 
 
 @mcp.tool()
-def get_current_render_format_and_codec() -> Dict[str, Any]:
+@with_project
+def get_current_render_format_and_codec(project) -> Dict[str, Any]:
     """Get the current render format and codec setting."""
-    resolve = get_resolve()
-    if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
-    project = resolve.GetProjectManager().GetCurrentProject()
-    if not project:
-        return {"error": "No project currently open"}
     result = project.GetCurrentRenderFormatAndCodec()
     return result if result else {"error": "Failed to get render format and codec"}
 
 
 @mcp.tool()
-def set_current_render_format_and_codec(format_name: str, codec_name: str) -> Dict[str, Any]:
+@with_project
+def set_current_render_format_and_codec(project, format_name: str, codec_name: str) -> Dict[str, Any]:
     """Set the render format and codec.
 
     Args:
@@ -1262,17 +1118,11 @@ def set_current_render_format_and_codec(format_name: str, codec_name: str) -> Di
         codec_name: Codec id or display name (e.g. 'ProRes422HQ',
             'Apple ProRes 422 HQ', 'H.264').
     """
-    resolve = get_resolve()
-    if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
-    project = resolve.GetProjectManager().GetCurrentProject()
-    if not project:
-        return {"error": "No project currently open"}
     # Both arguments must be *ids*. The display names Resolve shows in the UI are
     # the dict keys, not the values, so passing them through raw is silently
     # rejected for every format where label != id (QuickTime/ProRes, not mp4).
-    format_id = render_format_id_from_formats(project.GetRenderFormats() or {}, format_name)
-    codec_id = render_codec_id_from_codecs(project.GetRenderCodecs(format_id) or {}, codec_name)
+    format_id = render_format_id_from_formats(cached_render_formats(project), format_name)
+    codec_id = render_codec_id_from_codecs(cached_render_codecs(project, format_id), codec_name)
     result = project.SetCurrentRenderFormatAndCodec(format_id, codec_id)
     return {
         "success": bool(result),
@@ -1284,139 +1134,94 @@ def set_current_render_format_and_codec(format_name: str, codec_name: str) -> Di
 
 
 @mcp.tool()
-def get_current_render_mode() -> Dict[str, Any]:
+@with_project
+def get_current_render_mode(project) -> Dict[str, Any]:
     """Get the current render mode (0=Individual Clips, 1=Single Clip)."""
-    resolve = get_resolve()
-    if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
-    project = resolve.GetProjectManager().GetCurrentProject()
-    if not project:
-        return {"error": "No project currently open"}
     mode = project.GetCurrentRenderMode()
     return {"render_mode": mode, "mode_name": "Individual Clips" if mode == 0 else "Single Clip"}
 
 
 @mcp.tool()
-def set_current_render_mode(mode: int) -> Dict[str, Any]:
+@with_project
+def set_current_render_mode(project, mode: int) -> Dict[str, Any]:
     """Set the render mode.
 
     Args:
         mode: 0 for Individual Clips, 1 for Single Clip.
     """
-    resolve = get_resolve()
-    if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
-    project = resolve.GetProjectManager().GetCurrentProject()
-    if not project:
-        return {"error": "No project currently open"}
     result = project.SetCurrentRenderMode(mode)
     return {"success": bool(result), "render_mode": mode}
 
 
 @mcp.tool()
-def get_render_resolutions(format_name: str, codec_name: str) -> Dict[str, Any]:
+@with_project
+def get_render_resolutions(project, format_name: str, codec_name: str) -> Dict[str, Any]:
     """Get available render resolutions for a format/codec combination.
 
     Args:
         format_name: Render format (e.g. 'mp4').
         codec_name: Codec name (e.g. 'H264').
     """
-    resolve = get_resolve()
-    if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
-    project = resolve.GetProjectManager().GetCurrentProject()
-    if not project:
-        return {"error": "No project currently open"}
     resolutions = project.GetRenderResolutions(format_name, codec_name)
     return {"format": format_name, "codec": codec_name, "resolutions": resolutions if resolutions else []}
 
 
 @mcp.tool()
-def refresh_lut_list() -> Dict[str, Any]:
+@with_project
+def refresh_lut_list(project) -> Dict[str, Any]:
     """Refresh the LUT list in the project. Call after adding new LUT files."""
-    resolve = get_resolve()
-    if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
-    project = resolve.GetProjectManager().GetCurrentProject()
-    if not project:
-        return {"error": "No project currently open"}
     result = project.RefreshLUTList()
     return {"success": bool(result)}
 
 
 @mcp.tool()
-def get_project_unique_id() -> Dict[str, Any]:
+@with_project
+def get_project_unique_id(project) -> Dict[str, Any]:
     """Get the unique ID of the current project."""
-    resolve = get_resolve()
-    if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
-    project = resolve.GetProjectManager().GetCurrentProject()
-    if not project:
-        return {"error": "No project currently open"}
     uid = project.GetUniqueId()
     return {"unique_id": uid}
 
 
 @mcp.tool()
-def insert_audio_to_current_track(file_path: str) -> Dict[str, Any]:
+@with_project
+def insert_audio_to_current_track(project, file_path: str) -> Dict[str, Any]:
     """Insert audio file to current track at playhead position.
 
     Args:
         file_path: Absolute path to the audio file.
     """
-    resolve = get_resolve()
-    if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
-    project = resolve.GetProjectManager().GetCurrentProject()
-    if not project:
-        return {"error": "No project currently open"}
     result = project.InsertAudioToCurrentTrackAtPlayhead(file_path)
     return {"success": bool(result), "file_path": file_path}
 
 
 @mcp.tool()
-def load_burn_in_preset(preset_name: str) -> Dict[str, Any]:
+@with_project
+def load_burn_in_preset(project, preset_name: str) -> Dict[str, Any]:
     """Load a burn-in preset by name for the project.
 
     Args:
         preset_name: Name of the burn-in preset to load.
     """
-    resolve = get_resolve()
-    if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
-    project = resolve.GetProjectManager().GetCurrentProject()
-    if not project:
-        return {"error": "No project currently open"}
     result = project.LoadBurnInPreset(preset_name)
     return {"success": bool(result), "preset_name": preset_name}
 
 
 @mcp.tool()
-def export_current_frame_as_still(file_path: str) -> Dict[str, Any]:
+@with_project
+def export_current_frame_as_still(project, file_path: str) -> Dict[str, Any]:
     """Export the current frame as a still image.
 
     Args:
         file_path: Absolute path for the exported still image.
     """
-    resolve = get_resolve()
-    if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
-    project = resolve.GetProjectManager().GetCurrentProject()
-    if not project:
-        return {"error": "No project currently open"}
     result = project.ExportCurrentFrameAsStill(file_path)
     return {"success": bool(result), "file_path": file_path}
 
 
 @mcp.tool()
-def get_color_groups_list() -> Dict[str, Any]:
+@with_project
+def get_color_groups_list(project) -> Dict[str, Any]:
     """Get list of all color groups in the current project."""
-    resolve = get_resolve()
-    if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
-    project = resolve.GetProjectManager().GetCurrentProject()
-    if not project:
-        return {"error": "No project currently open"}
     groups = project.GetColorGroupsList()
     if groups:
         return {"color_groups": [{"name": g.GetName()} for g in groups]}
@@ -1424,35 +1229,25 @@ def get_color_groups_list() -> Dict[str, Any]:
 
 
 @mcp.tool()
-def add_color_group(group_name: str) -> Dict[str, Any]:
+@with_project
+def add_color_group(project, group_name: str) -> Dict[str, Any]:
     """Create a new color group in the current project.
 
     Args:
         group_name: Name for the new color group.
     """
-    resolve = get_resolve()
-    if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
-    project = resolve.GetProjectManager().GetCurrentProject()
-    if not project:
-        return {"error": "No project currently open"}
     result = project.AddColorGroup(group_name)
     return {"success": bool(result), "group_name": group_name}
 
 
 @mcp.tool()
-def delete_color_group(group_name: str) -> Dict[str, Any]:
+@with_project
+def delete_color_group(project, group_name: str) -> Dict[str, Any]:
     """Delete a color group from the current project.
 
     Args:
         group_name: Name of the color group to delete.
     """
-    resolve = get_resolve()
-    if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
-    project = resolve.GetProjectManager().GetCurrentProject()
-    if not project:
-        return {"error": "No project currently open"}
     # Find the group by name
     groups = project.GetColorGroupsList()
     target = None
@@ -1468,7 +1263,8 @@ def delete_color_group(group_name: str) -> Dict[str, Any]:
 
 
 @mcp.tool()
-def rename_color_group(group_name: str, new_name: str) -> Dict[str, Any]:
+@with_project
+def rename_color_group(project, group_name: str, new_name: str) -> Dict[str, Any]:
     """Rename a color group.
 
     Mirrors ColorGroup.SetName(groupName).
@@ -1477,12 +1273,6 @@ def rename_color_group(group_name: str, new_name: str) -> Dict[str, Any]:
         group_name: Current name of the color group.
         new_name: New name to assign.
     """
-    resolve = get_resolve()
-    if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
-    project = resolve.GetProjectManager().GetCurrentProject()
-    if not project:
-        return {"error": "No project currently open"}
     groups = project.GetColorGroupsList() or []
     target = next((g for g in groups if g.GetName() == group_name), None)
     if not target:
@@ -1491,18 +1281,13 @@ def rename_color_group(group_name: str, new_name: str) -> Dict[str, Any]:
 
 
 @mcp.tool()
-def apply_fairlight_preset_to_current_timeline(preset_name: str) -> Dict[str, Any]:
+@with_project
+def apply_fairlight_preset_to_current_timeline(project, preset_name: str) -> Dict[str, Any]:
     """Apply a Fairlight preset to the current timeline.
 
     Args:
         preset_name: Name of the Fairlight preset to apply.
     """
-    resolve = get_resolve()
-    if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
-    project = resolve.GetProjectManager().GetCurrentProject()
-    if not project:
-        return {"error": "No project currently open"}
     missing = _requires_method(project, "ApplyFairlightPresetToCurrentTimeline", "20.2.2")
     if missing:
         return missing
@@ -1511,14 +1296,9 @@ def apply_fairlight_preset_to_current_timeline(preset_name: str) -> Dict[str, An
 
 
 @mcp.tool()
-def get_quick_export_render_presets() -> Dict[str, Any]:
+@with_project
+def get_quick_export_render_presets(project) -> Dict[str, Any]:
     """Get list of available quick export render presets."""
-    resolve = get_resolve()
-    if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
-    project = resolve.GetProjectManager().GetCurrentProject()
-    if not project:
-        return {"error": "No project currently open"}
     presets = project.GetQuickExportRenderPresets()
     return {"presets": presets if presets else []}
 
@@ -1542,12 +1322,9 @@ def render_with_quick_export(
         video_quality: Video quality setting (int or string per render-settings spec); maps to VideoQuality.
         enable_upload: Enable direct upload for supported web presets; maps to EnableUpload.
     """
-    resolve = get_resolve()
-    if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
-    project = resolve.GetProjectManager().GetCurrentProject()
-    if not project:
-        return {"error": "No project currently open"}
+    project, err = _require_project()
+    if err:
+        return err
     param_dict: Dict[str, Any] = {}
     if target_dir is not None:
         param_dict["TargetDir"] = target_dir
@@ -1569,18 +1346,13 @@ def render_with_quick_export(
 
 
 @mcp.tool()
-def add_render_job() -> Dict[str, Any]:
+@with_project
+def add_render_job(project) -> Dict[str, Any]:
     """Add a render job based on current render settings to the render queue.
 
     Returns the unique job ID string for the new render job.
     Configure render settings first with set_render_settings, set_render_format_and_codec, etc.
     """
-    resolve = get_resolve()
-    if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
-    project = resolve.GetProjectManager().GetCurrentProject()
-    if not project:
-        return {"error": "No project currently open"}
     job_id = project.AddRenderJob()
     if job_id:
         return {"success": True, "job_id": job_id}
@@ -1598,8 +1370,8 @@ def load_cloud_project(project_name: str, project_media_path: str, sync_mode: st
     """
     resolve = get_resolve()
     if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
-    pm = resolve.GetProjectManager()
+        return _ERR_NOT_CONNECTED
+    pm = _project_manager_of(resolve)
     if not pm:
         return {"error": "Failed to get ProjectManager"}
     cloud_settings = {
@@ -1639,7 +1411,7 @@ def generate_speech(text_input: str, voice_model: str = "", timecode: str = "",
     """
     pm, current_project = get_current_project()
     if not current_project:
-        return {"error": "No project currently open"}
+        return _ERR_NO_PROJECT
     if not hasattr(current_project, "GenerateSpeech"):
         return {"error": "GenerateSpeech requires DaVinci Resolve 21+ and the AI Speech Generator Extra"}
     if not text_input:
@@ -51,7 +51,7 @@ def inspect_resolve_object() -> Dict[str, Any]:
     """Inspect the main resolve object and return its methods and properties."""
     resolve = get_resolve()
     if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
+        return _ERR_NOT_CONNECTED
     
     return inspect_object(resolve)
 
@@ -71,7 +71,7 @@ def inspect_current_project_object() -> Dict[str, Any]:
     """Inspect the current project object and return its methods and properties."""
     pm, current_project = get_current_project()
     if not current_project:
-        return {"error": "No project currently open"}
+        return _ERR_NO_PROJECT
     
     return inspect_object(current_project)
 
@@ -81,7 +81,7 @@ def inspect_media_pool_object() -> Dict[str, Any]:
     """Inspect the media pool object and return its methods and properties."""
     pm, current_project = get_current_project()
     if not current_project:
-        return {"error": "No project currently open"}
+        return _ERR_NO_PROJECT
     
     media_pool = current_project.GetMediaPool()
     if not media_pool:
@@ -95,7 +95,7 @@ def inspect_current_timeline_object() -> Dict[str, Any]:
     """Inspect the current timeline object and return its methods and properties."""
     pm, current_project = get_current_project()
     if not current_project:
-        return {"error": "No project currently open"}
+        return _ERR_NO_PROJECT
     
     current_timeline = current_project.GetCurrentTimeline()
     if not current_timeline:
@@ -123,19 +123,19 @@ def object_help(object_type: str) -> str:
     if object_type == 'resolve':
         obj = resolve
     elif object_type == 'project_manager':
-        obj = resolve.GetProjectManager()
+        obj = _project_manager_of(resolve)
     elif object_type == 'project':
-        pm = resolve.GetProjectManager()
+        pm = _project_manager_of(resolve)
         if pm:
             obj = pm.GetCurrentProject()
     elif object_type == 'media_pool':
-        pm = resolve.GetProjectManager()
+        pm = _project_manager_of(resolve)
         if pm:
             project = pm.GetCurrentProject()
             if project:
                 obj = project.GetMediaPool()
     elif object_type == 'timeline':
-        pm = resolve.GetProjectManager()
+        pm = _project_manager_of(resolve)
         if pm:
             project = pm.GetCurrentProject()
             if project:
@@ -162,7 +162,7 @@ def inspect_custom_object(object_path: str) -> Dict[str, Any]:
     """
     resolve = get_resolve()
     if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
+        return _ERR_NOT_CONNECTED
     
     try:
         # Start with resolve object
@@ -202,7 +202,7 @@ def get_layout_presets() -> List[Dict[str, Any]]:
     """Get all available layout presets for DaVinci Resolve."""
     resolve = get_resolve()
     if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
+        return _ERR_NOT_CONNECTED
     
     return list_layout_presets(layout_type="ui")
 
@@ -218,7 +218,7 @@ def save_layout_preset_tool(preset_name: str) -> Dict[str, Any]:
     """
     resolve = get_resolve()
     if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
+        return _ERR_NOT_CONNECTED
     result = resolve.SaveLayoutPreset(preset_name)
     return {"success": bool(result), "preset_name": preset_name}
 
@@ -234,7 +234,7 @@ def load_layout_preset_tool(preset_name: str) -> Dict[str, Any]:
     """
     resolve = get_resolve()
     if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
+        return _ERR_NOT_CONNECTED
     result = resolve.LoadLayoutPreset(preset_name)
     return {"success": bool(result), "preset_name": preset_name}
 
@@ -251,7 +251,7 @@ def export_layout_preset_tool(preset_name: str, export_path: str) -> Dict[str, A
     """
     resolve = get_resolve()
     if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
+        return _ERR_NOT_CONNECTED
     result = resolve.ExportLayoutPreset(preset_name, export_path)
     return {"success": bool(result), "preset_name": preset_name, "export_path": export_path}
 
@@ -268,7 +268,7 @@ def import_layout_preset_tool(import_path: str, preset_name: str = None) -> Dict
     """
     resolve = get_resolve()
     if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
+        return _ERR_NOT_CONNECTED
     if preset_name:
         result = resolve.ImportLayoutPreset(import_path, preset_name)
     else:
@@ -288,7 +288,7 @@ def delete_layout_preset_tool(preset_name: str) -> Dict[str, Any]:
     """
     resolve = get_resolve()
     if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
+        return _ERR_NOT_CONNECTED
     result = resolve.DeleteLayoutPreset(preset_name)
     return {"success": bool(result), "preset_name": preset_name}
 
@@ -302,7 +302,7 @@ def disable_background_tasks_for_current_session() -> Dict[str, Any]:
     """
     resolve = get_resolve()
     if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
+        return _ERR_NOT_CONNECTED
     missing = _requires_method(resolve, "DisableBackgroundTasksForCurrentResolveSession", "21.0")
     if missing:
         return missing
@@ -396,7 +396,7 @@ def get_resolve_version_fields() -> Dict[str, Any]:
     """Get DaVinci Resolve version as structured fields [major, minor, patch, build, suffix]."""
     resolve = get_resolve()
     if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
+        return _ERR_NOT_CONNECTED
     version = resolve.GetVersion()
     if version:
         return {"major": version[0], "minor": version[1], "patch": version[2], "build": version[3], "suffix": version[4] if len(version) > 4 else ""}
@@ -408,7 +408,7 @@ def get_fusion_object() -> Dict[str, Any]:
     """Get the Fusion object. Starting point for Fusion scripts."""
     resolve = get_resolve()
     if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
+        return _ERR_NOT_CONNECTED
     fusion = resolve.Fusion()
     if fusion:
         return {"success": True, "fusion_available": True}
@@ -424,7 +424,7 @@ def update_layout_preset(preset_name: str) -> Dict[str, Any]:
     """
     resolve = get_resolve()
     if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
+        return _ERR_NOT_CONNECTED
     result = resolve.UpdateLayoutPreset(preset_name)
     return {"success": bool(result), "preset_name": preset_name}
 
@@ -438,7 +438,8 @@ def import_render_preset(preset_path: str) -> Dict[str, Any]:
     """
     resolve = get_resolve()
     if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
+        return _ERR_NOT_CONNECTED
+    invalidate_render_catalogue(kind="presets")
     result = resolve.ImportRenderPreset(preset_path)
     return {"success": bool(result), "preset_path": preset_path}
 
@@ -453,7 +454,7 @@ def export_render_preset(preset_name: str, export_path: str) -> Dict[str, Any]:
     """
     resolve = get_resolve()
     if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
+        return _ERR_NOT_CONNECTED
     result = resolve.ExportRenderPreset(preset_name, export_path)
     return {"success": bool(result), "preset_name": preset_name, "export_path": export_path}
 
@@ -467,7 +468,7 @@ def import_burn_in_preset(preset_path: str) -> Dict[str, Any]:
     """
     resolve = get_resolve()
     if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
+        return _ERR_NOT_CONNECTED
     result = resolve.ImportBurnInPreset(preset_path)
     return {"success": bool(result), "preset_path": preset_path}
 
@@ -482,7 +483,7 @@ def export_burn_in_preset(preset_name: str, export_path: str) -> Dict[str, Any]:
     """
     resolve = get_resolve()
     if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
+        return _ERR_NOT_CONNECTED
     result = resolve.ExportBurnInPreset(preset_name, export_path)
     return {"success": bool(result), "preset_name": preset_name, "export_path": export_path}
 
@@ -492,7 +493,7 @@ def get_keyframe_mode() -> Dict[str, Any]:
     """Get the current keyframe mode in Resolve. Returns 0=ALL, 1=COLOR, 2=SIZING."""
     resolve = get_resolve()
     if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
+        return _ERR_NOT_CONNECTED
     mode = resolve.GetKeyframeMode()
     mode_names = {0: "All", 1: "Color", 2: "Sizing"}
     return {"keyframe_mode": mode, "mode_name": mode_names.get(mode, "Unknown")}
@@ -507,7 +508,7 @@ def set_keyframe_mode(mode: int) -> Dict[str, Any]:
     """
     resolve = get_resolve()
     if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
+        return _ERR_NOT_CONNECTED
     if mode not in (0, 1, 2):
         return {"error": "Invalid mode. Must be 0 (All), 1 (Color), or 2 (Sizing)"}
     result = resolve.SetKeyframeMode(mode)
@@ -520,7 +521,7 @@ def get_fairlight_presets() -> Dict[str, Any]:
     """Get the available Fairlight preset names."""
     resolve = get_resolve()
     if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
+        return _ERR_NOT_CONNECTED
     missing = _requires_method(resolve, "GetFairlightPresets", "20.2.2")
     if missing:
         return missing
@@ -533,6 +534,6 @@ def quit_resolve() -> Dict[str, Any]:
     """Quit DaVinci Resolve. WARNING: This will close the application."""
     resolve = get_resolve()
     if resolve is None:
-        return {"error": "Not connected to DaVinci Resolve"}
+        return _ERR_NOT_CONNECTED
     resolve.Quit()
     return {"success": True, "message": "DaVinci Resolve is quitting"}
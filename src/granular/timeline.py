@@ -11,37 +11,34 @@ def list_timelines() -> List[str]:
     """List all timelines in the current project."""
     logger.info("Received request to list timelines")
     
-    if resolve is None:
-        logger.error("Not connected to DaVinci Resolve")
-        return ["Error: Not connected to DaVinci Resolve"]
-    
-    project_manager = resolve.GetProjectManager()
-    if not project_manager:
-        logger.error("Failed to get Project Manager")
-        return ["Error: Failed to get Project Manager"]
-    
-    current_project = project_manager.GetCurrentProject()
-    if not current_project:
-        logger.error("No project currently open")
-        return ["Error: No project currently open"]
+    current_project, err = _require_project()
+    if err:
+        logger.error(err["error"])
+        return [f"Error: {err['error']}"]
     
     timeline_count = current_project.GetTimelineCount()
-    logger.info(f"Timeline count: {timeline_count}")
+    logger.info("Timeline count: %s", timeline_count)
     
     timelines = []
     
+    # The names are read anyway, so this scan also refreshes the name index
+    # that set_current_timeline and friends look up.
+    _timeline_index.clear()
     for i in range(1, timeline_count + 1):
         timeline = current_project.GetTimelineByIndex(i)
         if timeline:
             timeline_name = timeline.GetName()
             timelines.append(timeline_name)
-            logger.info(f"Found timeline {i}: {timeline_name}")
+            _timeline_index.setdefault(timeline_name, i)
+            # Per-timeline detail is debug-only: at INFO it was a log line per
+            # timeline on every read of this resource.
+            logger.debug("Found timeline %d: %s", i, timeline_name)
     
     if not timelines:
         logger.info("No timelines found in the current project")
         return ["No timelines found in the current project"]
     
-    logger.info(f"Returning {len(timelines)} timelines: {', '.join(timelines)}")
+    logger.info("Returning %d timelines", len(timelines))
     return timelines
 
 
@@ -50,19 +47,20 @@ def get_current_timeline() -> Dict[str, Any]:
     """Get information about the current timeline."""
     pm, current_project = get_current_project()
     if not current_project:
-        return {"error": "No project currently open"}
+        return _ERR_NO_PROJECT
     
     current_timeline = current_project.GetCurrentTimeline()
     if not current_timeline:
         return {"error": "No timeline currently active"}
     
     # Get basic timeline information
+    settings_snapshot(current_timeline)
     result = {
         "name": current_timeline.GetName(),
-        "fps": current_timeline.GetSetting("timelineFrameRate"),
+        "fps": read_setting(current_timeline, "timelineFrameRate"),
         "resolution": {
-            "width": current_timeline.GetSetting("timelineResolutionWidth"),
-            "height": current_timeline.GetSetting("timelineResolutionHeight")
+            "width": read_setting(current_timeline, "timelineResolutionWidth"),
+            "height": read_setting(current_timeline, "timelineResolutionHeight")
         },
         "duration": current_timeline.GetEndFrame() - current_timeline.GetStartFrame() + 1
     }
@@ -77,30 +75,25 @@ def create_timeline(name: str) -> str:
     Args:
         name: The name for the new timeline
     """
-    resolve = get_resolve()
-    if resolve is None:
-        return "Error: Not connected to DaVinci Resolve"
-    
     if not name:
         return "Error: Timeline name cannot be empty"
     
-    project_manager = resolve.GetProjectManager()
-    if not project_manager:
-        return "Error: Failed to get Project Manager"
-    
-    current_project = project_manager.GetCurrentProject()
-    if not current_project:
-        return "Error: No project currently open"
+    current_project, err = _require_project()
+    if err:
+        return f"Error: {err['error']}"
     
     media_pool = current_project.GetMediaPool()
     if not media_pool:
         return "Error: Failed to get Media Pool"
     
+    # The returned handle is the new timeline; no index scan is needed to find it.
     timeline = media_pool.CreateEmptyTimeline(name)
-    if timeline:
-        return f"Successfully created timeline '{name}'"
-    else:
+    if not timeline:
         return f"Failed to create timeline '{name}'"
+    created_name = timeline.GetName()
+    if created_name != name:
+        return f"Successfully created timeline '{created_name}' (requested '{name}')"
+    return f"Successfully created timeline '{name}'"
 
 
 @mcp.tool()
@@ -110,31 +103,25 @@ def set_current_timeline(name: str) -> str:
     Args:
         name: The name of the timeline to set as current
     """
-    resolve = get_resolve()
-    if resolve is None:
-        return "Error: Not connected to DaVinci Resolve"
-    
     if not name:
         return "Error: Timeline name cannot be empty"
     
-    project_manager = resolve.GetProjectManager()
-    if not project_manager:
-        return "Error: Failed to get Project Manager"
-    
-    current_project = project_manager.GetCurrentProject()
-    if not current_project:
-        return "Error: No project currently open"
+    current_project, err = _require_project()
+    if err:
+        return f"Error: {err['error']}"
     
+    current = current_project.GetCurrentTimeline()
+    if current and current.GetName() == name:
+        return f"Timeline '{name}' is already current"
+
     # Find the timeline by name
-    timeline_count = current_project.GetTimelineCount()
-    for i in range(1, timeline_count + 1):
-        timeline = current_project.GetTimelineByIndex(i)
-        if timeline and timeline.GetName() == name:
-            result = current_project.SetCurrentTimeline(timeline)
-            if result:
-                return f"Successfully switched to timeline '{name}'"
-            else:
-                return f"Failed to switch to timeline '{name}'"
+    timeline = find_timeline_by_name(current_project, name)
+    if timeline:
+        result = current_project.SetCurrentTimeline(timeline)
+        if result:
+            return f"Successfully switched to timeline '{name}'"
+        else:
+            return f"Failed to switch to timeline '{name}'"
     
     return f"Error: Timeline '{name}' not found"
 
@@ -712,15 +699,7 @@ def timeline_export(file_path: str, export_type: str, export_subtype: str = "EXP
     _, tl, err = _get_timeline()
     if err:
         return err
-    # Map string constants to resolve constants
-    try:
-        etype = getattr(resolve, export_type) if hasattr(resolve, export_type) else export_type
-        esub = getattr(resolve, export_subtype) if hasattr(resolve, export_subtype) else export_subtype
-    except Exception:
-        logger.debug("Could not resolve timeline export constants", exc_info=True)
-        etype = export_type
-        esub = export_subtype
-    result = tl.Export(file_path, etype, esub)
+    result = tl.Export(file_path, _resolve_constant(export_type), _resolve_constant(export_subtype))
     return {"success": bool(result), "file_path": file_path}
 
 
@@ -860,7 +839,7 @@ def timeline_create_subtitles_from_audio(
     """
     r = get_resolve()
     if r is None:
-        return {"error": "Not connected to DaVinci Resolve"}
+        return _ERR_NOT_CONNECTED
     _, tl, err = _get_timeline()
     if err:
         return err
@@ -1085,5 +1064,6 @@ def set_timeline_setting(setting_name: str, setting_value: str) -> Dict[str, Any
     _, tl, err = _get_timeline()
     if err:
         return err
+    invalidate_settings_snapshot(tl)
     result = tl.SetSetting(setting_name, setting_value)
     return {"success": bool(result), "setting_name": setting_name, "setting_value": setting_value}
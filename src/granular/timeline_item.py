@@ -14,7 +14,7 @@ def get_timeline_item_properties(timeline_item_id: str) -> Dict[str, Any]:
     """
     pm, current_project = get_current_project()
     if not current_project:
-        return {"error": "No project currently open"}
+        return _ERR_NO_PROJECT
     
     current_timeline = current_project.GetCurrentTimeline()
     if not current_timeline:
@@ -684,7 +684,7 @@ def get_timeline_item_keyframes(timeline_item_id: str, property_name: str) -> Di
     """
     pm, current_project = get_current_project()
     if not current_project:
-        return {"error": "No project currently open"}
+        return _ERR_NO_PROJECT
     
     current_timeline = current_project.GetCurrentTimeline()
     if not current_timeline:
@@ -2079,7 +2079,7 @@ def ti_assign_to_color_group(group_name: str, item_index: int = 0, track_type: s
     item, err = _get_timeline_item(track_type, track_index, item_index)
     if err:
         return err
-    project = resolve.GetProjectManager().GetCurrentProject()
+    _, project = get_current_project()
     groups = project.GetColorGroupsList()
     target = None
     if groups:
@@ -2117,11 +2117,7 @@ def ti_export_lut(export_type: str, path: str, item_index: int = 0, track_type:
     item, err = _get_timeline_item(track_type, track_index, item_index)
     if err:
         return err
-    try:
-        etype = getattr(resolve, export_type) if hasattr(resolve, export_type) else export_type
-    except Exception:
-        etype = export_type
-    return {"success": bool(item.ExportLUT(etype, path))}
+    return {"success": bool(item.ExportLUT(_resolve_constant(export_type), path))}
 
 
 @mcp.tool()
@@ -26,7 +26,8 @@ if modules_path and modules_path not in sys.path:
     sys.path.append(modules_path)
 
 from src.granular import VERSION, mcp
-from src.granular.common import logger
+from src.granular.common import dispatch_lock, logger
+from src.utils.mcp_dispatch import install_threaded_tool_dispatch
 from src.utils.mcp_stdio import run_fastmcp_stdio
 from src.utils.update_check import start_background_update_check
 
@@ -34,6 +35,8 @@ from src.utils.update_check import start_background_update_check
 if __name__ == "__main__":
     try:
         start_background_update_check(VERSION, project_dir, logger)
+        # Tool bodies run off the event loop, one at a time on the Resolve bridge
+        install_threaded_tool_dispatch(mcp, dispatch_lock)
         logger.info(f"Starting DaVinci Resolve MCP Server v{VERSION} (341 granular tools)")
         run_fastmcp_stdio(mcp)
     except KeyboardInterrupt:
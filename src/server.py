@@ -30,7 +30,8 @@ import tempfile
 import threading
 import time
 import zlib
-from typing import Dict, Any, Optional, List, Tuple
+from dataclasses import dataclass, field
+from typing import Dict, Any, Optional, List, Set, Tuple
 
 # ─── Path Setup ───────────────────────────────────────────────────────────────
 
@@ -44,8 +45,16 @@ for p in [current_dir, project_dir]:
 
 # Platform-specific Resolve paths
 from src.utils.cdl import normalize_cdl_payload
+from src.utils.mcp_dispatch import install_threaded_tool_dispatch
+from src.utils.render_catalogue import (
+    cached_render_codecs,
+    cached_render_formats,
+    cached_render_presets,
+    cached_render_preset_names,
+    invalidate_render_catalogue,
+)
 from src.utils.mcp_stdio import run_fastmcp_stdio
-from src.utils.api_truth import lookup_api_truth, VERIFIED_ON as _API_TRUTH_VERIFIED_ON
+from src.utils.api_truth import API_TRUTH, lookup_api_truth, VERIFIED_ON as _API_TRUTH_VERIFIED_ON
 from src.utils import clip_colors as _clip_colors
 from src.utils import resolve_versions as _resolve_versions
 from src.utils.contracts import validate as _validate_params
@@ -54,7 +63,6 @@ from src.utils.page_lock import (
     color_page_for_thumbnails as _color_page_for_thumbnails,
     edit_page_for_timeline_edits as _edit_page_for_timeline_edits,
     open_page_serialized as _open_page_serialized,
-    page_lock as _page_lock,
 )
 from src.utils.proc import safe_run
 from src.utils.readback import verify_by_readback, verification_stats as _verification_stats
@@ -106,7 +114,6 @@ from src.utils.media_analysis_jobs import (
     batch_job_status as media_analysis_batch_job_status,
     cancel_batch_job as cancel_media_analysis_batch_job,
     create_batch_job as create_media_analysis_batch_job,
-    join_batch_job_runner as join_media_analysis_batch_job_runner,
     list_batch_jobs as list_media_analysis_batch_jobs,
     resume_batch_job as resume_media_analysis_batch_job,
     run_batch_job_slice as run_media_analysis_batch_job_slice,
@@ -123,7 +130,7 @@ from src.utils.timeline_title_text import (
     timeline_item_get_property_map as _timeline_item_get_property_map,
 )
 from src.utils.multicam import build_multicam_setup_plan
-from src.utils.timeline_xml import analyze_timeline_xml, sanitize_timeline_xml
+from src.utils.timeline_xml import sanitize_timeline_xml
 from src.utils.fusion_group_settings import (
     FUSION_COMMIT_CHECKLIST,
     FUSION_GROUP_GUARDRAILS,
@@ -156,7 +163,7 @@ os.environ["RESOLVE_SCRIPT_API"] = RESOLVE_API_PATH
 os.environ["RESOLVE_SCRIPT_LIB"] = RESOLVE_LIB_PATH
 
 if RESOLVE_MODULES_PATH not in sys.path:
-    sys.path.append(RESOLVE_MODULES_PATH)
+    sys.path.insert(0, RESOLVE_MODULES_PATH)
 
 # ─── Logging ──────────────────────────────────────────────────────────────────
 
@@ -770,9 +777,9 @@ if _py_ver >= (3, 13):
 
 # ─── Resolve Connection (lazy) ───────────────────────────────────────────────
 
-sys.path.insert(0, RESOLVE_MODULES_PATH)
 resolve = None
 dvr_script = None
+_dvr_script_attempted = False
 _resolve_lock = threading.RLock()
 # Serializes synchronous tool bodies once they run off the event loop (see
 # _install_threaded_tool_dispatch): the Resolve scripting bridge executes one
@@ -808,24 +815,53 @@ if sys.platform.startswith("win") and RESOLVE_LIB_PATH:
             except OSError:
                 pass
 
-try:
-    import DaVinciResolveScript as dvr_script
-    logger.info("DaVinciResolveScript module loaded")
-except ImportError as e:
-    logger.error(f"Cannot import DaVinciResolveScript: {e}")
+
+def _load_dvr_script():
+    """Import DaVinciResolveScript on first connection attempt, once per process.
+
+    Deferred so tools that never touch Resolve (docs, api_truth, update checks)
+    start without loading Blackmagic's native bridge. A failed import is not
+    retried: the module tree only appears with an install, which needs a
+    server restart to pick up anyway.
+    """
+    global dvr_script, _dvr_script_attempted
+    if not _dvr_script_attempted:
+        _dvr_script_attempted = True
+        try:
+            import DaVinciResolveScript as _dvr_script
+
+            dvr_script = _dvr_script
+            logger.info("DaVinciResolveScript module loaded")
+        except ImportError as e:
+            logger.error(f"Cannot import DaVinciResolveScript: {e}")
+    return dvr_script
 
 def _is_resolve_handle_live(candidate) -> bool:
     """Return True when a cached Resolve handle still answers root API calls."""
     try:
-        get_version = getattr(candidate, "GetVersion", None)
-        if not callable(get_version):
-            return False
-        return bool(get_version())
+        # Runs before every tool call; a handle without a callable GetVersion
+        # raises here and is reported stale by the handler below.
+        return bool(candidate.GetVersion())
     except Exception as exc:
         logger.warning(f"Cached Resolve handle is stale: {exc}")
         return False
 
 
+# Pause before re-probing a handle that failed once. A probe retried
+# back-to-back lands on the same busy moment that failed the first; 50ms is
+# enough for the bridge to finish a short request and bounds the cost of a
+# handle that really is dead.
+_HANDLE_RECHECK_DELAY = 0.05
+
+
+def _resolve_handle_survives(candidate) -> bool:
+    """True when the handle answers, allowing one delayed re-probe after a miss."""
+    if _is_resolve_handle_live(candidate):
+        return True
+    time.sleep(_HANDLE_RECHECK_DELAY)
+    return _is_resolve_handle_live(candidate)
+
+
 def _bridge_requested() -> bool:
     """Has the operator asked for the in-app bridge?
 
@@ -851,10 +887,11 @@ def _try_connect():
         # exists for: `connect_resolve` accepts None in bridge mode, and this
         # returned before ever calling it. Verified by blocking the import with a
         # healthy bridge listening — get_resolve() answered None.
-        if dvr_script is None and not _bridge_requested():
+        script = _load_dvr_script()
+        if script is None and not _bridge_requested():
             return None
         try:
-            candidate = connect_resolve(dvr_script)
+            candidate = connect_resolve(script)
             if candidate and _is_resolve_handle_live(candidate):
                 resolve = candidate
                 logger.info(f"Connected: {resolve.GetProductName()} {resolve.GetVersionString()}")
@@ -921,9 +958,13 @@ def get_resolve():
     """Lazy connection to Resolve — connects on first tool call, auto-launches if needed."""
     global resolve
     with _resolve_lock:
-        if resolve is not None and _is_resolve_handle_live(resolve):
+        # A single failed probe can be a bridge busy with another request rather
+        # than a dead app; a delayed second probe is far cheaper than a fresh
+        # scriptapp handshake, so the handle is kept unless it fails both.
+        if resolve is not None and _resolve_handle_survives(resolve):
             return resolve
         resolve = None
+        _invalidate_pm_cache()
         # Try to connect to an already-running Resolve.
         if _try_connect():
             return resolve
@@ -951,6 +992,27 @@ def get_resolve():
         return resolve
 
 
+# The ProjectManager of the current Resolve handle. It lives as long as the
+# handle, so every tool call after the first skips a GetProjectManager round-
+# trip; the current project is still asked for per call (the UI can switch it).
+_pm_cache: Dict[str, Any] = {"resolve": None, "pm": None}
+
+
+def _project_manager_of(r):
+    """ProjectManager for `r`, fetched once per Resolve handle."""
+    if _pm_cache["resolve"] is r and _pm_cache["pm"] is not None:
+        return _pm_cache["pm"]
+    pm = r.GetProjectManager()
+    _pm_cache["resolve"], _pm_cache["pm"] = (r, pm) if pm else (None, None)
+    return pm
+
+
+def _invalidate_pm_cache():
+    """Forget the memoised ProjectManager; the next lookup re-fetches it."""
+    _pm_cache["resolve"] = None
+    _pm_cache["pm"] = None
+
+
 def _not_connected_error():
     """The caller-facing "no Resolve" error, describing what is actually the case.
 
@@ -1021,7 +1083,7 @@ def _destructive_versioning_provider() -> Optional[Tuple[Any, Any, str, Optional
         r = get_resolve()
         if r is None:
             return None
-        pm = r.GetProjectManager()
+        pm = _project_manager_of(r)
         if pm is None:
             return None
         proj = pm.GetCurrentProject()
@@ -1785,6 +1847,10 @@ def _send_resolve_keystroke_go_to_mark_in() -> Dict[str, Any]:
         return {"sent": False, "error": f"{type(exc).__name__}: {exc}"}
 
 def _has_method(obj, method_name):
+    # Deliberately not memoised here. Every live Resolve object reports the
+    # type name PyRemoteObject, so a (type, method) cache would let the first
+    # object probed answer for all the others. The bridge client already caches
+    # method sets by provenance (see BridgeProxy), which is the safe key.
     return callable(getattr(obj, method_name, None))
 
 def _requires_method(obj, method_name, min_version):
@@ -1838,6 +1904,9 @@ _MARKER_COLORS = [
     "Blue", "Cyan", "Green", "Yellow", "Red", "Pink", "Purple", "Fuchsia",
     "Rose", "Lavender", "Sky", "Mint", "Lemon", "Sand", "Cocoa", "Cream",
 ]
+# Membership and case-folded lookups; the list keeps the documented order.
+_MARKER_COLOR_SET = frozenset(_MARKER_COLORS)
+_MARKER_COLORS_BY_LOWER = {color.lower(): color for color in _MARKER_COLORS}
 
 
 def _first_param(p: Dict[str, Any], *keys: str, default=None):
@@ -1847,13 +1916,55 @@ def _first_param(p: Dict[str, Any], *keys: str, default=None):
     return default
 
 
+def _poll_until(predicate, timeout: float = 2.0, initial: float = 0.02, factor: float = 2.0):
+    """Return predicate()'s first truthy result, checking with growing sleeps.
+
+    Sleeps 20ms, 40ms, 80ms... between checks, so a state that is already
+    settled costs one check instead of a fixed wait. Returns the last falsy
+    result once `timeout` seconds have passed.
+    """
+    deadline = time.monotonic() + timeout
+    delay = initial
+    while True:
+        result = predicate()
+        remaining = deadline - time.monotonic()
+        if result or remaining <= 0:
+            return result
+        time.sleep(min(delay, remaining))
+        delay *= factor
+
+
+def _settled_still_export(folder_path: str, before: Set[str]):
+    """Predicate for `_poll_until`: the still's new files, once they have landed.
+
+    ExportStills writes the image and its companion .drx separately, and
+    either may still be growing when it first appears in the listing. Holds
+    out until both exist and every new file's size matches the previous check.
+    """
+    last: Dict[str, int] = {}
+
+    def check():
+        sizes = {}
+        for name in set(os.listdir(folder_path)) - before:
+            try:
+                sizes[name] = os.path.getsize(os.path.join(folder_path, name))
+            except OSError:
+                return None
+        has_drx = any(name.lower().endswith(".drx") for name in sizes)
+        has_image = any(not name.lower().endswith(".drx") for name in sizes)
+        stable = bool(sizes) and sizes == last
+        last.clear()
+        last.update(sizes)
+        return sorted(sizes) if has_drx and has_image and stable else None
+
+    return check
+
+
 def _normalize_marker_color(value):
-    raw = str(value if value is not None else "Blue").strip()
-    if not raw:
-        raw = "Blue"
-    for color in _MARKER_COLORS:
-        if raw.lower() == color.lower():
-            return color, None
+    raw = str(value if value is not None else "").strip() or "Blue"
+    color = _MARKER_COLORS_BY_LOWER.get(raw.lower())
+    if color:
+        return color, None
     return None, _err(f"Invalid marker color '{raw}'. Must be one of: {', '.join(_MARKER_COLORS)}")
 
 
@@ -2444,7 +2555,7 @@ def _check():
             code="NOT_CONNECTED", category="not_connected", retryable=True,
             remediation="Open DaVinci Resolve Studio and set Preferences > General > 'External scripting using' to Local.",
         )
-    pm = resolve.GetProjectManager()
+    pm = _project_manager_of(resolve)
     if pm is None:
         return None, None, _err(
             "Could not get ProjectManager from Resolve",
@@ -2839,6 +2950,21 @@ def _timeline_start_frame(tl) -> Optional[int]:
         return None
 
 
+def _collect_timeline_info(tl, verbose: bool = False) -> Dict[str, Any]:
+    """Name of a created timeline; with `verbose`, also its frame range and track counts.
+
+    The four extra reads are IPC round-trips that bulk create/duplicate callers
+    rarely need, so they are only paid for when asked.
+    """
+    info: Dict[str, Any] = {"name": tl.GetName()}
+    if verbose:
+        info["start_frame"] = _timeline_start_frame(tl)
+        info["end_frame"] = _frame_int(tl.GetEndFrame())
+        info["video_tracks"] = int(tl.GetTrackCount("video") or 0)
+        info["audio_tracks"] = int(tl.GetTrackCount("audio") or 0)
+    return info
+
+
 def _build_append_clip_info_dict(
     root,
     ci: Dict[str, Any],
@@ -3941,7 +4067,20 @@ def _timeline_item_ids(items):
     return ids
 
 
-def _timeline_items_presence(tl, items):
+def _timeline_item_id_set(items):
+    """(unique IDs of `items`, whether any item's ID could not be read)."""
+    target_ids = set()
+    unreadable_item = False
+    for item in items:
+        item_id = _safe_timeline_item_id(item)
+        if item_id:
+            target_ids.add(item_id)
+        else:
+            unreadable_item = True
+    return target_ids, unreadable_item
+
+
+def _timeline_items_presence(tl, items, item_ids=None):
     """Are these timeline items still on the timeline? present/absent/unknown.
 
     'absent' is a positive finding: every item was identifiable and a
@@ -3949,17 +4088,10 @@ def _timeline_items_presence(tl, items):
     could not enumerate a single track, or items whose unique ID cannot be
     read all yield 'unknown' — the readback saw nothing, which is not the
     same as nothing being there. Callers must never treat 'unknown' as
-    verified-gone.
+    verified-gone. `item_ids` is a `_timeline_item_id_set(items)` result to
+    reuse, so a second readback does not read every ID again.
     """
-    target_ids = []
-    unreadable_item = False
-    for item in items:
-        item_id = _safe_timeline_item_id(item)
-        if item_id:
-            target_ids.append(item_id)
-        else:
-            unreadable_item = True
-    target_ids = set(target_ids)
+    target_ids, unreadable_item = item_ids if item_ids is not None else _timeline_item_id_set(items)
 
     tracks_walked = 0
     walk_failed = False
@@ -4028,12 +4160,14 @@ def _timeline_delete_clips_verified(tl, items, ripple, *, resolve=None):
     def _delete_with_readback():
         if bool(tl.DeleteClips(items, ripple)):
             return True
-        presence = _timeline_items_presence(tl, items)
+        # Read on the first False only; the happy path never needs them.
+        item_ids = _timeline_item_id_set(items)
+        presence = _timeline_items_presence(tl, items, item_ids)
         if presence != "present":
             return presence == "absent"
         if bool(tl.DeleteClips(items, ripple)):
             return True
-        return _timeline_items_presence(tl, items) == "absent"
+        return _timeline_items_presence(tl, items, item_ids) == "absent"
 
     if resolve is None:
         return _delete_with_readback()
@@ -4932,6 +5066,7 @@ _TIMELINE_CONFORM_KERNEL_ACTIONS = [
     "detect_gaps_overlaps",
     "source_range_report",
     "export_timeline_checked",
+    "export_timelines_checked",
     "import_timeline_checked",
     "import_from_drp",
     "compare_timelines",
@@ -5575,10 +5710,11 @@ def _timeline_create_variant_from_ranges(proj, source_tl, p: Dict[str, Any]) ->
     if p.get("cdl"):
         target_ids = [row.get("timeline_item_id") for row in items_out if row.get("timeline_item_id") and row.get("range", {}).get("media_type") == 1]
         look_result = _timeline_apply_look_to_items(new_tl, {"target_ids": target_ids, "cdl": p.get("cdl")})
+    new_name, new_id = _remember_new_timeline(proj, new_tl)
     return {
         "success": True,
-        "name": new_tl.GetName(),
-        "id": new_tl.GetUniqueId(),
+        "name": new_name,
+        "id": new_id,
         "items": items_out,
         "placement_mismatches": placement_mismatches,
         "audio": _variant_audio_summary(built),
@@ -5901,8 +6037,10 @@ def _timeline_export_value(value, resolve_obj=None):
     if not raw:
         return "", None
     const_name = raw if raw.startswith("EXPORT_") else None
-    if const_name and resolve_obj is not None and hasattr(resolve_obj, const_name):
-        return getattr(resolve_obj, const_name), const_name
+    if const_name and resolve_obj is not None:
+        value = getattr(resolve_obj, const_name, None)
+        if value is not None:
+            return value, const_name
     if const_name:
         return const_name, const_name
     return raw, None
@@ -5938,31 +6076,32 @@ def _export_timeline_checked(tl, p: Dict[str, Any]):
         return _err("path is required")
     if p.get("require_temp_path", True) and not _render_temp_path_ok(path):
         return _err("path must be under the system temp directory unless require_temp_path=False")
-    folder = os.path.dirname(os.path.abspath(path))
-    if folder:
-        os.makedirs(folder, exist_ok=True)
     # Resolve enum constants via get_resolve(), not the module global `resolve`
     # (which can be None and silently degrade the EXPORT_* args to strings — the
     # same failure class as issue #70).
     spec = _timeline_export_spec(p, get_resolve())
     if p.get("dry_run"):
         return _ok(path=path, would_export=True, spec={k: v for k, v in spec.items() if k != "export_type"})
+    # Only a real export needs the folder; a dry run leaves the filesystem alone.
+    folder = os.path.dirname(os.path.abspath(path))
+    if folder:
+        os.makedirs(folder, exist_ok=True)
 
     def _work():
         success = bool(tl.Export(path, spec["export_type"], spec["export_subtype"]))
         files = []
         primary_file = path
         if success and os.path.isdir(path):
+            # First file per extension, taken from the bare filename so a long
+            # bundle path is not lowercased once per preferred extension.
+            first_by_ext = {}
             for dirpath, _, filenames in os.walk(path):
                 for filename in filenames:
                     file_path = os.path.join(dirpath, filename)
                     files.append({"path": file_path, "size": os.path.getsize(file_path)})
+                    first_by_ext.setdefault(os.path.splitext(filename)[1].lower(), file_path)
             preferred_exts = (".fcpxml", ".xml", ".edl", ".drt", ".aaf", ".otio")
-            for ext in preferred_exts:
-                match = next((row["path"] for row in files if row["path"].lower().endswith(ext)), None)
-                if match:
-                    primary_file = match
-                    break
+            primary_file = next((first_by_ext[ext] for ext in preferred_exts if ext in first_by_ext), path)
         size = 0
         if success and os.path.exists(path):
             if os.path.isdir(path):
@@ -5984,6 +6123,58 @@ def _export_timeline_checked(tl, p: Dict[str, Any]):
     return _run_maybe_background("timeline.export_timeline_checked", p, _work)
 
 
+def _export_timelines_checked(proj, p: Dict[str, Any]):
+    """Export several timelines, by id or name, into one folder.
+
+    Runs serially: the scripting bridge executes one call at a time, so worker
+    threads would only queue behind each other. What a batch saves is the
+    per-call round-trip (and the current-timeline switch) of exporting one
+    timeline per request. Each export goes through export_timeline_checked,
+    so path guards, format aliases and dry_run behave the same.
+    """
+    ids = p.get("timeline_ids") or []
+    names = p.get("timeline_names") or []
+    if not isinstance(ids, list) or not isinstance(names, list) or not (ids or names):
+        return _err("export_timelines_checked requires timeline_ids and/or timeline_names (non-empty lists)")
+    selectors = [("id", v) for v in ids] + [("name", v) for v in names]
+    output_dir = p.get("output_dir")
+    if not output_dir:
+        # A dry run only reports where the exports would go; the folder itself
+        # is created (with its random suffix) by a real export.
+        if p.get("dry_run"):
+            output_dir = os.path.join(tempfile.gettempdir(), "mcp_timeline_exports_XXXXXXXX")
+        else:
+            output_dir = tempfile.mkdtemp(prefix="mcp_timeline_exports_")
+    if p.get("require_temp_path", True) and not _render_temp_path_ok(output_dir):
+        return _err("output_dir must be under the system temp directory unless require_temp_path=False")
+    extension = _timeline_export_spec(p)["extension"]
+
+    def _work():
+        results = []
+        used = set()
+        for kind, value in selectors:
+            tl = (_find_timeline_by_id if kind == "id" else _find_timeline_by_name)(proj, value)[0]
+            if tl is None:
+                results.append({kind: value, "success": False, "error": f"No timeline matching {value!r}"})
+                continue
+            stem = re.sub(r"[^A-Za-z0-9._-]+", "_", str(tl.GetName())) or "timeline"
+            base, n = stem, 2
+            while stem in used:
+                stem, n = f"{base}_{n}", n + 1
+            used.add(stem)
+            # background is a top-level option; each export runs synchronously.
+            out = _export_timeline_checked(tl, {
+                **p, "path": os.path.join(output_dir, stem + extension),
+                "background": False, "async_job": False,
+            })
+            results.append({kind: value, "name": tl.GetName(), **out})
+        exported = sum(1 for row in results if row.get("success"))
+        return {"success": exported == len(results), "output_dir": output_dir,
+                "exported": exported, "count": len(results), "results": results}
+
+    return _run_maybe_background("timeline.export_timelines_checked", p, _work)
+
+
 def _timeline_media_coverage(tl) -> Dict[str, Any]:
     """Count how many timeline items are linked to a Media Pool Item vs. offline.
 
@@ -6482,12 +6673,8 @@ def _timeline_by_selector(proj, p: Dict[str, Any], *, prefix: str):
     timeline_id = p.get(f"{prefix}_timeline_id") or p.get(f"{prefix}_id")
     timeline_index = p.get(f"{prefix}_timeline_index") or p.get(f"{prefix}_index")
     if timeline_id:
-        want = str(timeline_id)
-        for index in range(1, int(proj.GetTimelineCount() or 0) + 1):
-            tl = proj.GetTimelineByIndex(index)
-            if tl and str(tl.GetUniqueId()) == want:
-                return tl, None
-        return None, _err(f"{prefix} timeline not found: {timeline_id}")
+        tl, _ = _find_timeline_by_id(proj, timeline_id)
+        return (tl, None) if tl else (None, _err(f"{prefix} timeline not found: {timeline_id}"))
     if timeline_index is not None:
         try:
             index = int(timeline_index)
@@ -6508,31 +6695,76 @@ def _timeline_identity(tl, index: Optional[int] = None) -> Dict[str, Any]:
     return payload
 
 
-def _find_timeline_by_name(proj, name: Any):
-    want = str(name or "")
-    for index in range(1, int(proj.GetTimelineCount() or 0) + 1):
+# ("GetName" | "GetUniqueId", value) -> 1-based timeline index, from the last
+# full scan. A hit is re-checked against the live timeline before it is
+# trusted, so a rename, delete or project switch costs a rescan, never a wrong
+# answer.
+_timeline_lookup_index: Dict[Tuple[str, str], int] = {}
+
+
+def _indexed_timeline(proj, getter: str, want: str):
+    index = _timeline_lookup_index.get((getter, want))
+    if index is not None:
         tl = proj.GetTimelineByIndex(index)
-        if tl and str(tl.GetName()) == want:
+        if tl and str(getattr(tl, getter)()) == want:
             return tl, index
-    return None, None
+    for key in [k for k in _timeline_lookup_index if k[0] == getter]:
+        del _timeline_lookup_index[key]
+    found = (None, None)
+    for index in range(1, int(proj.GetTimelineCount() or 0) + 1):
+        tl = proj.GetTimelineByIndex(index)
+        if not tl:
+            continue
+        value = str(getattr(tl, getter)())
+        _timeline_lookup_index.setdefault((getter, value), index)
+        if value == want and found[0] is None:
+            found = (tl, index)
+    return found
+
+
+def _find_timeline_by_name(proj, name: Any):
+    return _indexed_timeline(proj, "GetName", str(name or ""))
 
 
 def _find_timeline_by_id(proj, timeline_id: Any):
-    want = str(timeline_id or "")
+    return _indexed_timeline(proj, "GetUniqueId", str(timeline_id or ""))
+
+
+def _scan_timeline_names(proj) -> Dict[str, int]:
+    """Name -> 1-based index for every timeline, in one pass.
+
+    The pass also replaces the name entries of `_timeline_lookup_index`, so a
+    `_find_timeline_by_name` right after it is answered without another scan.
+    """
+    names: Dict[str, int] = {}
     for index in range(1, int(proj.GetTimelineCount() or 0) + 1):
         tl = proj.GetTimelineByIndex(index)
-        if tl and str(tl.GetUniqueId()) == want:
-            return tl, index
-    return None, None
+        if tl:
+            names.setdefault(str(tl.GetName()), index)
+    for key in [k for k in _timeline_lookup_index if k[0] == "GetName"]:
+        del _timeline_lookup_index[key]
+    _timeline_lookup_index.update((("GetName", name), index) for name, index in names.items())
+    return names
+
+
+def _remember_new_timeline(proj, tl) -> Tuple[str, str]:
+    """Index a just-created timeline; return its (name, id).
+
+    New timelines are appended, so the current count is its index. That saves
+    the full rescan a follow-up `_find_timeline_by_name` of a name the index
+    has never seen would otherwise cost; the usual hit check still applies.
+    """
+    name, timeline_id = str(tl.GetName()), str(tl.GetUniqueId())
+    index = int(proj.GetTimelineCount() or 0)
+    if index:
+        _timeline_lookup_index[("GetName", name)] = index
+        _timeline_lookup_index[("GetUniqueId", timeline_id)] = index
+    return name, timeline_id
 
 
 def _unique_timeline_name(proj, requested_name: Any) -> str:
     base = str(requested_name or "Untitled Timeline").strip() or "Untitled Timeline"
-    existing_names = set()
-    for index in range(1, int(proj.GetTimelineCount() or 0) + 1):
-        tl = proj.GetTimelineByIndex(index)
-        if tl:
-            existing_names.add(str(tl.GetName()))
+    existing_names = _scan_timeline_names(proj)
     if base not in existing_names:
         return base
     suffix = 2
@@ -6587,6 +6819,23 @@ def _resolve_timeline_create_policy(proj, p: Dict[str, Any]) -> Tuple[Optional[s
     return _unique_timeline_name(proj, requested_name), existing, None
 
 
+def _created_timeline_result(tl, p: Dict[str, Any], existing) -> Dict[str, Any]:
+    """Success envelope for a timeline made under _resolve_timeline_create_policy.
+
+    The requested name is normalized the same way the policy normalized it, so
+    callers passing a number or padded string see what was actually looked up.
+    A create that found an existing timeline only proceeds under "version",
+    which always picks a new name.
+    """
+    return _ok(
+        **_collect_timeline_info(tl, bool(p.get("verbose"))),
+        id=tl.GetUniqueId(),
+        requested_name=str(p.get("name") or "").strip(),
+        created_new=True,
+        versioned_name=bool(existing),
+    )
+
+
 def _compare_timeline_snapshots(left: Dict[str, Any], right: Dict[str, Any]):
     differences = []
     left_tracks = left.get("tracks", {})
@@ -9134,9 +9383,7 @@ def _normalize_marker_colors(value: Any) -> Dict[str, str]:
 def _media_analysis_effective_preferences() -> Dict[str, Any]:
     preferences = _read_media_analysis_preferences()
     effective = dict(_MEDIA_ANALYSIS_DEFAULT_PREFS)
-    for key, value in preferences.items():
-        if key in effective:
-            effective[key] = value
+    effective.update((key, value) for key, value in preferences.items() if key in effective)
 
     timed_default = _normalize_timed_marker_choice(effective.get("timed_markers_default"))
     effective["timed_markers_default"] = timed_default if timed_default in {"yes", "no"} else None
@@ -9828,9 +10075,7 @@ def _media_analysis_marker_candidates_from_report(
         options.get("custom_data_mode", options.get("customDataMode")),
         ["namespaced", "minimal"],
     ) or "namespaced"
-    default_color, color_err = _normalize_marker_color(options.get("marker_color", options.get("markerColor", "Blue")))
-    if color_err:
-        default_color = "Blue"
+    default_color = _normalize_marker_color(options.get("marker_color", options.get("markerColor", "Blue")))[0] or "Blue"
     markers: List[Dict[str, Any]] = []
     skipped: List[Dict[str, Any]] = []
 
@@ -10016,6 +10261,10 @@ def _apply_media_analysis_clip_markers(clip, markers: List[Dict[str, Any]], p: D
 
 _MCP_METADATA_BLOCK_START = "[DaVinci Resolve MCP Analysis]"
 _MCP_METADATA_BLOCK_END = "[/DaVinci Resolve MCP Analysis]"
+_MCP_METADATA_BLOCK_RE = re.compile(
+    re.escape(_MCP_METADATA_BLOCK_START) + r".*?" + re.escape(_MCP_METADATA_BLOCK_END),
+    re.DOTALL,
+)
 _MCP_METADATA_PROVENANCE_PREFIX = "davinci_resolve_mcp."
 _MEDIA_ANALYSIS_DEFAULT_PUBLISH_FIELDS = ["Description", "Comments", "Keywords", "People"]
 _MEDIA_ANALYSIS_LIST_FIELDS = {"Keywords", "Keyword", "People"}
@@ -10227,13 +10476,11 @@ def _media_analysis_replace_owned_block(existing: Any, body: Any) -> str:
     existing_text = _media_analysis_metadata_text(existing)
     body_text = _media_analysis_metadata_text(body)
     block = f"{_MCP_METADATA_BLOCK_START}\n{body_text}\n{_MCP_METADATA_BLOCK_END}"
-    pattern = (
-        re.escape(_MCP_METADATA_BLOCK_START)
-        + r".*?"
-        + re.escape(_MCP_METADATA_BLOCK_END)
-    )
-    if re.search(pattern, existing_text, flags=re.DOTALL):
-        return re.sub(pattern, block, existing_text, flags=re.DOTALL).strip()
+    # One pass: subn both replaces and reports whether a block was there. The
+    # callable keeps backslashes in the body from being read as group escapes.
+    replaced, count = _MCP_METADATA_BLOCK_RE.subn(lambda _match: block, existing_text)
+    if count:
+        return replaced.strip()
     return f"{existing_text}\n\n{block}".strip() if existing_text else block
 
 
@@ -13740,7 +13987,7 @@ def resolve_control(action: str, params: Optional[Dict[str, Any]] = None) -> Dic
         if payload.get("running"):
             try:
                 r = _try_connect() and resolve
-                database = r.GetProjectManager().GetCurrentDatabase() if r else None
+                database = _project_manager_of(r).GetCurrentDatabase() if r else None
             except Exception:
                 database = None
             payload["database"] = database
@@ -14457,10 +14704,8 @@ def _open_control_panel(p: Dict[str, Any]) -> Dict[str, Any]:
                 os.kill(victim, 15)  # SIGTERM
             except (ProcessLookupError, PermissionError, OSError):
                 pass
-        for _ in range(20):
-            if _port_owner_pid(host, port) is None:
-                break
-            _t.sleep(0.1)
+        # Each check shells out to lsof, so back off rather than probe every 100ms.
+        _poll_until(lambda: _port_owner_pid(host, port) is None, timeout=2.0, initial=0.05)
         try:
             os.remove(_control_panel_pidfile())
         except OSError:
@@ -14612,7 +14857,7 @@ def _resolve_save_state() -> Dict[str, Any]:
     r = get_resolve()
     if r is None:
         return _err("Not connected to DaVinci Resolve.")
-    pm = r.GetProjectManager()
+    pm = _project_manager_of(r)
     proj = pm.GetCurrentProject() if pm else None
     state: Dict[str, Any] = {
         "saved_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
@@ -14670,23 +14915,25 @@ def _resolve_restore_state(p: Dict[str, Any]) -> Dict[str, Any]:
         except Exception as exc:
             restored["page_error"] = str(exc)
 
-    pm = r.GetProjectManager()
+    pm = _project_manager_of(r)
     proj = pm.GetCurrentProject() if pm else None
     if proj is not None and state.get("current_timeline_id"):
         try:
-            count = proj.GetTimelineCount() or 0
-            for i in range(1, count + 1):
-                tl = proj.GetTimelineByIndex(i)
-                if tl and tl.GetUniqueId() == state["current_timeline_id"]:
+            # Usually the timeline never changed. Checking that first skips both
+            # the scan and the switch, and a switch repaints Resolve's UI.
+            tl = proj.GetCurrentTimeline()
+            if not (tl and str(tl.GetUniqueId()) == str(state["current_timeline_id"])):
+                tl, _ = _find_timeline_by_id(proj, state["current_timeline_id"])
+                if tl:
                     proj.SetCurrentTimeline(tl)
-                    restored["current_timeline_id"] = state["current_timeline_id"]
-                    if state.get("current_timecode"):
-                        try:
-                            tl.SetCurrentTimecode(state["current_timecode"])
-                            restored["current_timecode"] = state["current_timecode"]
-                        except Exception:
-                            pass
-                    break
+            if tl:
+                restored["current_timeline_id"] = state["current_timeline_id"]
+                if state.get("current_timecode"):
+                    try:
+                        tl.SetCurrentTimecode(state["current_timecode"])
+                        restored["current_timecode"] = state["current_timecode"]
+                    except Exception:
+                        pass
         except Exception as exc:
             restored["timeline_error"] = str(exc)
 
@@ -14725,11 +14972,7 @@ def _close_control_panel() -> Dict[str, Any]:
     except (ProcessLookupError, PermissionError, OSError) as exc:
         return _err(f"Failed to terminate control panel (pid {pid}): {exc}")
     # Best-effort: give it a moment to die, then remove pidfile
-    import time as _t
-    for _ in range(10):
-        if not _control_panel_pid_alive(pid):
-            break
-        _t.sleep(0.1)
+    _poll_until(lambda: not _control_panel_pid_alive(pid), timeout=1.0, initial=0.05)
     try:
         os.remove(_control_panel_pidfile())
     except OSError:
@@ -14815,6 +15058,7 @@ def render_presets(action: str, params: Optional[Dict[str, Any]] = None) -> Dict
         return _not_connected_error()
 
     if action == "import_render":
+        invalidate_render_catalogue(kind="presets")
         return {"success": bool(r.ImportRenderPreset(p["path"]))}
     elif action == "export_render":
         return {"success": bool(r.ExportRenderPreset(p["name"], p["path"]))}
@@ -15427,6 +15671,35 @@ def _find_project_timeline(project, name: str):
     return None
 
 
+_SETTING_MISSING = object()
+
+
+def _read_settings(obj, keys) -> Dict[str, Any]:
+    """The non-None values of `keys` on a Project or Timeline.
+
+    One `GetSetting("")` answers every key it holds; only keys it lacks (or a
+    non-dict answer) fall back to a per-key read, and only those pay for an
+    exception guard.
+    """
+    try:
+        bulk = obj.GetSetting("")
+    except Exception:
+        bulk = None
+    if not isinstance(bulk, dict):
+        bulk = {}
+    out: Dict[str, Any] = {}
+    for k in keys:
+        v = bulk.get(k, _SETTING_MISSING)
+        if v is _SETTING_MISSING:
+            try:
+                v = obj.GetSetting(k)
+            except Exception:
+                v = None
+        if v is not None:
+            out[k] = v
+    return out
+
+
 class _SpecLiveExecutor:
     """Live executor for project_spec.apply_spec — adapts a Resolve project to
     the duck-typed executor contract. Spec-aware so live_state() only reads the
@@ -15472,13 +15745,7 @@ class _SpecLiveExecutor:
         projects = list(self._pm.GetProjectListInCurrentFolder() or [])
         settings: Dict[str, Any] = {}
         if proj:
-            for k in _project_spec.effective_settings(self._spec):
-                try:
-                    v = proj.GetSetting(k)
-                except Exception:
-                    v = None
-                if v is not None:
-                    settings[k] = v
+            settings = _read_settings(proj, _project_spec.effective_settings(self._spec))
         spec_names = {t.name for t in self._spec.timelines}
         timelines: List[Dict[str, Any]] = []
         if proj:
@@ -15493,14 +15760,7 @@ class _SpecLiveExecutor:
                     continue
                 tspec = next((t for t in self._spec.timelines if t.name == name), None)
                 keys = set((tspec.settings if tspec else {})) | {"timelineFrameRate"}
-                tl_settings: Dict[str, Any] = {}
-                for k in keys:
-                    try:
-                        v = tl.GetSetting(k)
-                    except Exception:
-                        v = None
-                    if v is not None:
-                        tl_settings[k] = v
+                tl_settings = _read_settings(tl, keys)
                 markers: List[Dict[str, Any]] = []
                 try:
                     for frame, m in (tl.GetMarkers() or {}).items():
@@ -15794,7 +16054,7 @@ def project_manager(action: str, params: Optional[Dict[str, Any]] = None) -> Dic
     r = get_resolve()
     if r is None:
         return _not_connected_error()
-    pm = r.GetProjectManager()
+    pm = _project_manager_of(r)
 
     if action == "lint":
         return _project_lint_live(r, pm)
@@ -15919,7 +16179,7 @@ def project_manager_folders(action: str, params: Optional[Dict[str, Any]] = None
     r = get_resolve()
     if r is None:
         return _not_connected_error()
-    pm = r.GetProjectManager()
+    pm = _project_manager_of(r)
 
     if action == "list":
         folders = pm.GetFolderListInCurrentFolder() or []
@@ -15961,7 +16221,7 @@ def project_manager_cloud(action: str, params: Optional[Dict[str, Any]] = None)
     r = get_resolve()
     if r is None:
         return _not_connected_error()
-    pm = r.GetProjectManager()
+    pm = _project_manager_of(r)
 
     # cloudSettings is enum-keyed (CLOUD_SETTING_*/CLOUD_SYNC_*); resolve string
     # keys against the live handle so human-readable settings aren't silently
@@ -15999,7 +16259,7 @@ def project_manager_database(action: str, params: Optional[Dict[str, Any]] = Non
     r = get_resolve()
     if r is None:
         return _not_connected_error()
-    pm = r.GetProjectManager()
+    pm = _project_manager_of(r)
 
     if action == "get_current":
         db = pm.GetCurrentDatabase()
@@ -16017,6 +16277,29 @@ def project_manager_database(action: str, params: Optional[Dict[str, Any]] = Non
 # TOOL 8: project_settings
 # ═══════════════════════════════════════════════════════════════════════════════
 
+def _index_setting_limitations() -> Dict[Tuple[str, str], Dict[str, Any]]:
+    """(object, settings key) -> api_truth entry, for every `*.SetSetting` entry.
+
+    The ledger is static, so this is built once at import rather than by a
+    substring scan of every entry on each refused write.
+    """
+    index: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    for entry in API_TRUTH:
+        symbol = entry.get("symbol", "")
+        m = re.match(r"(\w+)\.SetSetting\b", symbol)
+        if not m:
+            continue
+        # The quoted form is what makes this an exact key match: indexing bare
+        # words would hand the timelinePlaybackFrameRate entry to anything that
+        # is a substring of it, "timeline" included.
+        for key in re.findall(r"'([^']+)'", symbol):
+            index.setdefault((m.group(1), key), entry)
+    return index
+
+
+_SETTING_LIMITATIONS = _index_setting_limitations()
+
+
 def _setting_limitation(name: Any, obj: str = "Project") -> Optional[Dict[str, Any]]:
     """The api_truth entry for a settings key on `obj`, when one exists.
 
@@ -16036,16 +16319,51 @@ def _setting_limitation(name: Any, obj: str = "Project") -> Optional[Dict[str, A
     """
     if not isinstance(name, str) or not name:
         return None
-    prefix = f"{obj}.SetSetting"
-    quoted = f"'{name}'"
-    for entry in lookup_api_truth(name):
-        symbol = entry.get("symbol", "")
-        # The quoted form is what makes this an exact key match: `name in
-        # symbol` would hand the timelinePlaybackFrameRate entry to anything
-        # that is a substring of it, "timeline" included.
-        if symbol.startswith(prefix) and quoted in symbol:
-            return entry
-    return None
+    return _SETTING_LIMITATIONS.get((obj, name))
+
+
+def _setting_refusal(name: Any, obj: str = "Project") -> Dict[str, Any]:
+    """The answer for a refused `SetSetting`, with the api_truth entry when known."""
+    known = _setting_limitation(name, obj=obj)
+    if not known:
+        return {"success": False}
+    return {
+        "success": False,
+        "known_limitation": {
+            "symbol": known.get("symbol"),
+            "reality": known.get("reality"),
+            "recommended": known.get("recommended"),
+            "ledger_verified_on": _API_TRUTH_VERIFIED_ON,
+        },
+    }
+
+
+def _set_settings_bulk(target: Any, settings: Any, obj: str = "Project") -> Dict[str, Any]:
+    """Apply several `SetSetting` writes to one Project or Timeline handle.
+
+    One `GetSetting("")` up front lets keys that already hold the requested value
+    skip their write. Resolve reports every setting as a string, so that is the
+    form compared; a formatting mismatch only costs the write it would have saved.
+    """
+    if not isinstance(settings, dict) or not settings:
+        return _err("set_settings requires settings as a non-empty {name: value} object")
+    current = target.GetSetting("")
+    if not isinstance(current, dict):
+        current = {}
+    updated: List[str] = []
+    unchanged: List[str] = []
+    failed: Dict[str, Any] = {}
+    for name, value in settings.items():
+        if name in current and str(current[name]) == str(value):
+            unchanged.append(name)
+        elif bool(target.SetSetting(name, value)):
+            updated.append(name)
+        else:
+            refusal = _setting_refusal(name, obj=obj)
+            failed[name] = {"error": f"SetSetting refused {name}={value!r}"}
+            if refusal.get("known_limitation"):
+                failed[name]["known_limitation"] = refusal["known_limitation"]
+    return {"success": not failed, "updated": updated, "unchanged": unchanged, "failed": failed}
 
 
 @mcp.tool()
@@ -16060,6 +16378,9 @@ def project_settings(action: str, params: Optional[Dict[str, Any]] = None) -> Di
       set_setting(name, value) -> {success, known_limitation?}
         A refusal carries the api_truth entry for that key when one exists —
         several settings cannot be written from the API at all.
+      set_settings(settings) -> {success, updated, unchanged, failed}
+        settings is {name: value}. One read up front; keys already at the value are not rewritten.
+        failed is {name: {error, known_limitation?}}.
       get_unique_id() -> {id}
       get_presets() -> {presets}
       set_preset(name) -> {success}
@@ -16097,18 +16418,9 @@ def project_settings(action: str, params: Optional[Dict[str, Any]] = None) -> Di
             return _err("set_setting requires value")
         if bool(proj.SetSetting(p["name"], p["value"])):
             return {"success": True}
-        known = _setting_limitation(p["name"])
-        if not known:
-            return {"success": False}
-        return {
-            "success": False,
-            "known_limitation": {
-                "symbol": known.get("symbol"),
-                "reality": known.get("reality"),
-                "recommended": known.get("recommended"),
-                "ledger_verified_on": _API_TRUTH_VERIFIED_ON,
-            },
-        }
+        return _setting_refusal(p["name"])
+    elif action == "set_settings":
+        return _set_settings_bulk(proj, p.get("settings"))
     elif action == "get_unique_id":
         return {"id": proj.GetUniqueId()}
     elif action == "get_presets":
@@ -16209,7 +16521,7 @@ def project_settings(action: str, params: Optional[Dict[str, Any]] = None) -> Di
             result = _ai_result_payload(proj.ResetIntellisearchAnalysis())
             _rec.success = result["success"]
         return result
-    return _unknown(action, ["get_name","set_name","get_setting","set_setting","get_unique_id","get_presets","set_preset","refresh_luts","get_gallery","export_frame_as_still","project_summary","load_burnin_preset","insert_audio","get_color_groups","add_color_group","delete_color_group","apply_fairlight_preset","generate_speech","reset_intellisearch_analysis"])
+    return _unknown(action, ["get_name","set_name","get_setting","set_setting","set_settings","get_unique_id","get_presets","set_preset","refresh_luts","get_gallery","export_frame_as_still","project_summary","load_burnin_preset","insert_audio","get_color_groups","add_color_group","delete_color_group","apply_fairlight_preset","generate_speech","reset_intellisearch_analysis"])
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -16283,6 +16595,7 @@ _RENDER_KERNEL_ACTIONS = [
     "validate_render_settings",
     "safe_set_render_settings",
     "prepare_render_job",
+    "prepare_render_jobs",
     "render_job_lifecycle_probe",
     "quick_export_capabilities",
     "safe_quick_export",
@@ -16310,8 +16623,7 @@ def _render_temp_path_ok(path: str) -> bool:
 
 
 def _render_formats(proj):
-    formats = proj.GetRenderFormats() or {}
-    return _ser(formats)
+    return _ser(cached_render_formats(proj))
 
 
 def _render_format_id(proj, fmt: str, formats: Optional[Dict[str, Any]] = None) -> str:
@@ -16337,7 +16649,7 @@ def _render_format_requested(requested: Optional[List[Any]], label: str, extensi
 def _render_codec_id(proj, fmt: str, codec: str, formats: Optional[Dict[str, Any]] = None) -> str:
     """Resolve a codec display name to its id for `fmt` (itself label-or-id tolerant)."""
     try:
-        codecs = proj.GetRenderCodecs(_render_format_id(proj, fmt, formats)) or {}
+        codecs = cached_render_codecs(proj, _render_format_id(proj, fmt, formats))
     except Exception:
         return codec
     return _render_codec_id_from_codecs(codecs, codec)
@@ -16345,14 +16657,42 @@ def _render_codec_id(proj, fmt: str, codec: str, formats: Optional[Dict[str, Any
 
 def _render_codecs(proj, fmt: str, formats: Optional[Dict[str, Any]] = None):
     try:
-        return _ser(proj.GetRenderCodecs(_render_format_id(proj, fmt, formats)) or {})
+        return _ser(cached_render_codecs(proj, _render_format_id(proj, fmt, formats)))
     except Exception as exc:
         return {"error": str(exc)}
 
 
+def _render_all_codecs(proj, p: Dict[str, Any]):
+    """Codecs for every format (or just `formats`) in one call, keyed by format id.
+
+    Serial on purpose: the scripting bridge answers one call at a time, so a
+    thread pool would only queue the same reads behind `_bridge_lock`. Each
+    format's list goes through the render catalogue, so a repeat within the
+    TTL skips the codec reads and pays only the catalogue's project-id read.
+    """
+    formats = _render_formats(proj)
+    if not isinstance(formats, dict):
+        return _err("GetRenderFormats did not return a format dictionary")
+    requested = p.get("formats")
+    if requested is not None and not isinstance(requested, list):
+        return _err("formats must be a list when provided")
+    codecs: Dict[str, Any] = {}
+    errors = []
+    for fmt, extension in formats.items():
+        format_id = _render_format_id_from_formats(formats, fmt)
+        if not _render_format_requested(requested, fmt, extension, format_id, formats):
+            continue
+        found = _render_codecs(proj, format_id, formats)
+        if isinstance(found, dict) and found.get("error"):
+            errors.append({"format": fmt, "error": found["error"]})
+            continue
+        codecs[format_id] = found
+    return {"codecs": codecs, "errors": errors}
+
+
 def _render_capabilities(proj):
     formats = _render_formats(proj)
-    presets = _ser(proj.GetRenderPresetList() or [])
+    presets = _ser(cached_render_presets(proj))
     quick_presets = []
     if _has_method(proj, "GetQuickExportRenderPresets"):
         try:
@@ -16465,10 +16805,16 @@ def _render_preset_pin(proj, preset_name: str):
     the name is checked first and a miss names the available presets.
     """
     try:
-        available = [str(x) for x in (proj.GetRenderPresetList() or [])]
+        available = cached_render_preset_names(proj)
+        if available and preset_name not in available:
+            # A miss may be a preset made in the UI since the list was read;
+            # only a fresh list may refuse the name.
+            invalidate_render_catalogue(proj, "presets")
+            available = cached_render_preset_names(proj)
     except Exception:
-        available = []
+        available = frozenset()
     if available and preset_name not in available:
+        available = [str(x) for x in cached_render_presets(proj)]
         return None, _err(
             f"Render preset not found: {preset_name}",
             code="RENDER_PRESET_NOT_FOUND",
@@ -16593,7 +16939,29 @@ def _safe_set_render_settings(proj, p: Dict[str, Any]):
     return result
 
 
-def _prepare_render_job(proj, p: Dict[str, Any]):
+@dataclass(slots=True)
+class _PresetCarry:
+    """Render state one prepare_render_jobs call threads from job to job."""
+
+    preset: Optional[str] = None
+    pin: Optional[Dict[str, Any]] = None
+    applied: Set[str] = field(default_factory=set)
+    format_set: bool = False
+
+    def reset(self, preset: Optional[str] = None, pin: Optional[Dict[str, Any]] = None) -> None:
+        self.preset, self.pin, self.applied, self.format_set = preset, pin, set(), False
+
+
+def _prepare_render_job(proj, p: Dict[str, Any], *, snapshot_before: bool = True,
+                        carry: Optional[_PresetCarry] = None):
+    """Validate, pin, apply and queue one render job.
+
+    `carry` is render state shared across the jobs of one prepare_render_jobs
+    call: the preset last pinned and every key (and format/codec) applied on top
+    of it since. A job reuses that pin instead of reloading the preset only when
+    it overwrites everything applied since, so it can inherit nothing from the
+    job before it.
+    """
     target_dir = p.get("target_dir") or (p.get("settings") or {}).get("TargetDir")
     if not target_dir:
         return _err("target_dir or settings.TargetDir is required")
@@ -16612,19 +16980,30 @@ def _prepare_render_job(proj, p: Dict[str, Any]):
         return {"success": False, "validation": validation}
     if p.get("dry_run"):
         return _ok(validation=validation, format=p.get("format"), codec=p.get("codec"))
-    before = _render_settings_snapshot(proj)
+    before = _render_settings_snapshot(proj) if snapshot_before else None
     # Pin the base render state before layering explicit settings on top. Without
     # this the job inherits the Deliver page's loaded preset for every key the
     # caller does not pass — an Audio Only preset plus ExportVideo:True has been
     # measured to queue a job that reads back IsExportVideo:True and renders an
     # mp4 with no video stream (issue #123).
     preset_pin = None
+    sets_format = bool(p.get("format") and p.get("codec"))
     if p.get("from_preset"):
-        preset_pin, err = _render_preset_pin(proj, str(p["from_preset"]))
-        if err:
-            return err
+        preset_name = str(p["from_preset"])
+        if (carry is not None and carry.preset == preset_name
+                and carry.applied <= set(settings)
+                and (sets_format or not carry.format_set)):
+            preset_pin = dict(carry.pin, reused=True)
+        else:
+            preset_pin, err = _render_preset_pin(proj, preset_name)
+            if err:
+                if carry is not None:
+                    carry.reset()
+                return err
+            if carry is not None:
+                carry.reset(preset_name, preset_pin)
     format_success = None
-    if p.get("format") and p.get("codec"):
+    if sets_format:
         formats = _render_formats(proj)
         format_id = _render_format_id_from_formats(formats, p["format"])
         codec_id = _render_codec_id(proj, format_id, p["codec"], formats)
@@ -16652,16 +17031,21 @@ def _prepare_render_job(proj, p: Dict[str, Any]):
                     "available_codecs": _render_codecs(proj, format_id, formats),
                 },
             )
+    if carry is not None and sets_format:
+        carry.format_set = True
     settings_success = bool(proj.SetRenderSettings(settings))
+    if carry is not None:
+        carry.applied |= set(settings)
     job_id = proj.AddRenderJob() if settings_success else None
     result = {
         "success": bool(job_id),
         "job_id": job_id,
         "format_success": format_success,
         "settings_success": settings_success,
-        "before": before,
         "settings": settings,
     }
+    if snapshot_before:
+        result["before"] = before
     if preset_pin:
         result["preset_pinned"] = preset_pin
     elif settings.get("ExportVideo") is True:
@@ -16688,6 +17072,180 @@ def _prepare_render_job(proj, p: Dict[str, Any]):
     return result
 
 
+def _prepare_render_jobs(proj, p: Dict[str, Any]):
+    """Queue several render jobs in order, sharing what one call can share.
+
+    Top-level params (target_dir, from_preset, format, codec, settings, ...) are
+    defaults each job may override. The render state is snapshotted once for the
+    batch rather than per job, and a preset is reloaded only when a job could
+    otherwise inherit keys from the job queued before it. Jobs stay in the order
+    given: that is the order Resolve renders them in.
+    """
+    jobs = p.get("jobs")
+    if not isinstance(jobs, list) or not jobs or not all(isinstance(j, dict) for j in jobs):
+        return _err("prepare_render_jobs requires jobs as a non-empty list of objects")
+    shared = {k: v for k, v in p.items() if k not in ("jobs", "continue_on_error")}
+    continue_on_error = bool(p.get("continue_on_error", False))
+    dry_run = bool(p.get("dry_run"))
+    before = None if dry_run else _render_settings_snapshot(proj)
+    carry = _PresetCarry()
+    results: List[Dict[str, Any]] = []
+    failed: List[int] = []
+    for index, job in enumerate(jobs):
+        job_p = {**shared, **job}
+        if "settings" in shared and "settings" in job:
+            job_p["settings"] = {**(shared["settings"] or {}), **(job["settings"] or {})}
+        out = _prepare_render_job(proj, job_p, snapshot_before=False, carry=carry)
+        results.append(out)
+        if out.get("error") or not out.get("success"):
+            failed.append(index)
+            if not continue_on_error:
+                break
+    out = {
+        "success": not failed and len(results) == len(jobs),
+        "job_ids": [r.get("job_id") for r in results if r.get("job_id")],
+        "results": results,
+        "failed": failed,
+        "not_attempted": len(jobs) - len(results),
+    }
+    if before is not None:
+        out["before"] = before
+    return out
+
+
+def _is_job_id_list(job_ids: Any) -> bool:
+    """True for a list of non-empty job id strings, the form every job_ids param takes."""
+    return isinstance(job_ids, list) and all(isinstance(j, str) and j for j in job_ids)
+
+
+#: JobStatus values after which a render job no longer changes.
+_RENDER_TERMINAL_STATUSES = frozenset({"Complete", "Failed", "Cancelled"})
+#: Ceiling on one wait_for_jobs call. The wait holds the Resolve bridge, so no
+#: other tool runs meanwhile (render stop included); a caller wanting longer
+#: calls again rather than locking the server for the whole render.
+_RENDER_WAIT_MAX_SECONDS = 300.0
+
+
+def _wait_for_render_jobs(proj, p: Dict[str, Any]):
+    """Poll render jobs server-side until they finish, the queue idles, or time runs out.
+
+    One call replaces a client loop of get_job_status calls. The poll interval
+    starts at initial_interval and grows by half each round up to max_interval,
+    so a long render is checked rarely and a short one is noticed quickly.
+    """
+    job_ids = p.get("job_ids")
+    if job_ids is None:
+        job_ids = [j.get("JobId") for j in (proj.GetRenderJobList() or []) if isinstance(j, dict)]
+    if not _is_job_id_list(job_ids):
+        return _err("wait_for_jobs job_ids must be a list of job id strings")
+    try:
+        timeout = min(max(0.0, float(p.get("timeout", 30.0))), _RENDER_WAIT_MAX_SECONDS)
+        interval = max(0.05, float(p.get("initial_interval", 0.5)))
+        max_interval = max(interval, float(p.get("max_interval", 5.0)))
+    except (TypeError, ValueError):
+        return _err("wait_for_jobs timeout, initial_interval and max_interval must be numbers")
+    deadline = time.monotonic() + timeout
+    pending = list(dict.fromkeys(job_ids))
+    completed: Dict[str, Any] = {}
+    idle = False
+    while True:
+        still: List[str] = []
+        for job_id in pending:
+            status = _ser(proj.GetRenderJobStatus(job_id)) or {}
+            if isinstance(status, dict) and status.get("JobStatus") in _RENDER_TERMINAL_STATUSES:
+                completed[job_id] = status
+            else:
+                still.append(job_id)
+        pending = still
+        if not pending:
+            break
+        # Queued jobs do not advance while nothing renders; waiting longer
+        # would only burn the timeout.
+        if not proj.IsRenderingInProgress():
+            idle = True
+            break
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        time.sleep(min(interval, remaining))
+        interval = min(max_interval, interval * 1.5)
+    return {
+        "success": not pending,
+        "completed": completed,
+        "pending": pending,
+        "idle": idle,
+        "timed_out": bool(pending) and not idle,
+    }
+
+
+#: GetRenderJobStatus fields; a GetRenderJobList row carrying JobStatus already
+#: answers for that job without another bridge call.
+_RENDER_STATUS_FIELDS = ("JobStatus", "CompletionPercentage", "TimeTakenToRenderInMs", "EstimatedTimeRemainingInMs", "Error")
+
+
+def _render_job_statuses(proj, p: Dict[str, Any]):
+    """Statuses for several render jobs from one queue read.
+
+    job_ids defaults to every queued job. Rows from GetRenderJobList that
+    already embed JobStatus are used as-is; only jobs whose row lacks it (or
+    that are not in the list) cost a GetRenderJobStatus call each.
+    """
+    job_ids = p.get("job_ids")
+    if job_ids is not None and not _is_job_id_list(job_ids):
+        return _err("get_job_statuses job_ids must be a list of job id strings")
+    rows = {
+        row.get("JobId"): row
+        for row in (_ser(proj.GetRenderJobList()) or [])
+        if isinstance(row, dict) and row.get("JobId")
+    }
+    statuses: Dict[str, Any] = {}
+    for job_id in dict.fromkeys(job_ids if job_ids is not None else rows):
+        row = rows.get(job_id) or {}
+        if "JobStatus" in row:
+            statuses[job_id] = {k: row[k] for k in _RENDER_STATUS_FIELDS if k in row}
+            continue
+        status = _ser(proj.GetRenderJobStatus(job_id))
+        statuses[job_id] = status if status else {"error": f"No render job with ID {job_id}"}
+    return {"statuses": statuses}
+
+
+# project unique id (name as fallback) -> {job_id: (JobStatus,
+# CompletionPercentage)} as of the last job_changes call, so each poll returns
+# only what moved since. Not keyed on the project object: GetCurrentProject()
+# hands back a new wrapper on every tool call.
+_render_job_watch: Dict[str, Dict[str, Tuple[Any, Any]]] = {}
+
+
+def _render_job_changes(proj, p: Dict[str, Any]):
+    """Render jobs whose status or progress moved since the previous call.
+
+    The first call (or reset=True) reports every job as changed. An idle queue
+    then answers with empty changed/removed rather than the whole job list.
+    """
+    statuses = _render_job_statuses(proj, {})
+    if statuses.get("error"):
+        return statuses
+    name, project_id = _project_name_and_id(proj)
+    watch_key = f"id:{project_id}" if project_id else (f"name:{name}" if name else None)
+    previous = _render_job_watch.get(watch_key, {}) if watch_key and not p.get("reset") else {}
+    current: Dict[str, Tuple[Any, Any]] = {}
+    changed: Dict[str, Any] = {}
+    for job_id, status in statuses["statuses"].items():
+        key = (status.get("JobStatus"), status.get("CompletionPercentage"))
+        current[job_id] = key
+        if previous.get(job_id) != key:
+            changed[job_id] = status
+    # One project renders at a time; another project's snapshot is never diffed again.
+    _render_job_watch.clear()
+    if watch_key:
+        _render_job_watch[watch_key] = current
+    return {
+        "changed": changed,
+        "removed": [job_id for job_id in previous if job_id not in current],
+        "unchanged": len(current) - len(changed),
+    }
+
+
 # ── Delivery targets ────────────────────────────────────────────────────────
 # Named render intents. One definition emits both the Resolve render settings
 # and the ffprobe-shaped QC spec, so the advanced server can verify a rendered
@@ -16979,11 +17537,25 @@ def render(action: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, An
       delete_all_jobs() -> {success}
       list_jobs() -> {jobs}
       get_job_status(job_id) -> {status}
-      start(job_ids?, interactive?) -> {success}
+      get_job_statuses(job_ids?) -> {statuses}
+        Every queued job (or just job_ids) keyed by id, from one queue read.
+      job_changes(reset?) -> {changed, removed, unchanged}
+        Only jobs whose JobStatus/CompletionPercentage moved since the last
+        job_changes call; the first call (or reset) reports them all.
+      start(job_ids?, interactive?, return_job_ids?) -> {success, job_ids?}
+        Renders the whole queue when job_ids is omitted; return_job_ids reads the
+        queue only when asked.
       stop() -> {success}
+      wait_for_jobs(job_ids?, timeout?, initial_interval?, max_interval?) -> {success, completed, pending, idle, timed_out}
+        Polls server-side with backoff until every job is Complete/Failed/Cancelled,
+        nothing is rendering, or timeout (default 30s, max 300s) passes. Holds
+        the bridge meanwhile; call again to keep waiting.
       is_rendering() -> {rendering}
       get_formats() -> {formats}
       get_codecs(format) -> {codecs}
+      get_all_codecs(formats?) -> {codecs, errors}
+        Every format's codecs keyed by format id; no per-pair resolution reads
+        (probe_render_matrix does those).
       get_format_and_codec() -> {format, codec}
       set_format_and_codec(format, codec) -> {success}
       get_mode() -> {mode}
@@ -17012,6 +17584,10 @@ def render(action: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, An
         explicit settings go on top. Without it the job inherits the Deliver
         page's loaded preset for every key not passed, which the API gives no
         way to read back — see the SetRenderSettings api_truth entry.
+      prepare_render_jobs(jobs, continue_on_error?, ...defaults) -> {success, job_ids, results, failed, not_attempted}
+        jobs is a list of prepare_render_job params; top-level params are
+        per-job defaults. One state snapshot for the batch; a shared
+        from_preset is reloaded only when the previous job's keys would leak.
       render_job_lifecycle_probe(target_dir, settings?, format?, codec?, custom_name?) -> {success, job_id, status_before_delete}
       quick_export_capabilities() -> {presets, safe_params, guards}
       safe_quick_export(preset, target_dir?|params?, custom_name?, dry_run?, allow_render?) -> {success, status}
@@ -17043,21 +17619,36 @@ def render(action: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, An
         return {"jobs": _ser(proj.GetRenderJobList())}
     elif action == "get_job_status":
         return _ser(proj.GetRenderJobStatus(p["job_id"]))
+    elif action == "get_job_statuses":
+        return _render_job_statuses(proj, p)
+    elif action == "job_changes":
+        return _render_job_changes(proj, p)
     elif action == "start":
         job_ids = p.get("job_ids")
         interactive = p.get("interactive", False)
+        if job_ids is not None and not _is_job_id_list(job_ids):
+            return _err("start job_ids must be a list of job id strings")
         if job_ids:
-            return {"success": bool(proj.StartRendering(job_ids, interactive))}
-        return {"success": bool(proj.StartRendering(interactive))}
+            job_ids = list(dict.fromkeys(job_ids))
+            result = {"success": bool(proj.StartRendering(job_ids, interactive))}
+        else:
+            result = {"success": bool(proj.StartRendering(interactive))}
+        if p.get("return_job_ids"):
+            result["job_ids"] = job_ids or [
+                j.get("JobId") for j in (proj.GetRenderJobList() or []) if isinstance(j, dict)
+            ]
+        return result
     elif action == "stop":
         proj.StopRendering()
         return _ok()
     elif action == "is_rendering":
         return {"rendering": bool(proj.IsRenderingInProgress())}
     elif action == "get_formats":
-        return {"formats": _ser(proj.GetRenderFormats())}
+        return {"formats": _render_formats(proj)}
     elif action == "get_codecs":
         return {"codecs": _render_codecs(proj, p["format"])}
+    elif action == "get_all_codecs":
+        return _render_all_codecs(proj, p)
     elif action == "get_format_and_codec":
         return _ser(proj.GetCurrentRenderFormatAndCodec())
     elif action == "list_delivery_targets":
@@ -17126,12 +17717,14 @@ def render(action: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, An
             result["warnings"] = warnings
         return result
     elif action == "list_presets":
-        return {"presets": proj.GetRenderPresetList()}
+        return {"presets": cached_render_presets(proj)}
     elif action == "load_preset":
         return {"success": bool(proj.LoadRenderPreset(p["name"]))}
     elif action == "save_preset":
+        invalidate_render_catalogue(proj, "presets")
         return {"success": bool(proj.SaveAsNewRenderPreset(p["name"]))}
     elif action == "delete_preset":
+        invalidate_render_catalogue(proj, "presets")
         return {"success": bool(proj.DeleteRenderPreset(p["name"]))}
     elif action == "quick_export_presets":
         return {"presets": proj.GetQuickExportRenderPresets()}
@@ -17159,6 +17752,10 @@ def render(action: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, An
         return _safe_set_render_settings(proj, p)
     elif action == "prepare_render_job":
         return _prepare_render_job(proj, p)
+    elif action == "prepare_render_jobs":
+        return _prepare_render_jobs(proj, p)
+    elif action == "wait_for_jobs":
+        return _wait_for_render_jobs(proj, p)
     elif action == "render_job_lifecycle_probe":
         return _render_job_lifecycle_probe(proj, p)
     elif action == "quick_export_capabilities":
@@ -17167,7 +17764,7 @@ def render(action: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, An
         return _safe_quick_export(proj, p)
     elif action == "export_render_boundary_report":
         return _export_render_boundary_report(proj, p)
-    return _unknown(action, ["add_job","delete_job","delete_all_jobs","list_jobs","get_job_status","start","stop","is_rendering","get_formats","get_codecs","get_format_and_codec","set_format_and_codec","get_mode","set_mode","get_resolutions","get_settings","set_settings","list_presets","load_preset","save_preset","delete_preset","quick_export_presets","quick_export",*_RENDER_KERNEL_ACTIONS])
+    return _unknown(action, ["add_job","delete_job","delete_all_jobs","list_jobs","get_job_status","get_job_statuses","job_changes","start","stop","wait_for_jobs","is_rendering","get_formats","get_codecs","get_all_codecs","get_format_and_codec","set_format_and_codec","get_mode","set_mode","get_resolutions","get_settings","set_settings","list_presets","load_preset","save_preset","delete_preset","quick_export_presets","quick_export",*_RENDER_KERNEL_ACTIONS])
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -17260,11 +17857,12 @@ def media_pool(action: str, params: Optional[Dict[str, Any]] = None) -> Dict[str
         DESTRUCTIVE. Deletes folders + every clip they contain.
       move_folders(folder_ids, target_path) -> {success}
       refresh() -> {success}
-      create_timeline(name, if_exists?) -> {success, name, id}
+      create_timeline(name, if_exists?, verbose?) -> {success, name, id}
         — if_exists: version (default), reuse, or fail
-      create_timeline_from_clips(name, clip_ids, if_exists?) -> {success, name, id}
+        — verbose=True adds start_frame, end_frame, video_tracks, audio_tracks
+      create_timeline_from_clips(name, clip_ids, if_exists?, verbose?) -> {success, name, id}
         — simple: params.clip_ids appends clips end-to-end into a new timeline
-      create_timeline_from_clips(name, clip_infos, if_exists?) -> {success, name, id}
+      create_timeline_from_clips(name, clip_infos, if_exists?, verbose?) -> {success, name, id}
         — positioned: params.clip_infos is a list of {clip_id or media_pool_item_id,
           start_frame & end_frame (or startFrame/endFrame), record_frame/recordFrame}.
           record_frame is relative to the created timeline start frame by default;
@@ -17393,13 +17991,7 @@ def media_pool(action: str, params: Optional[Dict[str, Any]] = None) -> Dict[str
         if policy_result:
             return policy_result
         tl = mp.CreateEmptyTimeline(create_name)
-        return _ok(
-            name=tl.GetName(),
-            id=tl.GetUniqueId(),
-            requested_name=p.get("name"),
-            created_new=True,
-            versioned_name=bool(existing and create_name != p.get("name")),
-        ) if tl else _err("Failed to create timeline")
+        return _created_timeline_result(tl, p, existing) if tl else _err("Failed to create timeline")
     elif action == "create_timeline_from_clips":
         create_name, existing, policy_result = _resolve_timeline_create_policy(proj, p)
         if policy_result:
@@ -17433,13 +18025,7 @@ def media_pool(action: str, params: Optional[Dict[str, Any]] = None) -> Dict[str
             appended = mp.AppendToTimeline(built)
             if not appended:
                 return _err("Failed to append clip_infos to created timeline")
-            return _ok(
-                name=tl.GetName(),
-                id=tl.GetUniqueId(),
-                requested_name=p.get("name"),
-                created_new=True,
-                versioned_name=bool(existing and create_name != p.get("name")),
-            )
+            return _created_timeline_result(tl, p, existing)
         clip_ids = p.get("clip_ids")
         if not clip_ids:
             return _err("Provide clip_ids (simple) or clip_infos (positioned)")
@@ -17448,13 +18034,7 @@ def media_pool(action: str, params: Optional[Dict[str, Any]] = None) -> Dict[str
         if not clips:
             return _err("No valid clips found")
         tl = mp.CreateTimelineFromClips(create_name, clips)
-        return _ok(
-            name=tl.GetName(),
-            id=tl.GetUniqueId(),
-            requested_name=p.get("name"),
-            created_new=True,
-            versioned_name=bool(existing and create_name != p.get("name")),
-        ) if tl else _err("Failed to create timeline")
+        return _created_timeline_result(tl, p, existing) if tl else _err("Failed to create timeline")
     elif action == "setup_multicam_timeline":
         return _setup_multicam_timeline(proj, mp, p)
     elif action == "import_timeline":
@@ -17481,11 +18061,17 @@ def media_pool(action: str, params: Optional[Dict[str, Any]] = None) -> Dict[str
             return _err("delete_timelines requires 'timeline_ids', a non-empty"
                         " list of timeline unique IDs" + hint)
         count = proj.GetTimelineCount()
+        wanted = set(ids)
         timelines = []
+        found_ids = []
         for i in range(1, count + 1):
             tl = proj.GetTimelineByIndex(i)
-            if tl and tl.GetUniqueId() in ids:
+            uid = tl.GetUniqueId() if tl else None
+            if uid in wanted:
                 timelines.append(tl)
+                found_ids.append(uid)
+                if len(timelines) == len(wanted):
+                    break
         if not timelines:
             return _err("No timelines found")
         if "confirm_token" not in p and "confirmToken" not in p and _confirm_token_required():
@@ -17500,12 +18086,34 @@ def media_pool(action: str, params: Optional[Dict[str, Any]] = None) -> Dict[str
         if blocked:
             return blocked
         # Read-back: DeleteTimelines' bool is unreliable; verify by the project's
-        # timeline count dropping (P2).
-        before_n = proj.GetTimelineCount()
+        # timeline count dropping (P2). The count read for the lookup above is
+        # still the before-count: nothing has been deleted since.
+        # A drop of exactly len(timelines) settles it without a scan. Any other
+        # drop (the UI deleting something at the same moment) is ambiguous, so
+        # one pass looks for survivors and stops once each is accounted for.
+        before_n = count
         raw = bool(mp.DeleteTimelines(timelines))
         after_n = proj.GetTimelineCount()
-        return {"success": raw, "verified": after_n < before_n,
-                "timelines_before": before_n, "timelines_after": after_n}
+        result = {"success": raw, "verified": after_n == before_n - len(timelines),
+                  "timelines_before": before_n, "timelines_after": after_n}
+        if not result["verified"]:
+            pending = set(found_ids)
+            survivors = []
+            if after_n < before_n:
+                for i in range(1, after_n + 1):
+                    tl = proj.GetTimelineByIndex(i)
+                    uid = tl.GetUniqueId() if tl else None
+                    if uid in pending:
+                        pending.discard(uid)
+                        survivors.append(uid)
+                        if not pending:
+                            break
+            else:
+                survivors = found_ids
+            result["verified"] = not survivors
+            if survivors:
+                result["not_deleted"] = survivors
+        return result
     elif action == "append_to_timeline":
         if p.get("clip_infos") is not None:
             raw = p["clip_infos"]
@@ -17810,7 +18418,7 @@ def folder(action: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, An
         if missing:
             return missing
         marker_color = _first_param(p, "marker_color", "markerColor", default="Blue")
-        if marker_color not in _MARKER_COLORS:
+        if marker_color not in _MARKER_COLOR_SET:
             return _err(f"Invalid marker_color {marker_color!r}. Valid colors: {', '.join(_MARKER_COLORS)}")
         with _ai_ledger_timed("analyze_for_slate") as _rec:
             result = _ai_result_payload(f.AnalyzeForSlate(marker_color))
@@ -18221,7 +18829,7 @@ def media_pool_item(action: str, params: Optional[Dict[str, Any]] = None) -> Dic
         if missing:
             return missing
         marker_color = _first_param(p, "marker_color", "markerColor", default="Blue")
-        if marker_color not in _MARKER_COLORS:
+        if marker_color not in _MARKER_COLOR_SET:
             return _err(f"Invalid marker_color {marker_color!r}. Valid colors: {', '.join(_MARKER_COLORS)}")
         with _ai_ledger_timed("analyze_for_slate", clip_id=p.get("clip_id")) as _rec:
             result = _ai_result_payload(clip.AnalyzeForSlate(marker_color))
@@ -21342,7 +21950,7 @@ _TIMELINE_ACTIONS = [
     "bulk_set_item_properties", "apply_look_to_items", "thumbnail_contact_sheet",
     "marker_thumbnail_review", "edit_kernel_capabilities", "probe_edit_kernel_item",
     "title_property_scan", "set_title_text", "bulk_set_title_text", "create_compound_clip",
-    "create_fusion_clip", "import_into_timeline", "export", "get_setting", "set_setting",
+    "create_fusion_clip", "import_into_timeline", "export", "get_setting", "set_setting", "set_settings",
     "insert_generator", "insert_fusion_generator", "insert_fusion_composition",
     "insert_ofx_generator", "insert_title", "insert_fusion_title", "get_unique_id",
     "get_node_graph", "get_media_pool_item", "get_transcript", "propose_cuts", "apply_cuts",
@@ -21374,7 +21982,7 @@ def timeline(action: str, params: Optional[Dict[str, Any]] = None) -> Dict[str,
     Actions:
       list() -> {timelines}
       get_current() -> {name, id, start_frame, end_frame, start_timecode}
-      set_current(index|id|name) -> {success}  — id/name are stable across archives; index is 1-based
+      set_current(index|id|name) -> {success, already_current?}  — id/name are stable across archives; index is 1-based
       get_name() -> {name}
       set_name(name) -> {success}
       get_start_frame() -> {frame}
@@ -21403,7 +22011,7 @@ def timeline(action: str, params: Optional[Dict[str, Any]] = None) -> Dict[str,
       delete_clips(clip_ids, ripple?) -> {success}  — clip_ids: list of unique IDs
         DESTRUCTIVE. ripple=True is CATASTROPHIC (closes the gap; cannot be selectively undone).
       set_clips_linked(clip_ids, linked) -> {success}
-      duplicate(name?) -> {success, name}
+      duplicate(name?, verbose?) -> {success, name}  — verbose adds frame range + track counts
       duplicate_clips(clip_ids?, selected?, target_track_index?, track_offset?, placement?, record_frame?, record_frame_offset?, copy_properties?, include_linked?) -> {results, count}
       — Video clips only. Re-places the same MediaPool media with the same source trim on the
         current timeline (like Alt-drag) via AppendToTimeline. clip_ids: timeline item unique IDs
@@ -21450,6 +22058,8 @@ def timeline(action: str, params: Optional[Dict[str, Any]] = None) -> Dict[str,
       get_setting(name?) -> {settings}
       set_setting(name, value) -> {success, known_limitation?}
         A refusal carries the api_truth entry for that key when one exists.
+      set_settings(settings) -> {success, updated, unchanged, failed}  — settings is {name: value}
+        failed is {name: {error, known_limitation?}}.
       insert_generator(name) -> {success}
       insert_fusion_generator(name) -> {success}
       insert_fusion_composition() -> {success}
@@ -21490,6 +22100,8 @@ def timeline(action: str, params: Optional[Dict[str, Any]] = None) -> Dict[str,
       detect_gaps_overlaps(track_types?, min_gap?) -> {gaps, overlaps}
       source_range_report(handles?, merge?) -> {ranges, occurrences}
       export_timeline_checked(path, format?|type?, subtype?, require_temp_path?, dry_run?, background?) -> {success, path, size | job_id}
+      export_timelines_checked(timeline_ids?|timeline_names?, output_dir?, format?, subtype?, require_temp_path?, dry_run?, background?) -> {success, exported, count, results | job_id}
+        — one export per timeline into output_dir (default: a new temp dir), run in order; no current-timeline switch
       import_timeline_checked(path, options?, timeline_name?, import_source_clips?, sanitize_media?, require_temp_path?, dry_run?, background?) -> {success, name, id, media, sanitize?, warning? | job_id}
         Imports an FCP7 xmeml / FCPXML / AAF timeline. AAF (.aaf) is read natively by
         Resolve — the XML sanitize pass is SKIPPED for it (media relinks via the media
@@ -21563,6 +22175,14 @@ def timeline(action: str, params: Optional[Dict[str, Any]] = None) -> Dict[str,
         selector_id = p.get("id") or p.get("timeline_id")
         selector_name = p.get("name")
         if selector_id or selector_name:
+            # Re-selecting the open timeline is common in chained calls; answer it
+            # without the lookup scan or a SetCurrentTimeline round-trip.
+            current = proj.GetCurrentTimeline()
+            if current and (
+                str(current.GetUniqueId()) == str(selector_id) if selector_id
+                else current.GetName() == selector_name
+            ):
+                return {"success": True, "already_current": True}
             tl = _find_timeline_by_id(proj, selector_id)[0] if selector_id else None
             if tl is None and selector_name:
                 tl = _find_timeline_by_name(proj, selector_name)[0]
@@ -21600,6 +22220,8 @@ def timeline(action: str, params: Optional[Dict[str, Any]] = None) -> Dict[str,
         if mp_err:
             return mp_err
         return _transcription_capabilities(mp, p)
+    elif action == "export_timelines_checked":
+        return _export_timelines_checked(proj, p)
     elif action == "compare_timelines" and isinstance(p.get("left_snapshot"), dict) and isinstance(p.get("right_snapshot"), dict):
         return _compare_timelines(proj, proj.GetCurrentTimeline(), p)
 
@@ -21724,8 +22346,23 @@ def timeline(action: str, params: Optional[Dict[str, Any]] = None) -> Dict[str,
                         found.append(it)
         return {"success": bool(tl.SetClipsLinked(found, p["linked"]))}
     elif action == "duplicate":
-        dup = tl.DuplicateTimeline(p.get("name", tl.GetName() + " Copy"))
-        return _ok(name=dup.GetName()) if dup else _err("Failed to duplicate")
+        name = p.get("name")
+        new_name = str(name) if name is not None else tl.GetName() + " Copy"
+        dup = tl.DuplicateTimeline(new_name)
+        if dup:
+            return _ok(**_collect_timeline_info(dup, bool(p.get("verbose"))))
+        # Resolve refuses a name already in use without saying so. The lookup
+        # index answers that only on failure, so a successful duplicate never
+        # pays for a scan.
+        existing, existing_index = _find_timeline_by_name(proj, new_name)
+        if existing:
+            return _err(
+                f"Failed to duplicate: a timeline named {new_name!r} already exists",
+                code="TIMELINE_NAME_TAKEN", category="precondition",
+                remediation="Pass a different params.name.",
+                state={"existing_timeline": _timeline_identity(existing, existing_index)},
+            )
+        return _err("Failed to duplicate")
     elif action == "duplicate_clips":
         return _timeline_duplicate_clips_impl(proj, tl, p)
     elif action == "copy_clips":
@@ -21811,18 +22448,9 @@ def timeline(action: str, params: Optional[Dict[str, Any]] = None) -> Dict[str,
     elif action == "set_setting":
         if bool(tl.SetSetting(p["name"], p["value"])):
             return {"success": True}
-        known = _setting_limitation(p["name"], obj="Timeline")
-        if not known:
-            return {"success": False}
-        return {
-            "success": False,
-            "known_limitation": {
-                "symbol": known.get("symbol"),
-                "reality": known.get("reality"),
-                "recommended": known.get("recommended"),
-                "ledger_verified_on": _API_TRUTH_VERIFIED_ON,
-            },
-        }
+        return _setting_refusal(p["name"], obj="Timeline")
+    elif action == "set_settings":
+        return _set_settings_bulk(tl, p.get("settings"), obj="Timeline")
     elif action == "insert_generator":
         r = tl.InsertGeneratorIntoTimeline(p["name"])
         return _ok() if r else _err("Failed to insert generator")
@@ -23064,15 +23692,15 @@ def _safe_export_lut(item, p: Dict[str, Any]):
         return _err("path is required")
     if p.get("require_temp_path", True) and not _grade_temp_path_ok(path):
         return _err("path must be under the system temp directory unless require_temp_path=False")
-    folder = os.path.dirname(os.path.abspath(path))
-    if folder:
-        os.makedirs(folder, exist_ok=True)
     resolve_obj = get_resolve()
     export_type, type_err = _resolve_lut_export_type(p.get("type", "33ptcube"), resolve_obj)
     if type_err:
         return type_err
     if p.get("dry_run"):
         return _ok(path=path, type=export_type, would_export=True)
+    folder = os.path.dirname(os.path.abspath(path))
+    if folder:
+        os.makedirs(folder, exist_ok=True)
     before_exists = os.path.exists(path)
     success = bool(item.ExportLUT(export_type, path))
     return {
@@ -24366,11 +24994,12 @@ def gallery_stills(action: str, params: Optional[Dict[str, Any]] = None) -> Dict
             album.DeleteStills([still])
         if not export_ok:
             return _err("ExportStills failed — ensure the Gallery panel is open on the Color page (Workspace > Gallery)")
-        # Wait for filesystem
-        time.sleep(0.3)
-        # Find new files
-        after = set(os.listdir(folder_path))
-        new_files = sorted(after - before)
+        # Wait for the image and its .drx to land and stop growing; on timeout
+        # take whatever has appeared rather than failing the grab.
+        new_files = (
+            _poll_until(_settled_still_export(folder_path, before), timeout=3.0)
+            or sorted(set(os.listdir(folder_path)) - before)
+        )
         file_details = []
         for f in new_files:
             fpath = os.path.join(folder_path, f)
@@ -27627,7 +28256,7 @@ def _resource_current_project() -> Dict[str, Any]:
     r = get_resolve()
     if r is None:
         return {"open": False}
-    pm = r.GetProjectManager()
+    pm = _project_manager_of(r)
     if pm is None:
         return {"open": False}
     proj = pm.GetCurrentProject()
@@ -27647,7 +28276,7 @@ def _resource_current_timeline() -> Dict[str, Any]:
     r = get_resolve()
     if r is None:
         return {"open": False}
-    pm = r.GetProjectManager()
+    pm = _project_manager_of(r)
     if pm is None:
         return {"open": False}
     proj = pm.GetCurrentProject()
@@ -27745,51 +28374,9 @@ def _resource_install_guidance() -> Dict[str, Any]:
 
 def _install_threaded_tool_dispatch(fastmcp) -> int:
     """Run synchronous tool bodies in a worker thread instead of inline on the
-    event loop.
-
-    The MCP SDK invokes a sync tool function directly on the single asyncio
-    event-loop thread, so a blocking Resolve call (or subprocess, or the up-to-
-    60s launch wait) freezes the whole server — including the stdio read loop —
-    until it returns. Wrapping each sync tool as an async function that offloads
-    to a worker thread keeps the event loop servicing the transport. Bodies are
-    serialized on _bridge_lock so the single-threaded Resolve bridge is never
-    entered concurrently. A body that outlives a client cancellation runs to
-    completion (the bridge is never left half-mutated) still holding the lock.
-
-    Couples to mcp SDK private attrs (ToolManager._tools, Tool.fn /
-    Tool.is_async; verified on mcp 1.27). Best-effort: if that shape changes,
-    leave the tools as-is, falling back to the current inline behavior.
+    event loop, serialized on _bridge_lock (see src/utils/mcp_dispatch.py).
     """
-    import functools
-    import anyio
-
-    manager = getattr(fastmcp, "_tool_manager", None)
-    tools = getattr(manager, "_tools", None)
-    if not isinstance(tools, dict) or not tools:
-        return 0
-
-    def _offloaded(fn):
-        @functools.wraps(fn)
-        async def run_off_thread(**kwargs):
-            def call():
-                with _bridge_lock:
-                    return fn(**kwargs)
-            return await anyio.to_thread.run_sync(call)
-        return run_off_thread
-
-    wrapped = 0
-    for tool in tools.values():
-        if getattr(tool, "is_async", False):
-            continue
-        try:
-            tool.fn = _offloaded(tool.fn)
-            tool.is_async = True
-        except Exception as exc:  # unexpected SDK shape — keep the original tool
-            logger.warning(f"threaded tool dispatch skipped for {getattr(tool, 'name', '?')}: {exc}")
-            continue
-        wrapped += 1
-    logger.info(f"Threaded tool dispatch installed for {wrapped} tools")
-    return wrapped
+    return install_threaded_tool_dispatch(fastmcp, _bridge_lock)
 
 
 if __name__ == "__main__":
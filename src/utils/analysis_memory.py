@@ -24,7 +24,6 @@ from __future__ import annotations
 import json
 import os
 import time
-from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 
@@ -201,7 +200,8 @@ def regenerate_bin_summary_from_manifest(
     clips = manifest.get("clips") or []
     project_name = project_name or manifest.get("project_name") or "(unknown project)"
 
-    # Read per-clip analyses from disk so we can aggregate
+    # Read per-clip analyses from disk so we can aggregate. Each file is read
+    # once here; the per-clip listing below works from the same reports.
     enriched: List[Dict[str, Any]] = []
     for clip in clips:
         info = {
@@ -210,7 +210,7 @@ def regenerate_bin_summary_from_manifest(
             "report": None,
         }
         analysis_path = clip.get("analysis_json")
-        if analysis_path and os.path.isfile(analysis_path):
+        if analysis_path:
             try:
                 with open(analysis_path, "r", encoding="utf-8") as handle:
                     info["report"] = json.load(handle)
@@ -350,7 +350,7 @@ def regenerate_bin_summary_from_manifest(
         if bin_path:
             lines.append(f"- **bin**: {bin_path}\n")
 
-        summary = _read_clip_summary(info["clip"])
+        summary = _clip_summary(info["report"])
         if summary:
             lines.append(f"\n{summary}\n")
         else:
@@ -409,15 +409,9 @@ def _fmt_duration(seconds: float) -> str:
     return f"{hours}h{minutes:02d}m"
 
 
-def _read_clip_summary(clip: Dict[str, Any]) -> Optional[str]:
-    """Try to read the clip_summary from the clip's analysis.json if present."""
-    analysis_json_path = clip.get("analysis_json")
-    if not analysis_json_path or not os.path.isfile(analysis_json_path):
-        return None
-    try:
-        with open(analysis_json_path, "r", encoding="utf-8") as handle:
-            report = json.load(handle)
-    except (OSError, json.JSONDecodeError):
+def _clip_summary(report: Any) -> Optional[str]:
+    """The clip_summary from a loaded analysis.json report, if present."""
+    if not isinstance(report, dict):
         return None
     visual = report.get("visual") or {}
     summary = visual.get("clip_summary")
@@ -595,8 +589,7 @@ def soul_dir(analysis_base_root: str) -> str:
 def ensure_soul_structure(analysis_base_root: str) -> Dict[str, Any]:
     """Create the soul directory + initial files if absent. Idempotent."""
     d = soul_dir(analysis_base_root)
-    if not os.path.isdir(d):
-        os.makedirs(d, exist_ok=True)
+    os.makedirs(d, exist_ok=True)
 
     created = []
     seeds = {
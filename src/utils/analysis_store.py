@@ -521,15 +521,13 @@ def ingest_report(
         # Transcript segments.
         conn.execute("DELETE FROM transcript_segments WHERE clip_uuid = ?", (clip_uuid,))
         segments = transcription.get("segments") if isinstance(transcription.get("segments"), list) else []
-        for idx, seg in enumerate(segments):
-            if not isinstance(seg, dict):
-                continue
-            conn.execute(
-                """
-                INSERT OR REPLACE INTO transcript_segments
-                    (clip_uuid, segment_index, start_seconds, end_seconds, text, speaker_id)
-                VALUES (?, ?, ?, ?, ?, ?)
-                """,
+        conn.executemany(
+            """
+            INSERT OR REPLACE INTO transcript_segments
+                (clip_uuid, segment_index, start_seconds, end_seconds, text, speaker_id)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            [
                 (
                     clip_uuid,
                     idx,
@@ -537,8 +535,11 @@ def ingest_report(
                     seg.get("end") if isinstance(seg.get("end"), (int, float)) else None,
                     seg.get("text"),
                     seg.get("speaker") or seg.get("speaker_id"),
-                ),
-            )
+                )
+                for idx, seg in enumerate(segments)
+                if isinstance(seg, dict)
+            ],
+        )
 
         # Word-level timestamps (v13): promote segments[*].words to rows so
         # word-boundary queries never have to parse the report blob.
@@ -567,6 +568,9 @@ def ingest_report(
 
         conn.execute("DELETE FROM frames WHERE clip_uuid = ?", (clip_uuid,))
         keyframes = motion.get("analysis_keyframes") if isinstance(motion.get("analysis_keyframes"), list) else []
+        # Rows are built first and inserted in one executemany, not one
+        # statement round per keyframe.
+        frame_rows = []
         for kf in keyframes:
             if not isinstance(kf, dict):
                 continue
@@ -574,23 +578,24 @@ def ingest_report(
                 frame_index = int(kf.get("index"))
             except (TypeError, ValueError):
                 continue
-            conn.execute(
-                """
-                INSERT OR REPLACE INTO frames
-                    (clip_uuid, shot_uuid, frame_index, time_seconds, frame_path,
-                     selection_reason, motion_peak)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    clip_uuid,
-                    frame_to_shot.get(frame_index) or _shot_for_time(kf.get("time_seconds")),
-                    frame_index,
-                    kf.get("time_seconds") if isinstance(kf.get("time_seconds"), (int, float)) else None,
-                    kf.get("frame_path") or kf.get("path"),
-                    kf.get("selection_reason"),
-                    1 if kf.get("motion_peak") else 0,
-                ),
-            )
+            frame_rows.append((
+                clip_uuid,
+                frame_to_shot.get(frame_index) or _shot_for_time(kf.get("time_seconds")),
+                frame_index,
+                kf.get("time_seconds") if isinstance(kf.get("time_seconds"), (int, float)) else None,
+                kf.get("frame_path") or kf.get("path"),
+                kf.get("selection_reason"),
+                1 if kf.get("motion_peak") else 0,
+            ))
+        conn.executemany(
+            """
+            INSERT OR REPLACE INTO frames
+                (clip_uuid, shot_uuid, frame_index, time_seconds, frame_path,
+                 selection_reason, motion_peak)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            frame_rows,
+        )
 
         # QC observations: machine rows rebuild; human-resolved rows persist.
         conn.execute(
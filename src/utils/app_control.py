@@ -14,7 +14,7 @@ import time
 import sys
 import platform
 import subprocess
-from typing import Dict, Any, Optional, Union, List
+from typing import Dict, Any, List
 
 # Configure logging
 logger = logging.getLogger("davinci-resolve-mcp.app_control")
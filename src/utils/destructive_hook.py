@@ -106,6 +106,7 @@ DESTRUCTIVE_ACTIONS_BY_TOOL: Dict[str, FrozenSet[str]] = {
         # rename, and renaming an archive archived the archive). Issue #83.
         "set_start_timecode",
         "set_setting",
+        "set_settings",
         "set_mark_in_out",
         "clear_mark_in_out",
         "set_title_text",
@@ -406,11 +407,14 @@ def destructive_op(tool_name: str) -> Callable[[Callable[..., Any]], Callable[..
     argument and `params: Optional[Dict]` as its second (matches the existing
     compound-tool signature).
     """
+    # Bound once per tool: most calls are reads, and they pass straight through
+    # on one set-membership test instead of a registry lookup per call.
+    destructive_actions = DESTRUCTIVE_ACTIONS_BY_TOOL.get(tool_name, frozenset())
 
     def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
         @functools.wraps(fn)
         def wrapper(action: str, params: Optional[Dict[str, Any]] = None, *args, **kwargs) -> Any:
-            if not is_destructive(tool_name, action, params):
+            if action not in destructive_actions or not is_destructive(tool_name, action, params):
                 return fn(action, params, *args, **kwargs)
 
             # F4 — token-issuance calls don't mutate; skip the archive entirely
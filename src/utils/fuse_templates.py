@@ -1122,21 +1122,20 @@ def spatial_warp(name: str, options: Optional[Dict[str, Any]] = None) -> str:
                  "black": "SamplePixelB"}[edge_mode]
 
     if warp == "sine":
-        warp_body = '''            local xt = x - amp * math.sin(y * freq + phase)
+        warp_body = f'''            local xt = x - amp * math.sin(y * freq + phase)
             local yt = y - amp * math.sin(x * freq + phase)
             img:{sample_fn}(xt, yt, sp)'''
     elif warp == "scatter":
-        warp_body = '''            img:GetPixel(x, y, sp)
+        warp_body = f'''            img:GetPixel(x, y, sp)
             local xt = x - amp * 5 * (sp.R - 0.5)
             local yt = y - amp * 5 * (sp.B - 0.5)
             img:{sample_fn}(xt, yt, sp)'''
     else:  # pinch
-        warp_body = '''            local dx = x - cx
+        warp_body = f'''            local dx = x - cx
             local dy = y - cy
             local r = math.sqrt(dx*dx + dy*dy)
             local k = 1 + amp * math.exp(-r / (freq * 100))
             img:{sample_fn}(cx + dx / k, cy + dy / k, sp)'''
-    warp_body = warp_body.replace("{sample_fn}", sample_fn)
 
     return header(name, "spatial_warp", "tool") + f'''FuRegisterClass("{name}", CT_Tool, {{
     REGS_Category = "Fuses\\\\MCP",
@@ -69,6 +69,10 @@ _FIELD_RE = re.compile(r'(\w+)\s*=\s*(?:"([^"]*)"|([\d.eE+-]+))')
 
 _INPUT_HEAD_RE = re.compile(r"(Input\d+)\s*=\s*InstanceInput\s*\{")
 
+_GROUP_HEAD_RE = re.compile(r"=\s*GroupOperator\s*\{")
+
+_INPUTS_MARKER_RE = re.compile(r"Inputs\s*=\s*ordered\s*\(\s*\)\s*\{")
+
 
 def _find_balanced_brace(text: str, open_index: int) -> int:
     """Return the index of the `}` that closes the `{` at open_index."""
@@ -183,18 +187,18 @@ def _group_inputs_span(
             raise ValueError(f"GroupOperator {group_name!r} not found in .setting content")
         group_open = match.end() - 1
     else:
-        match = re.search(r"=\s*GroupOperator\s*\{", content)
+        match = _GROUP_HEAD_RE.search(content)
         if not match:
             raise ValueError("No GroupOperator found in .setting content")
         group_open = match.end() - 1
 
     group_close = _find_balanced_brace(content, group_open)
-    group_body = content[group_open + 1 : group_close]
-    inputs_marker = re.search(r"Inputs\s*=\s*ordered\s*\(\s*\)\s*\{", group_body)
+    # Bounded search in place rather than on a sliced copy of the group body.
+    inputs_marker = _INPUTS_MARKER_RE.search(content, group_open + 1, group_close)
     if not inputs_marker:
         raise ValueError("GroupOperator has no Inputs = ordered() block")
-    abs_start = group_open + 1 + inputs_marker.start()
-    open_brace = group_open + 1 + inputs_marker.end() - 1
+    abs_start = inputs_marker.start()
+    open_brace = inputs_marker.end() - 1
     close_brace = _find_balanced_brace(content, open_brace)
     replace_end = close_brace + 1
     if replace_end < len(content) and content[replace_end] == ",":
@@ -10,9 +10,8 @@ This module provides functions for working with DaVinci Resolve UI layout preset
 """
 
 import os
-import json
 import logging
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any
 
 # Configure logging
 logger = logging.getLogger("davinci-resolve-mcp.layout_presets")
@@ -75,8 +74,7 @@ def get_layout_preset_path(platform: str = None) -> str:
     preset_path = os.path.expanduser(preset_path)
     
     # Ensure directory exists
-    if not os.path.exists(preset_path):
-        os.makedirs(preset_path, exist_ok=True)
+    os.makedirs(preset_path, exist_ok=True)
     
     return preset_path
 
@@ -97,8 +95,7 @@ def get_ui_layout_path(preset_path: str = None) -> str:
     ui_layout_path = os.path.join(preset_path, "UILayouts")
     
     # Ensure directory exists
-    if not os.path.exists(ui_layout_path):
-        os.makedirs(ui_layout_path, exist_ok=True)
+    os.makedirs(ui_layout_path, exist_ok=True)
     
     return ui_layout_path
 
@@ -235,7 +232,7 @@ def export_layout_preset(preset_name: str, export_path: str, layout_type: str =
 
         # Ensure destination directory exists
         export_dir = os.path.dirname(export_path)
-        if export_dir and not os.path.exists(export_dir):
+        if export_dir:
             os.makedirs(export_dir, exist_ok=True)
 
         # Copy the preset file
@@ -48,6 +48,15 @@ def _user_lut_dir() -> Optional[str]:
         return None
 
 
+def _is_current_copy(src: str, dst: str) -> bool:
+    """True when dst is an earlier copy2 of src: same size and same mtime."""
+    try:
+        a, b = os.stat(src), os.stat(dst)
+    except OSError:
+        return False
+    return a.st_size == b.st_size and a.st_mtime_ns == b.st_mtime_ns
+
+
 def ensure_lut_in_master(lut_path: str) -> Optional[str]:
     """Make a LUT resolvable by Graph.SetLUT().
 
@@ -75,7 +84,10 @@ def ensure_lut_in_master(lut_path: str) -> Optional[str]:
     if os.path.abspath(src) != os.path.abspath(dst):
         try:
             os.makedirs(dst_dir, exist_ok=True)
-            shutil.copy2(src, dst)
+            # Applying one LUT across a batch relocates it once per clip; copy2
+            # keeps the mtime, so an unchanged source is not copied again.
+            if not _is_current_copy(src, dst):
+                shutil.copy2(src, dst)
         except Exception:
             return None
     return f"{MASTER_LUT_RELOCATE_SUBDIR}/{base}"
@@ -0,0 +1,57 @@
+"""Run synchronous FastMCP tool bodies in a worker thread.
+
+The MCP SDK invokes a sync tool function directly on the single asyncio
+event-loop thread, so a blocking Resolve call (or subprocess, or the up-to-
+60s launch wait) freezes the whole server — including the stdio read loop —
+until it returns. Wrapping each sync tool as an async function that offloads
+to a worker thread keeps the event loop servicing the transport. Bodies are
+serialized on the caller's lock so the single-threaded Resolve bridge is never
+entered concurrently. A body that outlives a client cancellation runs to
+completion (the bridge is never left half-mutated) still holding the lock.
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+
+import anyio
+
+logger = logging.getLogger("davinci-resolve-mcp.dispatch")
+
+
+def install_threaded_tool_dispatch(fastmcp, lock) -> int:
+    """Wrap every sync tool on `fastmcp` to run off-thread under `lock`.
+
+    Couples to mcp SDK private attrs (ToolManager._tools, Tool.fn /
+    Tool.is_async; verified on mcp 1.27). Best-effort: if that shape changes,
+    leave the tools as-is, falling back to the current inline behavior.
+    Returns the number of tools wrapped.
+    """
+    manager = getattr(fastmcp, "_tool_manager", None)
+    tools = getattr(manager, "_tools", None)
+    if not isinstance(tools, dict) or not tools:
+        return 0
+
+    def _offloaded(fn):
+        @functools.wraps(fn)
+        async def run_off_thread(**kwargs):
+            def call():
+                with lock:
+                    return fn(**kwargs)
+            return await anyio.to_thread.run_sync(call)
+        return run_off_thread
+
+    wrapped = 0
+    for tool in tools.values():
+        if getattr(tool, "is_async", False):
+            continue
+        try:
+            tool.fn = _offloaded(tool.fn)
+            tool.is_async = True
+        except Exception as exc:  # unexpected SDK shape — keep the original tool
+            logger.warning(f"threaded tool dispatch skipped for {getattr(tool, 'name', '?')}: {exc}")
+            continue
+        wrapped += 1
+    logger.info(f"Threaded tool dispatch installed for {wrapped} tools")
+    return wrapped
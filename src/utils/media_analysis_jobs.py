@@ -266,18 +266,21 @@ def _write_job_sidecars(conn: sqlite3.Connection, project_root: str, job_id: str
         """,
         (job_id,),
     ).fetchall()
+    lines = []
+    for row in rows:
+        payload = {
+            "time": row["event_time"],
+            "level": row["level"],
+            "message": row["message"],
+        }
+        if row["payload_json"]:
+            payload["payload"] = _read_json(row["payload_json"])
+        lines.append(json.dumps(payload, ensure_ascii=False, sort_keys=True) + "\n")
+    # The events file is rewritten on every sidecar refresh, so it goes out in
+    # one write rather than two per event.
     tmp_events = f"{paths['events_jsonl']}.tmp"
     with open(tmp_events, "w", encoding="utf-8") as handle:
-        for row in rows:
-            payload = {
-                "time": row["event_time"],
-                "level": row["level"],
-                "message": row["message"],
-            }
-            if row["payload_json"]:
-                payload["payload"] = _read_json(row["payload_json"])
-            handle.write(json.dumps(payload, ensure_ascii=False, sort_keys=True))
-            handle.write("\n")
+        handle.write("".join(lines))
     os.replace(tmp_events, paths["events_jsonl"])
 
 
@@ -26,6 +26,11 @@ _FPS_KEYS = ("FPS", "Frame Rate", "Video Frame Rate")
 _FRAME_COUNT_KEYS = ("Frames", "Frame Count", "Video Frames")
 _DURATION_KEYS = ("Duration", "Video Duration")
 
+# Compiled once: these run per clip while an append plan is built.
+_SIGNED_NUMBER_RE = re.compile(r"-?\d+(?:\.\d+)?")
+_NUMBER_RE = re.compile(r"\d+(?:\.\d+)?")
+_TIMECODE_RE = re.compile(r"^(\d{1,2}):(\d{2}):(\d{2})([:;])(\d{2})$")
+
 
 def _err(message: str) -> Dict[str, str]:
     return {"error": message}
@@ -35,7 +40,7 @@ def _frame_int(value: Any) -> Optional[int]:
     if value is None or value == "":
         return None
     if isinstance(value, str):
-        match = re.search(r"-?\d+(?:\.\d+)?", value.strip())
+        match = _SIGNED_NUMBER_RE.search(value.strip())
         if not match:
             return None
         value = match.group(0)
@@ -50,7 +55,7 @@ def parse_frame_rate(value: Any) -> Optional[float]:
         return None
     if isinstance(value, (int, float)):
         return float(value) if float(value) > 0 else None
-    match = re.search(r"\d+(?:\.\d+)?", str(value))
+    match = _NUMBER_RE.search(str(value))
     if not match:
         return None
     fps = float(match.group(0))
@@ -79,7 +84,7 @@ def timecode_to_frames(timecode: Any, fps: Any, *, drop_frame: Optional[bool] =
     if rate is None:
         return None
     text = str(timecode or "").strip()
-    match = re.match(r"^(\d{1,2}):(\d{2}):(\d{2})([:;])(\d{2})$", text)
+    match = _TIMECODE_RE.match(text)
     if not match:
         return None
     hours, minutes, seconds, sep, frames = match.groups()
@@ -3,10 +3,13 @@
 Platform-specific functionality for DaVinci Resolve MCP Server
 """
 
+import logging
 import os
 import sys
 import platform
 
+logger = logging.getLogger("davinci-resolve-mcp.platform")
+
 def get_platform():
     """Identify the current operating system platform.
     
@@ -163,5 +166,6 @@ def setup_environment():
         return True
     
     except Exception as e:
-        print(f"Error setting up environment: {str(e)}")
+        # Never print: under the stdio transport stdout is the JSON-RPC stream.
+        logger.warning(f"Error setting up environment: {e}")
         return False 
\ No newline at end of file
@@ -8,10 +8,10 @@ This module provides functions for working with DaVinci Resolve project properti
 - Handling project-specific configurations
 """
 
-import os
 import logging
-import json
-from typing import Dict, List, Any, Optional, Union
+import sys
+import time
+from typing import Dict, Any, Optional
 
 # Configure logging
 logger = logging.getLogger("davinci-resolve-mcp.project_properties")
@@ -54,6 +54,265 @@ PROJECT_PROPERTY_TYPES = {
     "TimelineCacheMode": "int",
 }
 
+# Category sets derived once from PROJECT_PROPERTY_TYPES for O(1) dispatch.
+INT_PROPERTIES = frozenset(n for n, t in PROJECT_PROPERTY_TYPES.items() if t == "int")
+FLOAT_PROPERTIES = frozenset(n for n, t in PROJECT_PROPERTY_TYPES.items() if t == "float")
+BOOL_PROPERTIES = frozenset(n for n, t in PROJECT_PROPERTY_TYPES.items() if t == "bool")
+STRING_PROPERTIES = frozenset(n for n, t in PROJECT_PROPERTY_TYPES.items() if t == "string")
+
+_BOOL_TRUE = frozenset({"true", "yes", "1", "on"})
+# Resolve reports an unset toggle as an empty string.
+_BOOL_FALSE = frozenset({"false", "no", "0", "off", ""})
+
+def _to_bool(value: Any) -> bool:
+    if isinstance(value, str):
+        text = value.lower()
+        if text in _BOOL_TRUE:
+            return True
+        if text in _BOOL_FALSE:
+            return False
+        raise ValueError(value)
+    return bool(value)
+
+def _make_coercer(name: str, expected: type, convert):
+    """Bind a (value) -> (value, error) converter to one property's type."""
+    invalid = f"Invalid {PROJECT_PROPERTY_TYPES[name]} value for property {name}: "
+    
+    def coerce(value: Any):
+        if isinstance(value, expected):
+            return value, None
+        try:
+            return convert(value), None
+        except (ValueError, TypeError):
+            return value, f"{invalid}{value}"
+    
+    return coerce
+
+# property name -> converter specialised for it at import, so a call does one
+# dict lookup and no category or type-name dispatch.
+_PROPERTY_COERCERS = {
+    **{name: _make_coercer(name, int, int) for name in INT_PROPERTIES},
+    **{name: _make_coercer(name, float, float) for name in FLOAT_PROPERTIES},
+    **{name: _make_coercer(name, bool, _to_bool) for name in BOOL_PROPERTIES},
+}
+
+def _intern_name(name: Any) -> Any:
+    """Intern a setting name arriving from JSON; the schema keys already are."""
+    return sys.intern(name) if type(name) is str else name
+
+def coerce_property_value(property_name: str, value: Any):
+    """
+    Convert a value to the type PROJECT_PROPERTY_TYPES declares for a property.
+    
+    Returns:
+        (value, error) - unknown properties pass through unchanged; a value
+        that cannot be converted is returned as-is with an error message.
+    """
+    coerce = _PROPERTY_COERCERS.get(property_name)
+    if coerce is None:
+        return value, None
+    return coerce(value)
+
+# Numeric values accepted by the helpers that validate a closed set of options.
+PROPERTY_ENUMS = {
+    "colorScienceMode": frozenset({0, 1, 2}),
+    "superScaleQuality": frozenset({0, 1, 2}),
+}
+
+_TIMELINE_FORMAT_PROPERTIES = (
+    "timelineFrameRate",
+    "timelineResolutionWidth",
+    "timelineResolutionHeight",
+    "timelineOutputResolutionWidth",
+    "timelineOutputResolutionHeight",
+    "timelineInterlaceProcessing",
+)
+_COLOR_PROPERTIES = (
+    "colorScienceMode",
+    "timelineColorSpace",
+    "timelineGamma",
+    "inputDRT",
+    "outputDRT",
+)
+_SUPERSCALE_QUALITY_NAMES = {
+    0: "Auto",
+    1: "Better Quality",  # Sharper but might have artifacts
+    2: "Smoother",        # Less sharp but fewer artifacts
+}
+_COLOR_SCIENCE_NAMES = {
+    0: "DaVinci YRGB",
+    1: "DaVinci YRGB Color Managed",
+    2: "ACEScct",
+}
+_COLOR_SCIENCE_VALUES = {
+    "YRGB": 0,
+    "DaVinci YRGB": 0,
+    "YRGB Color Managed": 1,
+    "DaVinci YRGB Color Managed": 1,
+    "ACEScct": 2,
+    "ACES": 2,
+}
+# (width, height) -> display name for the common timeline resolutions.
+_RESOLUTION_NAMES = {
+    (3840, 2160): "UHD 4K",
+    (1920, 1080): "FHD 1080p",
+    (1280, 720): "HD 720p",
+    (4096, 2160): "DCI 4K",
+    (4096, 2304): "DCI 4K",
+    (2048, 1080): "DCI 2K",
+    (2048, 1152): "DCI 2K",
+}
+
+# How long a GetSetting('') snapshot may be reused. Deliberately short: the
+# memo collapses the burst of reads a single request makes (metadata reads a
+# dozen keys), it is not meant to outlive a change made in Resolve's own UI.
+SETTINGS_SNAPSHOT_TTL = 0.5
+
+# object key -> (settings, taken_at). Keyed on GetUniqueId() (the name when
+# that is unavailable), never on the wrapper: GetCurrentProject() hands back a
+# new wrapper on every tool call, so an identity key would never hit twice.
+_settings_snapshots: Dict[str, tuple] = {}
+
+# The wrapper most recently keyed and its key. The reads inside one tool call
+# share a wrapper, so the burst pays for the identity read once.
+_last_keyed: tuple = (None, None)
+
+def _object_key(obj) -> Optional[str]:
+    """Stable cache key for a project or timeline, or None when it has none."""
+    global _last_keyed
+    last_obj, last_key = _last_keyed
+    if last_obj is obj:
+        return last_key
+    key = None
+    for getter in ("GetUniqueId", "GetName"):
+        try:
+            value = getattr(obj, getter)()
+        except Exception:
+            continue
+        if value:
+            key = f"{getter}:{value}"
+            break
+    _last_keyed = (obj, key)
+    return key
+
+def _fresh_snapshot(obj) -> Optional[Dict[str, Any]]:
+    key = _object_key(obj)
+    entry = _settings_snapshots.get(key) if key is not None else None
+    if entry is None:
+        return None
+    if time.monotonic() - entry[1] >= SETTINGS_SNAPSHOT_TTL:
+        _settings_snapshots.pop(key, None)
+        return None
+    return entry[0]
+
+def settings_snapshot(obj) -> Optional[Dict[str, Any]]:
+    """
+    Get every setting of a project or timeline with a single GetSetting('').
+
+    Repeated calls for the same project or timeline within
+    SETTINGS_SNAPSHOT_TTL are served from memory, across tool calls too; an
+    object with neither an id nor a name is read every time. Returns None when
+    Resolve does not answer with a dict.
+    """
+    settings = _fresh_snapshot(obj)
+    if settings is not None:
+        return settings
+    settings = obj.GetSetting('')
+    if not isinstance(settings, dict):
+        return None
+    key = _object_key(obj)
+    if key is None:
+        return settings
+    now = time.monotonic()
+    for stale, entry in list(_settings_snapshots.items()):
+        if now - entry[1] >= SETTINGS_SNAPSHOT_TTL:
+            del _settings_snapshots[stale]
+    _settings_snapshots[key] = (settings, now)
+    return settings
+
+# (object key, name) -> (value, taken_at) for single-key reads made while no
+# snapshot was fresh, under the same TTL and keying as the snapshots.
+_single_reads: Dict[tuple, tuple] = {}
+
+def read_setting(obj, name: str) -> Any:
+    """Read one setting, from a fresh snapshot or a recent single read."""
+    settings = _fresh_snapshot(obj)
+    if settings is not None and name in settings:
+        return settings[name]
+    object_key = _object_key(obj)
+    if object_key is None:
+        return obj.GetSetting(name)
+    key = (object_key, name)
+    now = time.monotonic()
+    entry = _single_reads.get(key)
+    if entry is not None and now - entry[1] < SETTINGS_SNAPSHOT_TTL:
+        return entry[0]
+    value = obj.GetSetting(name)
+    for stale, cached in list(_single_reads.items()):
+        if now - cached[1] >= SETTINGS_SNAPSHOT_TTL:
+            del _single_reads[stale]
+    _single_reads[key] = (value, now)
+    return value
+
+def setting_unchanged(obj, name: str, value: Any) -> bool:
+    """
+    True when a fresh snapshot already holds `value` for `name`.
+    
+    Never fetches: without a snapshot the answer is False and the caller
+    writes as usual. Resolve reports settings as strings, so numbers are
+    compared by value and everything else by string form; a mismatch in
+    formatting only costs the write.
+    """
+    settings = _fresh_snapshot(obj)
+    if settings is None or name not in settings or value is None:
+        return False
+    current = settings[name]
+    if isinstance(value, bool):
+        value = int(value)
+    if isinstance(value, (int, float)):
+        try:
+            return float(current) == float(value)
+        except (ValueError, TypeError):
+            return False
+    return str(current) == str(value)
+
+def _set_properties(project_obj, values) -> bool:
+    """
+    Set several properties, skipping those already at the requested value.
+    
+    One snapshot is taken up front, so each unchanged property costs no
+    round-trip instead of a SetSetting. Returns True when every write that
+    was needed succeeded.
+    """
+    settings_snapshot(project_obj)
+    pending = [
+        (name, value) for name, value in values
+        if not setting_unchanged(project_obj, name, coerce_property_value(name, value)[0])
+    ]
+    success = True
+    for name, value in pending:
+        if not set_project_property(project_obj, name, value):
+            success = False
+    return success
+
+def _record_write(obj, name: str, value: Any) -> None:
+    """Fold an accepted write into a fresh snapshot, in Resolve's string form."""
+    _single_reads.pop((_object_key(obj), name), None)
+    settings = _fresh_snapshot(obj)
+    if settings is not None:
+        settings[name] = str(int(value)) if isinstance(value, bool) else str(value)
+
+def invalidate_settings_snapshot(obj=None) -> None:
+    """Drop the cached settings for `obj`, or for every object when `obj` is None."""
+    if obj is None:
+        _settings_snapshots.clear()
+        _single_reads.clear()
+    else:
+        object_key = _object_key(obj)
+        _settings_snapshots.pop(object_key, None)
+        for key in [key for key in _single_reads if key[0] == object_key]:
+            del _single_reads[key]
+
 def get_all_project_properties(project_obj) -> Dict[str, Any]:
     """
     Get all project properties and their values.
@@ -69,7 +328,7 @@ def get_all_project_properties(project_obj) -> Dict[str, Any]:
     
     try:
         # Get all settings using empty string as key
-        all_settings = project_obj.GetSetting('')
+        all_settings = settings_snapshot(project_obj)
         
         # Check if we got a valid response
         if all_settings is None or not isinstance(all_settings, dict):
@@ -81,13 +340,13 @@ def get_all_project_properties(project_obj) -> Dict[str, Any]:
                 try:
                     value = project_obj.GetSetting(prop_name)
                     properties[prop_name] = value
-                except Exception as e:
-                    logger.debug(f"Error getting property {prop_name}: {str(e)}")
+                except Exception:
+                    logger.debug("Error getting property %s", prop_name, exc_info=True)
             
             return properties
         else:
             # Return all settings
-            return all_settings
+            return dict(all_settings)
             
     except Exception as e:
         logger.error(f"Error getting project properties: {str(e)}")
@@ -108,29 +367,16 @@ def get_project_property(project_obj, property_name: str) -> Any:
         return {"error": "Invalid project object"}
     
     try:
+        # Interned so the schema and snapshot lookups below can match on identity
+        property_name = _intern_name(property_name)
+        
         # Get the specified property
-        value = project_obj.GetSetting(property_name)
+        value = read_setting(project_obj, property_name)
         
-        # Properly convert the value based on expected type
-        if property_name in PROJECT_PROPERTY_TYPES:
-            property_type = PROJECT_PROPERTY_TYPES[property_name]
-            
-            if property_type == "int" and not isinstance(value, int):
-                try:
-                    value = int(value)
-                except (ValueError, TypeError):
-                    # Keep Resolve's raw value when it cannot be safely coerced.
-                    pass
-            elif property_type == "float" and not isinstance(value, float):
-                try:
-                    value = float(value)
-                except (ValueError, TypeError):
-                    # Keep Resolve's raw value when it cannot be safely coerced.
-                    pass
-            elif property_type == "bool" and not isinstance(value, bool):
-                # Convert string representations of boolean
-                if isinstance(value, str):
-                    value = value.lower() in ("true", "yes", "1", "on")
+        # Properly convert the value based on expected type. Resolve's raw
+        # value is kept when it cannot be safely coerced.
+        if value is not None:
+            value, _ = coerce_property_value(property_name, value)
         
         return value
     except Exception as e:
@@ -153,31 +399,28 @@ def set_project_property(project_obj, property_name: str, property_value: Any) -
         return False
     
     try:
-        # Handle type conversion based on expected property type
-        if property_name in PROJECT_PROPERTY_TYPES:
-            property_type = PROJECT_PROPERTY_TYPES[property_name]
-            
-            if property_type == "int":
-                try:
-                    property_value = int(property_value)
-                except (ValueError, TypeError):
-                    logger.warning(f"Invalid integer value for property {property_name}: {property_value}")
-            
-            elif property_type == "float":
-                try:
-                    property_value = float(property_value)
-                except (ValueError, TypeError):
-                    logger.warning(f"Invalid float value for property {property_name}: {property_value}")
-            
-            elif property_type == "bool":
-                if isinstance(property_value, str):
-                    property_value = property_value.lower() in ("true", "yes", "1", "on")
-                property_value = bool(property_value)
+        property_name = _intern_name(property_name)
         
-        # Set the property
-        return project_obj.SetSetting(property_name, property_value)
+        # Handle type conversion based on expected property type
+        property_value, error = coerce_property_value(property_name, property_value)
+        if error:
+            logger.warning(error)
+        
+        if setting_unchanged(project_obj, property_name, property_value):
+            return True
+        
+        # Set the property. A truthy answer is taken at its word and folded
+        # into the snapshot rather than confirmed with a GetSetting; only a
+        # refusal drops the snapshot so the next read asks Resolve.
+        result = project_obj.SetSetting(property_name, property_value)
+        if result:
+            _record_write(project_obj, property_name, property_value)
+        else:
+            invalidate_settings_snapshot(project_obj)
+        return result
         
     except Exception as e:
+        invalidate_settings_snapshot(project_obj)
         logger.error(f"Error setting project property {property_name}: {str(e)}")
         return False
 
@@ -196,17 +439,9 @@ def get_timeline_format_settings(project_obj) -> Dict[str, Any]:
     
     try:
         # Get relevant timeline format settings
+        settings_snapshot(project_obj)
         settings = {}
-        format_properties = [
-            "timelineFrameRate", 
-            "timelineResolutionWidth", 
-            "timelineResolutionHeight",
-            "timelineOutputResolutionWidth",
-            "timelineOutputResolutionHeight",
-            "timelineInterlaceProcessing"
-        ]
-        
-        for prop in format_properties:
+        for prop in _TIMELINE_FORMAT_PROPERTIES:
             settings[prop] = get_project_property(project_obj, prop)
         
         # Add frame rate details
@@ -227,17 +462,10 @@ def get_timeline_format_settings(project_obj) -> Dict[str, Any]:
             height = settings["timelineResolutionHeight"]
             
             # Determine common resolution names
-            resolution_name = None
-            if width == 3840 and height == 2160:
-                resolution_name = "UHD 4K"
-            elif width == 1920 and height == 1080:
-                resolution_name = "FHD 1080p"
-            elif width == 1280 and height == 720:
-                resolution_name = "HD 720p"
-            elif width == 4096 and height in [2160, 2304]:
-                resolution_name = "DCI 4K"
-            elif width == 2048 and height in [1080, 1152]:
-                resolution_name = "DCI 2K"
+            try:
+                resolution_name = _RESOLUTION_NAMES.get((width, height))
+            except TypeError:
+                resolution_name = None
             
             if resolution_name:
                 settings["resolutionName"] = resolution_name
@@ -267,26 +495,14 @@ def set_timeline_format(project_obj, width: int, height: int, frame_rate: float,
         return False
     
     try:
-        # Set timeline format properties
-        success = True
-        
-        # Set resolution
-        if not set_project_property(project_obj, "timelineResolutionWidth", width):
-            success = False
-        
-        if not set_project_property(project_obj, "timelineResolutionHeight", height):
-            success = False
-        
-        # Set frame rate
-        if not set_project_property(project_obj, "timelineFrameRate", frame_rate):
-            success = False
-        
-        # Set interlaced processing
+        # Set resolution, frame rate and interlaced processing
         interlace_value = 1 if interlaced else 0
-        if not set_project_property(project_obj, "timelineInterlaceProcessing", interlace_value):
-            success = False
-        
-        return success
+        return _set_properties(project_obj, (
+            ("timelineResolutionWidth", width),
+            ("timelineResolutionHeight", height),
+            ("timelineFrameRate", frame_rate),
+            ("timelineInterlaceProcessing", interlace_value),
+        ))
         
     except Exception as e:
         logger.error(f"Error setting timeline format: {str(e)}")
@@ -307,6 +523,7 @@ def get_superscale_settings(project_obj) -> Dict[str, Any]:
     
     try:
         # Get SuperScale settings
+        settings_snapshot(project_obj)
         settings = {}
         
         # Check if SuperScale is enabled
@@ -318,14 +535,8 @@ def get_superscale_settings(project_obj) -> Dict[str, Any]:
         settings["quality"] = quality
         
         # Translate quality number to descriptive name
-        quality_names = {
-            0: "Auto",
-            1: "Better Quality",  # Sharper but might have artifacts
-            2: "Smoother",        # Less sharp but fewer artifacts
-        }
-        
-        if quality in quality_names:
-            settings["qualityName"] = quality_names[quality]
+        if quality in _SUPERSCALE_QUALITY_NAMES:
+            settings["qualityName"] = _SUPERSCALE_QUALITY_NAMES[quality]
         
         # Add additional SuperScale properties if available
         for prop in ["superScaleOverrideWidth", "superScaleOverrideHeight"]:
@@ -356,22 +567,15 @@ def set_superscale_settings(project_obj, enabled: bool, quality: int = 0) -> boo
     
     try:
         # Validate quality value
-        if quality not in [0, 1, 2]:
+        if quality not in PROPERTY_ENUMS["superScaleQuality"]:
             logger.warning(f"Invalid SuperScale quality value: {quality}. Using 0 (Auto)")
             quality = 0
         
-        # Set SuperScale properties
-        success = True
-        
-        # Set enabled state
-        if not set_project_property(project_obj, "superScaleEnabled", enabled):
-            success = False
-        
-        # Set quality
-        if not set_project_property(project_obj, "superScaleQuality", quality):
-            success = False
-        
-        return success
+        # Set enabled state and quality
+        return _set_properties(project_obj, (
+            ("superScaleEnabled", enabled),
+            ("superScaleQuality", quality),
+        ))
         
     except Exception as e:
         logger.error(f"Error setting SuperScale settings: {str(e)}")
@@ -392,16 +596,9 @@ def get_color_settings(project_obj) -> Dict[str, Any]:
     
     try:
         # Get color-related settings
+        settings_snapshot(project_obj)
         settings = {}
-        color_properties = [
-            "colorScienceMode",
-            "timelineColorSpace",
-            "timelineGamma",
-            "inputDRT",
-            "outputDRT"
-        ]
-        
-        for prop in color_properties:
+        for prop in _COLOR_PROPERTIES:
             value = get_project_property(project_obj, prop)
             if value is not None:
                 settings[prop] = value
@@ -409,14 +606,8 @@ def get_color_settings(project_obj) -> Dict[str, Any]:
         # Translate colorScienceMode to descriptive name
         if "colorScienceMode" in settings:
             mode = settings["colorScienceMode"]
-            mode_names = {
-                0: "DaVinci YRGB",
-                1: "DaVinci YRGB Color Managed",
-                2: "ACEScct"
-            }
-            
-            if mode in mode_names:
-                settings["colorScienceName"] = mode_names[mode]
+            if mode in _COLOR_SCIENCE_NAMES:
+                settings["colorScienceName"] = _COLOR_SCIENCE_NAMES[mode]
         
         return settings
         
@@ -439,23 +630,13 @@ def set_color_science_mode(project_obj, mode: str) -> bool:
         return False
     
     try:
-        # Map string modes to numeric values
-        mode_values = {
-            "YRGB": 0,
-            "DaVinci YRGB": 0,
-            "YRGB Color Managed": 1,
-            "DaVinci YRGB Color Managed": 1,
-            "ACEScct": 2,
-            "ACES": 2
-        }
-        
         # Get numeric value
         mode_value = None
         
-        if isinstance(mode, int) and 0 <= mode <= 2:
+        if isinstance(mode, int) and mode in PROPERTY_ENUMS["colorScienceMode"]:
             mode_value = mode
         elif isinstance(mode, str):
-            mode_value = mode_values.get(mode)
+            mode_value = _COLOR_SCIENCE_VALUES.get(mode)
         
         if mode_value is None:
             logger.error(f"Invalid color science mode: {mode}")
@@ -484,18 +665,11 @@ def set_color_space(project_obj, color_space: str, gamma: str = None) -> bool:
         return False
     
     try:
-        success = True
-        
-        # Set timeline color space
-        if not set_project_property(project_obj, "timelineColorSpace", color_space):
-            success = False
-        
-        # Set gamma if provided
+        # Set timeline color space, and gamma if provided
+        values = [("timelineColorSpace", color_space)]
         if gamma is not None:
-            if not set_project_property(project_obj, "timelineGamma", gamma):
-                success = False
-        
-        return success
+            values.append(("timelineGamma", gamma))
+        return _set_properties(project_obj, values)
         
     except Exception as e:
         logger.error(f"Error setting color space: {str(e)}")
@@ -571,25 +745,32 @@ def get_project_info(project_obj) -> Dict[str, Any]:
         # Get project name
         project_name = project_obj.GetName()
         
+        metadata = get_project_metadata(project_obj)
         # Combine all project information
         project_info = {
             "name": project_name,
-            "metadata": get_project_metadata(project_obj),
+            "metadata": metadata,
             "settings": get_all_project_properties(project_obj),
             "timelines": []
         }
         
-        # Add timeline information
-        timeline_count = project_obj.GetTimelineCount()
-        current_timeline = project_obj.GetCurrentTimeline()
-        current_timeline_name = current_timeline.GetName() if current_timeline else None
+        # Add timeline information. The metadata pass has already read the
+        # current timeline's name and the count whenever a timeline is open.
+        if "currentTimeline" in metadata:
+            current_timeline_name = metadata["currentTimeline"]
+            timeline_count = metadata["timelineCount"]
+        else:
+            current_timeline = project_obj.GetCurrentTimeline()
+            current_timeline_name = current_timeline.GetName() if current_timeline else None
+            timeline_count = project_obj.GetTimelineCount()
         
         for i in range(1, timeline_count + 1):
             timeline = project_obj.GetTimelineByIndex(i)
             if timeline:
+                timeline_name = timeline.GetName()
                 timeline_info = {
-                    "name": timeline.GetName(),
-                    "isCurrent": timeline.GetName() == current_timeline_name,
+                    "name": timeline_name,
+                    "isCurrent": timeline_name == current_timeline_name,
                     "duration": timeline.GetEndFrame() - timeline.GetStartFrame() + 1
                 }
                 project_info["timelines"].append(timeline_info)
@@ -0,0 +1,105 @@
+"""Short-lived memo of a project's render formats, codecs and preset names.
+
+`GetRenderFormats()`, `GetRenderCodecs(format_id)` and `GetRenderPresetList()`
+answer from the install, not from anything a tool call changes: formats and
+codecs move only when an IO plugin is installed (which needs a restart), and
+presets only when one is saved, deleted or imported. Yet resolving one
+display-name pair costs a formats read plus a codecs read, and the render
+actions do that on every call.
+
+Entries are keyed by the project's `GetUniqueId()` (its name when that is
+unavailable), never by the wrapper object: `GetCurrentProject()` hands back a
+new wrapper on every tool call, so an identity key would never hit twice. A
+cached read therefore still costs that one identity call, but not the format
+and codec reads behind it. A project with neither an id nor a name is not
+cached at all. Callers that create or remove presets call `invalidate_render_catalogue` for
+that kind only; anything done in Resolve's own UI ages out with the TTL. Job
+queue changes and LoadRenderPreset/SetRenderSettings alter none of these
+lists, so they invalidate nothing and the catalogue stays warm across them.
+
+Shared by the compound and granular servers, like `render_ids`.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
+
+__all__ = [
+    "RENDER_CATALOGUE_TTL",
+    "cached_render_formats",
+    "cached_render_codecs",
+    "cached_render_presets",
+    "cached_render_preset_names",
+    "invalidate_render_catalogue",
+]
+
+#: Seconds a catalogue read is reused for.
+RENDER_CATALOGUE_TTL = 30.0
+
+# (project key, kind, arg) -> (value, taken_at)
+_catalogue: Dict[Tuple[str, str, Any], Tuple[Any, float]] = {}
+
+
+def _project_key(project: Any) -> Optional[str]:
+    for getter in ("GetUniqueId", "GetName"):
+        try:
+            value = getattr(project, getter)()
+        except Exception:
+            continue
+        if value:
+            return f"{getter}:{value}"
+    return None
+
+
+def _cached(project: Any, kind: str, arg: Any, fetch: Callable[[], Any]) -> Any:
+    project_key = _project_key(project)
+    if project_key is None:
+        return fetch()
+    key = (project_key, kind, arg)
+    now = time.monotonic()
+    entry = _catalogue.get(key)
+    if entry is not None and now - entry[1] < RENDER_CATALOGUE_TTL:
+        return entry[0]
+    value = fetch()
+    for stale, cached in list(_catalogue.items()):
+        if now - cached[1] >= RENDER_CATALOGUE_TTL:
+            del _catalogue[stale]
+    _catalogue[key] = (value, now)
+    return value
+
+
+def cached_render_formats(project: Any) -> Dict[Any, Any]:
+    """`GetRenderFormats()` as a fresh dict, read at most once per TTL."""
+    return dict(_cached(project, "formats", None, lambda: project.GetRenderFormats() or {}))
+
+
+def cached_render_codecs(project: Any, format_id: str) -> Dict[Any, Any]:
+    """`GetRenderCodecs(format_id)` as a fresh dict, read at most once per TTL."""
+    return dict(_cached(project, "codecs", format_id, lambda: project.GetRenderCodecs(format_id) or {}))
+
+
+def _preset_entry(project: Any) -> Tuple[Tuple[Any, ...], FrozenSet[str]]:
+    presets = tuple(project.GetRenderPresetList() or ())
+    return presets, frozenset(str(name) for name in presets)
+
+
+def cached_render_presets(project: Any) -> List[Any]:
+    """`GetRenderPresetList()` as a fresh list, read at most once per TTL."""
+    return list(_cached(project, "presets", None, lambda: _preset_entry(project))[0])
+
+
+def cached_render_preset_names(project: Any) -> FrozenSet[str]:
+    """The same preset list as a set of names, for membership checks."""
+    return _cached(project, "presets", None, lambda: _preset_entry(project))[1]
+
+
+def invalidate_render_catalogue(project: Optional[Any] = None, kind: Optional[str] = None) -> None:
+    """Drop entries for `project` (every project when None), optionally one `kind` only."""
+    project_key = _project_key(project) if project is not None else None
+    for key in list(_catalogue):
+        if project is not None and key[0] != project_key:
+            continue
+        if kind is not None and key[1] != kind:
+            continue
+        del _catalogue[key]
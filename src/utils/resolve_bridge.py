@@ -110,6 +110,13 @@ PARENT_MARKERS = ("resolve", "fuscript", "fusion")
 
 _NONCE_RE = re.compile(r"^[A-Za-z0-9_-]{16,128}$")
 _SIGNATURE_RE = re.compile(r"^[0-9a-f]{64}$")
+# Built once: `json.dumps` with any non-default option constructs a fresh
+# encoder per call, and every request is signed on both ends.
+_CANONICAL_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"), ensure_ascii=True)
+# Replies are never signed and the client decodes them into dicts, so key
+# order buys nothing; sorting every nested dict of a list_media-sized reply
+# was about a fifth of its encode time, spent on Resolve's side.
+_REPLY_ENCODER = json.JSONEncoder(separators=(",", ":"))
 
 
 class BridgeConfigError(RuntimeError):
@@ -122,7 +129,7 @@ class BridgeConfigError(RuntimeError):
 def canonical_request(request: Dict[str, Any]) -> bytes:
     """The exact signed representation — everything except the signature."""
     unsigned = {k: v for k, v in request.items() if k != "signature"}
-    return json.dumps(unsigned, sort_keys=True, separators=(",", ":"), ensure_ascii=True).encode("utf-8")
+    return _CANONICAL_ENCODER.encode(unsigned).encode("utf-8")
 
 
 def sign_request(token: str, request: Dict[str, Any]) -> str:
@@ -531,7 +538,7 @@ class _Handler(socketserver.StreamRequestHandler):
             bridge.release_slot()
 
     def _write(self, payload: Dict[str, Any]) -> None:
-        self.wfile.write((json.dumps(payload, sort_keys=True, separators=(",", ":")) + "\n").encode("utf-8"))
+        self.wfile.write((_REPLY_ENCODER.encode(payload) + "\n").encode("utf-8"))
 
 
 class _Server(socketserver.ThreadingTCPServer):
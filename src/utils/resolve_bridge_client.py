@@ -37,6 +37,7 @@ proxy deliberately does not.
 
 from __future__ import annotations
 
+import itertools
 import json
 import logging
 import os
@@ -44,7 +45,6 @@ import secrets
 import socket
 import threading
 import time
-import uuid
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -70,6 +70,9 @@ REQUIRED_BRIDGE_OPERATIONS = ("call", "list_methods", "release_handles", "health
 
 DEFAULT_TIMEOUT_SECONDS = 30.0
 
+# Built once rather than per request, as json.dumps does for non-default options.
+_WIRE_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
 
 class BridgeUnavailable(RuntimeError):
     """The in-Resolve bridge could not be reached. Not a fallback condition."""
@@ -117,18 +120,23 @@ class BridgeTransport:
         # keeps request/response pairing simple and matches the _bridge_lock
         # discipline the rest of the server already follows.
         self._lock = threading.RLock()
+        # The id only pairs a reply with its request — the nonce is what carries
+        # the randomness replay protection needs — so a per-transport counter
+        # does the job without a uuid4 per call.
+        self._id_prefix = secrets.token_hex(4)
+        self._ids = itertools.count(1)
 
     def request(self, operation: str, arguments: Dict[str, Any]) -> Any:
         payload = {
             "protocol": _bridge.PROTOCOL_VERSION,
-            "id": str(uuid.uuid4()),
+            "id": f"{self._id_prefix}-{next(self._ids)}",
             "timestamp": int(time.time()),
             "nonce": secrets.token_urlsafe(24),
             "operation": operation,
             "arguments": arguments,
         }
         payload["signature"] = _bridge.sign_request(self._token, payload)
-        line = (json.dumps(payload, separators=(",", ":")) + "\n").encode("utf-8")
+        line = (_WIRE_ENCODER.encode(payload) + "\n").encode("utf-8")
         if len(line) > _bridge.MAX_REQUEST_BYTES:
             raise BridgeCallError("request_too_large", "request exceeds the bridge limit")
 
@@ -167,6 +167,11 @@ class ResolveOperations:
     #: was written to measure.
     LIFECYCLE_OPERATIONS = ("shutdown", "reload")
     OPERATIONS = READ_OPERATIONS + WRITE_OPERATIONS + PROXY_OPERATIONS + LIFECYCLE_OPERATIONS
+    # The surface is fixed per class, so `health` and the not-allowed error
+    # report these pre-sorted names rather than re-sorting on every request.
+    _SORTED_OPERATIONS = tuple(sorted(OPERATIONS))
+    _SORTED_READ_OPERATIONS = tuple(sorted(READ_OPERATIONS))
+    _SORTED_WRITE_OPERATIONS = tuple(sorted(WRITE_OPERATIONS))
 
     #: Handle-table ceiling. Every entry pins a live Resolve proxy object, so an
     #: unbounded table is a memory leak inside Resolve that grows with every
@@ -210,7 +215,7 @@ class ResolveOperations:
             raise OperationError(
                 "operation_not_allowed",
                 f"operation {operation!r} is not exposed by this bridge",
-                available=sorted(self.OPERATIONS),
+                available=list(self._SORTED_OPERATIONS),
             )
         if arguments is None:
             arguments = {}
@@ -253,6 +258,8 @@ class ResolveOperations:
             candidate = self._call(project, "GetTimelineByIndex", index)
             if candidate is not None and self._call(candidate, "GetName") == name:
                 matches.append(candidate)
+                if len(matches) > 1:
+                    break  # a second match already settles it as ambiguous
         if not matches:
             raise OperationError("not_found", f"timeline {name!r} was not found")
         if len(matches) > 1:
@@ -281,9 +288,9 @@ class ResolveOperations:
             "session": self._session,
             # The caller discovers the surface rather than assuming parity with
             # the direct transport — this bridge is deliberately a subset.
-            "operations": sorted(self.OPERATIONS),
-            "read_operations": sorted(self.READ_OPERATIONS),
-            "write_operations": sorted(self.WRITE_OPERATIONS),
+            "operations": list(self._SORTED_OPERATIONS),
+            "read_operations": list(self._SORTED_READ_OPERATIONS),
+            "write_operations": list(self._SORTED_WRITE_OPERATIONS),
             # False when nothing owns the listener, so a client can tell
             # "this bridge cannot be stopped remotely" from "I forgot to ask".
             "lifecycle_available": self._lifecycle is not None,
@@ -309,14 +316,11 @@ class ResolveOperations:
 
     def op_get_project(self, _arguments: Dict[str, Any]) -> Dict[str, Any]:
         project = self._project()
+        current = self._call(project, "GetCurrentTimeline")
         return {
             "name": self._call(project, "GetName"),
             "timeline_count": int(self._call(project, "GetTimelineCount") or 0),
-            "current_timeline": (
-                self._call(self._call(project, "GetCurrentTimeline"), "GetName")
-                if self._call(project, "GetCurrentTimeline") is not None
-                else None
-            ),
+            "current_timeline": self._call(current, "GetName") if current is not None else None,
         }
 
     def op_list_timelines(self, _arguments: Dict[str, Any]) -> Dict[str, Any]:
@@ -706,9 +710,9 @@ class ResolveOperations:
 
 
 def make_dispatch(operations: ResolveOperations) -> Callable[[str, Dict[str, Any]], Any]:
-    """Adapt a `ResolveOperations` into the callable `Bridge` expects."""
+    """Adapt a `ResolveOperations` into the callable `Bridge` expects.
 
-    def dispatch(operation: str, arguments: Dict[str, Any]) -> Any:
-        return operations.dispatch(operation, arguments)
-
-    return dispatch
+    The bound method already has that shape; wrapping it only added a frame to
+    every request.
+    """
+    return operations.dispatch
@@ -25,6 +25,7 @@ from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from src.utils import strata, timeline_brain_db
 from src.utils.proc import safe_run
+from src.utils.transcript_edit import FILLER_WORDS
 
 logger = logging.getLogger("resolve-mcp.strata-analyzers")
 
@@ -56,7 +57,7 @@ CURVE_RATE = 1.0 / HOP_SECONDS
 # not a pause; longer than PAUSE_MAX it is silence/room, not a beat the editor
 # cuts on — still recorded, capped payload marks it.
 PAUSE_MIN_SECONDS = 0.35
-HESITATION_WORDS = {"uh", "um", "er", "erm", "uhm", "hmm", "mm", "mhm", "ah", "eh"}
+HESITATION_WORDS = FILLER_WORDS
 
 PITCH_MIN_HZ = 60.0
 PITCH_MAX_HZ = 400.0
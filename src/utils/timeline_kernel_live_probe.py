@@ -26,7 +26,7 @@ from typing import Any, Dict, Iterable, List, Optional, Tuple
 from src.utils.timeline_kernel_probe import (
     ProbeRecorder,
     ordered_unique,
-    parse_api_class_methods,
+    parse_api_classes_methods,
     parse_timeline_item_property_keys,
     render_markdown_report,
     utc_timestamp,
@@ -961,8 +961,9 @@ def run_probe(server, output_dir: Path, keep_open: bool = False) -> Dict[str, An
             local_property_keys.extend(keys)
         property_keys = ordered_unique(documented_property_keys + local_property_keys + list(PROPERTY_CANDIDATES))
 
-        timeline_methods = ordered_unique(parse_api_class_methods(api_text, "Timeline") + EXTRA_TIMELINE_METHODS)
-        timeline_item_methods = ordered_unique(parse_api_class_methods(api_text, "TimelineItem") + EXTRA_TIMELINE_ITEM_METHODS)
+        documented_methods = parse_api_classes_methods(api_text, ["Timeline", "TimelineItem"])
+        timeline_methods = ordered_unique(documented_methods["Timeline"] + EXTRA_TIMELINE_METHODS)
+        timeline_item_methods = ordered_unique(documented_methods["TimelineItem"] + EXTRA_TIMELINE_ITEM_METHODS)
         _record_method_availability(recorder, timeline, "runtime_methods.timeline", "Timeline", timeline_methods)
         _record_method_availability(recorder, source_item, "runtime_methods.timeline_item.video", "TimelineItem", timeline_item_methods)
         _record_method_availability(recorder, audio_item, "runtime_methods.timeline_item.audio", "TimelineItem", timeline_item_methods)
@@ -21,6 +21,12 @@ PROBE_STATUSES = {
 }
 
 
+# Compiled once: the parsers below run over the full API reference text.
+_PROPERTY_KEY_RE = re.compile(r'^\s+"([^"]+)"\s*:', re.MULTILINE)
+_CLASS_HEADING_RE = re.compile(r"[A-Za-z][A-Za-z0-9_]*")
+_METHOD_RE = re.compile(r"\s+([A-Za-z_][A-Za-z0-9_]*)\s*\(")
+
+
 def utc_timestamp() -> str:
     return datetime.now(timezone.utc).isoformat(timespec="seconds")
 
@@ -34,36 +40,40 @@ def parse_timeline_item_property_keys(api_text: str) -> List[str]:
         return []
     end = api_text.find(end_marker, start)
     section = api_text[start:end if end >= 0 else None]
-    keys: List[str] = []
-    for match in re.finditer(r'^\s+"([^"]+)"\s*:', section, flags=re.MULTILINE):
-        key = match.group(1)
-        if key not in keys:
-            keys.append(key)
-    return keys
+    return list(dict.fromkeys(match.group(1) for match in _PROPERTY_KEY_RE.finditer(section)))
 
 
 def parse_api_class_methods(api_text: str, class_name: str) -> List[str]:
     """Return method names documented under a top-level API class section."""
-    lines = api_text.splitlines()
-    start_index: Optional[int] = None
-    for index, line in enumerate(lines):
-        if line.strip() == class_name:
-            start_index = index + 1
-            break
-    if start_index is None:
-        return []
+    return parse_api_classes_methods(api_text, [class_name])[class_name]
+
+
+def parse_api_classes_methods(api_text: str, class_names: Iterable[str]) -> Dict[str, List[str]]:
+    """Return documented method names for each of `class_names` in one pass.
 
-    methods: List[str] = []
-    for line in lines[start_index:]:
+    A section starts after the first line equal to the class name and ends at
+    the next unindented identifier line, as in `parse_api_class_methods`.
+    """
+    pending = set(class_names)
+    methods: Dict[str, Dict[str, None]] = {name: {} for name in pending}
+    active: List[str] = []
+    for line in api_text.splitlines():
         stripped = line.strip()
-        if stripped and not line.startswith(" ") and re.fullmatch(r"[A-Za-z][A-Za-z0-9_]*", stripped):
-            break
-        match = re.match(r"\s+([A-Za-z_][A-Za-z0-9_]*)\s*\(", line)
+        if active and stripped and not line.startswith(" ") and _CLASS_HEADING_RE.fullmatch(stripped):
+            active = []
+        if stripped in pending:
+            pending.discard(stripped)
+            active.append(stripped)
+            continue
+        if not active:
+            if not pending:
+                break
+            continue
+        match = _METHOD_RE.match(line)
         if match:
-            method = match.group(1)
-            if method not in methods:
-                methods.append(method)
-    return methods
+            for name in active:
+                methods[name].setdefault(match.group(1))
+    return {name: list(found) for name, found in methods.items()}
 
 
 def ordered_unique(values: Iterable[str]) -> List[str]:
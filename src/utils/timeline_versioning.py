@@ -30,7 +30,7 @@ import os
 import re
 import time
 import uuid
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from src.utils import actor_identity, timeline_brain_db
 
@@ -84,26 +84,35 @@ def _archive_bin_path(media_pool: Any) -> str:
 # ── Timeline lookup ──────────────────────────────────────────────────────────
 
 
-def _list_all_timelines(project: Any) -> List[Any]:
+def _iter_timelines(project: Any) -> Iterator[Any]:
+    """Timelines in index order, fetched lazily so a lookup can stop early."""
     count = project.GetTimelineCount()
     if count is None:
-        return []
-    out = []
+        return
     for i in range(1, int(count) + 1):
         tl = project.GetTimelineByIndex(i)
         if tl is not None:
-            out.append(tl)
-    return out
+            yield tl
 
 
-def _find_timeline_by_name(project: Any, name: str) -> Optional[Any]:
-    for tl in _list_all_timelines(project):
+def _find_timelines_by_name(project: Any, *names: str) -> Dict[str, Any]:
+    """First timeline for each of `names`, in one pass that stops once all are found."""
+    wanted = set(names)
+    found: Dict[str, Any] = {}
+    for tl in _iter_timelines(project):
         try:
-            if tl.GetName() == name:
-                return tl
+            tl_name = tl.GetName()
         except Exception:
             continue
-    return None
+        if tl_name in wanted and tl_name not in found:
+            found[tl_name] = tl
+            if len(found) == len(wanted):
+                break
+    return found
+
+
+def _find_timeline_by_name(project: Any, name: str) -> Optional[Any]:
+    return _find_timelines_by_name(project, name).get(name)
 
 
 # ── Public API ───────────────────────────────────────────────────────────────
@@ -142,7 +151,7 @@ def archive_current_timeline(
     # leave `<name>_archived_vNN` timelines the DB has never heard of. A name
     # collision makes DuplicateTimeline fail AND raises a blocking modal dialog
     # in the Resolve UI, so bump past every suffix that exists in the project.
-    for existing_tl in _list_all_timelines(project):
+    for existing_tl in _iter_timelines(project):
         try:
             m = ARCHIVED_SUFFIX_PATTERN.match(existing_tl.GetName())
         except Exception:
@@ -471,10 +480,11 @@ def diff_timelines(
     For moved/trimmed to mean anything the timelines should share source
     clips; for unrelated timelines everything reports as added/removed.
     """
-    from_tl = _find_timeline_by_name(project, from_timeline)
+    found = _find_timelines_by_name(project, from_timeline, to_timeline)
+    from_tl = found.get(from_timeline)
     if from_tl is None:
         return {"success": False, "error": f"Timeline '{from_timeline}' not found"}
-    to_tl = _find_timeline_by_name(project, to_timeline)
+    to_tl = found.get(to_timeline)
     if to_tl is None:
         return {"success": False, "error": f"Timeline '{to_timeline}' not found"}
     before = capture_timeline_clip_usage(from_tl)
@@ -66,7 +66,9 @@ def _full_file_elements(seq: ET.Element) -> Dict[str, ET.Element]:
     out: Dict[str, ET.Element] = {}
     for f in seq.iter("file"):
         fid = f.get("id")
-        if fid and len(list(f)) and f.find("pathurl") is not None and fid not in out:
+        # A pathurl child already implies a full definition, so one find()
+        # covers what a separate child-count check used to.
+        if fid and fid not in out and f.find("pathurl") is not None:
             out[fid] = f
     return out
 
@@ -219,8 +221,9 @@ def _build_file_map(seq: ET.Element) -> Dict[str, str]:
         if not fid:
             continue
         # A full definition has child elements and a pathurl; a bare reference does not.
-        if len(list(f)) and f.find("pathurl") is not None:
-            file_map[fid] = f.findtext("pathurl")
+        pathurl = f.find("pathurl")
+        if pathurl is not None:
+            file_map[fid] = pathurl.text or ""
     return file_map
 
 
@@ -43,14 +43,10 @@ from __future__ import annotations
 import re
 from typing import Any, Dict, List, Optional, Sequence, Tuple
 
-#: Filler words. Shared with the strata analyzer's set so the two agree; kept as
-#: a local import to avoid a heavy module-level dependency.
-try:
-    from src.utils.strata_analyzers import HESITATION_WORDS as _HESITATION_WORDS
-except Exception:  # pragma: no cover - defensive; the set is small enough to inline
-    _HESITATION_WORDS = {"uh", "um", "er", "erm", "uhm", "hmm", "mm", "mhm", "ah", "eh"}
-
-FILLER_WORDS = frozenset(_HESITATION_WORDS)
+#: Filler words. Owned here and imported by the strata analyzer so the two
+#: agree — the other way round, importing this module dragged in numpy and the
+#: analyzer stack on every server start.
+FILLER_WORDS = frozenset({"uh", "um", "er", "erm", "uhm", "hmm", "mm", "mhm", "ah", "eh"})
 
 #: Trailing verbal tics — removable only at a phrase end, where they are padding.
 #: Mid-phrase they usually carry meaning ("you know what I mean").
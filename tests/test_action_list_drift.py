@@ -87,8 +87,14 @@ def _listed_actions(fn, consts):
 
 
 class ActionListDriftTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # server.py is large enough that a parse is most of each test's cost;
+        # both checks only read the tree, so they share one.
+        cls.tree = ast.parse(SERVER.read_text())
+
     def test_unknown_action_lists_match_dispatch(self):
-        tree = ast.parse(SERVER.read_text())
+        tree = self.tree
         consts = _module_list_constants(tree)
         problems = []
         checked_names = []
@@ -124,7 +130,7 @@ class ActionListDriftTest(unittest.TestCase):
         because of exactly this — the panel proxied to the helpers directly,
         which masked it. Guard the whole class.
         """
-        tree = ast.parse(SERVER.read_text())
+        tree = self.tree
         problems = []
 
         def membership_set(test):
@@ -0,0 +1,46 @@
+"""Tests for the bin-summary writer in src/utils/analysis_memory.py."""
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from src.utils import analysis_memory
+
+
+class RegenerateBinSummaryTests(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp(prefix="bin-summary-test-")
+        self.addCleanup(shutil.rmtree, self.root, True)
+
+    def _analysis(self, name, report):
+        path = os.path.join(self.root, f"{name}.json")
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(report, handle)
+        return path
+
+    def test_each_analysis_is_read_once(self):
+        report = {"visual": {
+            "clip_summary": {"paragraph": "Wide establishing shot."},
+            "editorial_classification": {"primary_use": "establishing", "select_potential": "high"},
+        }}
+        manifest = {"clips": [
+            {"record": {"clip_name": "A", "clip_id": "a", "duration_seconds": 12},
+             "analysis_json": self._analysis("a", report)},
+            {"record": {"clip_name": "B", "clip_id": "b"},
+             "analysis_json": os.path.join(self.root, "missing.json")},
+        ]}
+        with mock.patch.object(analysis_memory.json, "load", wraps=json.load) as load:
+            result = analysis_memory.regenerate_bin_summary_from_manifest(self.root, manifest)
+        self.assertTrue(result["success"])
+        self.assertEqual(load.call_count, 1)
+        self.assertEqual(result["pending_vision_count"], 1)
+        with open(result["path"], encoding="utf-8") as handle:
+            text = handle.read()
+        self.assertIn("Wide establishing shot.", text)
+        self.assertIn("_Summary not yet available", text)
+
+
+if __name__ == "__main__":
+    unittest.main()
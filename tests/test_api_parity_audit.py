@@ -0,0 +1,43 @@
+"""Tests for the API-docs-vs-source parity audit logic."""
+import importlib.util
+import os
+import unittest
+from pathlib import Path
+
+_SPEC = importlib.util.spec_from_file_location(
+    "audit_parity",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                 "scripts", "audit_api_parity.py"),
+)
+audit_parity = importlib.util.module_from_spec(_SPEC)
+_SPEC.loader.exec_module(audit_parity)
+
+
+class MissingMethodsTest(unittest.TestCase):
+    def test_only_exact_call_sites_count(self):
+        docs = {"Timeline": {"GetName", "GetTrackCount", "AddMarker"}}
+        src = "tl.GetName()\ntl.GetTrackCountAll('video')\n# AddMarker is mentioned only\n"
+        missing = audit_parity.find_methods_missing_from_source(docs, src)
+        self.assertEqual(missing, {"Timeline": {"GetTrackCount", "AddMarker"}})
+
+    def test_nothing_missing_when_every_method_is_called(self):
+        docs = {"Project": {"GetName"}, "Timeline": {"GetName", "SetName"}}
+        src = "p.GetName(); tl.SetName('x')"
+        self.assertEqual(audit_parity.find_methods_missing_from_source(docs, src), {})
+
+
+class SharedSourcesTest(unittest.TestCase):
+    def test_checks_work_from_one_read_of_each_file(self):
+        root = audit_parity.REPO_ROOT
+        sources = [(root / "src" / "a.py", "from api.media import thing\nclip.GetFancyThing()\n")]
+        self.assertEqual(audit_parity.find_broken_api_imports(sources),
+                         [(Path("src/a.py"), 1, "from api.media import thing")])
+        self.assertEqual(
+            audit_parity.find_undocumented_method_wrappers({}, "", sources),
+            [("src/a.py", "GetFancyThing", 2)],
+        )
+        self.assertEqual(audit_parity.collect_source_text(sources), sources[0][1])
+
+
+if __name__ == "__main__":
+    unittest.main()
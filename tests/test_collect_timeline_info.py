@@ -0,0 +1,57 @@
+"""Tests for the compound server's created/duplicated timeline summary."""
+import unittest
+
+from src import server as s
+
+
+class FakeTimeline:
+    def __init__(self):
+        self.calls = []
+
+    def GetName(self):
+        self.calls.append("GetName")
+        return "Edit"
+
+    def GetStartFrame(self):
+        self.calls.append("GetStartFrame")
+        return 86400
+
+    def GetEndFrame(self):
+        self.calls.append("GetEndFrame")
+        return 86520.0
+
+    def GetUniqueId(self):
+        return "tl-1"
+
+    def GetTrackCount(self, track_type):
+        self.calls.append(f"GetTrackCount:{track_type}")
+        return {"video": 2, "audio": None}[track_type]
+
+
+class CollectTimelineInfoTests(unittest.TestCase):
+    def test_default_reads_only_the_name(self):
+        tl = FakeTimeline()
+        self.assertEqual(s._collect_timeline_info(tl), {"name": "Edit"})
+        self.assertEqual(tl.calls, ["GetName"])
+
+    def test_verbose_adds_frame_range_and_track_counts(self):
+        self.assertEqual(s._collect_timeline_info(FakeTimeline(), verbose=True), {
+            "name": "Edit",
+            "start_frame": 86400,
+            "end_frame": 86520,
+            "video_tracks": 2,
+            "audio_tracks": 0,
+        })
+
+
+class CreatedTimelineResultTests(unittest.TestCase):
+    def test_requested_name_is_normalized_once(self):
+        out = s._created_timeline_result(FakeTimeline(), {"name": 2024}, None)
+        self.assertEqual(out["requested_name"], "2024")
+        self.assertFalse(out["versioned_name"])
+        out = s._created_timeline_result(FakeTimeline(), {"name": " Edit "}, object())
+        self.assertEqual((out["requested_name"], out["versioned_name"], out["id"]), ("Edit", True, "tl-1"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+"""The compound server's _check() fetches the ProjectManager once per handle."""
+import unittest
+from unittest import mock
+
+from src import server as s
+
+
+class FakeProject:
+    pass
+
+
+class FakePM:
+    def __init__(self):
+        self.project = FakeProject()
+
+    def GetCurrentProject(self):
+        return self.project
+
+    def GetFolderListInCurrentFolder(self):
+        return []
+
+
+class FakeResolve:
+    def __init__(self):
+        self.pm_calls = 0
+
+    def GetProjectManager(self):
+        self.pm_calls += 1
+        return FakePM()
+
+
+class CompoundPMCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.addCleanup(s._invalidate_pm_cache)
+        busy = mock.patch.object(s.resolve_busy, "wait_until_free", return_value=None)
+        busy.start()
+        self.addCleanup(busy.stop)
+
+    def test_project_manager_is_fetched_once_per_handle(self):
+        fake = FakeResolve()
+        with mock.patch.object(s, "get_resolve", return_value=fake):
+            for _ in range(3):
+                pm, proj, err = s._check()
+                self.assertIsNone(err)
+                self.assertIsInstance(proj, FakeProject)
+        self.assertEqual(fake.pm_calls, 1)
+
+    def test_new_handle_refetches(self):
+        old, new = FakeResolve(), FakeResolve()
+        with mock.patch.object(s, "get_resolve", return_value=old):
+            s._check()
+        with mock.patch.object(s, "get_resolve", return_value=new):
+            s._check()
+        self.assertEqual((old.pm_calls, new.pm_calls), (1, 1))
+
+    def test_missing_project_manager_is_not_memoised(self):
+        fake = FakeResolve()
+        fake.GetProjectManager = lambda: None
+        with mock.patch.object(s, "get_resolve", return_value=fake):
+            _, _, err = s._check()
+        self.assertIsNotNone(err)
+        self.assertIsNone(s._pm_cache["pm"])
+
+    def test_tools_that_skip_check_share_the_memo(self):
+        fake = FakeResolve()
+        with mock.patch.object(s, "get_resolve", return_value=fake):
+            s._check()
+            for _ in range(2):
+                self.assertEqual(s.project_manager_folders("list", {}), {"folders": []})
+        self.assertEqual(fake.pm_calls, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
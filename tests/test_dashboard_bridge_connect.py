@@ -34,10 +34,13 @@ class DashboardBridgeConnectTest(unittest.TestCase):
         # The env probe is cached per process; start each test from scratch.
         self._env_ready = dash._RESOLVE_ENV_READY
         dash._RESOLVE_ENV_READY = True
+        self._dvr_import = dash._DVR_IMPORT
+        dash._DVR_IMPORT = None
 
     def tearDown(self):
         sys.meta_path.remove(self._blocker)
         dash._RESOLVE_ENV_READY = self._env_ready
+        dash._DVR_IMPORT = self._dvr_import
 
     def test_bridge_mode_connects_without_blackmagics_module(self):
         # Driven through the real env var rather than by patching the helper,
@@ -69,6 +72,18 @@ class DashboardBridgeConnectTest(unittest.TestCase):
         # Launching Resolve cannot start the listener, so it must not be advised.
         self.assertNotIn("Open Resolve Studio", error)
 
+    def test_import_outcome_is_decided_once_per_process(self):
+        with mock.patch.dict("os.environ", {"DAVINCI_RESOLVE_BRIDGE": "0"}):
+            dash._connect_resolve_read_only()
+            # Unblocked now, but the module is not looked for again.
+            sys.meta_path.remove(self._blocker)
+            try:
+                with mock.patch.dict(sys.modules, {"DaVinciResolveScript": object()}):
+                    _, error = dash._connect_resolve_read_only()
+            finally:
+                sys.meta_path.insert(0, self._blocker)
+        self.assertIn("Resolve scripting API unavailable", error)
+
     def test_studio_message_does_not_assume_studio_only(self):
         message = dash._not_connected_message(False)
         self.assertIn("External scripting", message)
@@ -1,5 +1,8 @@
 """Tests for dashboard transport status/start/stop helpers."""
+import http.client
+import threading
 import unittest
+from http.server import ThreadingHTTPServer
 
 import src.analysis_dashboard as dash
 from src.utils import mcp_transport as T
@@ -43,5 +46,27 @@ class DashboardTransportTest(unittest.TestCase):
         self.assertTrue(out["success"])
 
 
+class DashboardKeepAliveTest(unittest.TestCase):
+    def test_polls_reuse_one_connection(self):
+        server = ThreadingHTTPServer(("127.0.0.1", 0), dash.Handler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        conn = http.client.HTTPConnection("127.0.0.1", server.server_address[1], timeout=5)
+        self.addCleanup(conn.close)
+        conn.request("GET", "/")
+        first = conn.getresponse()
+        first.read()
+        self.assertFalse(first.will_close)
+        sock = conn.sock
+        self.assertIsNotNone(sock)
+        conn.request("GET", "/")
+        second = conn.getresponse()
+        self.assertEqual((first.status, second.status), (200, 200))
+        self.assertGreater(len(second.read()), 0)
+        self.assertIs(conn.sock, sock)
+
+
 if __name__ == "__main__":
     unittest.main()
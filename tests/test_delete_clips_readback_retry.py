@@ -159,6 +159,12 @@ class HelperTest(unittest.TestCase):
         self.assertTrue(ok)
         self.assertEqual(tl.calls, 2)
 
+    def test_retry_readback_reuses_the_item_ids(self):
+        with mock.patch.object(s, "_timeline_item_id_set", wraps=s._timeline_item_id_set) as read_ids:
+            ok, tl = self._run([(False, False), (False, True)])
+        self.assertTrue(ok)
+        self.assertEqual(read_ids.call_count, 1)
+
     def test_both_calls_noop_fails(self):
         ok, tl = self._run([(False, False), (False, False)])
         self.assertFalse(ok)
@@ -192,10 +198,10 @@ class HelperTest(unittest.TestCase):
         original = s._timeline_items_presence
         seen = []
 
-        def blind_second_time(timeline, targets):
+        def blind_second_time(timeline, targets, item_ids=None):
             seen.append(1)
             if len(seen) == 1:
-                return original(timeline, targets)
+                return original(timeline, targets, item_ids)
             return "unknown"
 
         with mock.patch.object(s, "_timeline_items_presence",
@@ -96,6 +96,19 @@ class StrictMode(unittest.TestCase):
         ))
 
 
+class WrapperFastPath(unittest.TestCase):
+    def test_read_action_skips_the_hook_entirely(self) -> None:
+        @destructive_hook.destructive_op("timeline")
+        def fake_timeline(action: str, params=None):
+            return {"success": True}
+
+        with mock.patch.object(destructive_hook, "is_destructive") as check, \
+                mock.patch.object(destructive_hook, "_resolve_versioning_context") as ctx:
+            self.assertEqual(fake_timeline("get_current"), {"success": True})
+        check.assert_not_called()
+        ctx.assert_not_called()
+
+
 class WrapperWithProvider(unittest.TestCase):
     """End-to-end: install a synthetic provider and verify the wrapper paths."""
 
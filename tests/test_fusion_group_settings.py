@@ -229,6 +229,17 @@ class SpliceTest(unittest.TestCase):
                 )
 
 
+    def test_inputs_block_outside_the_group_is_not_used(self):
+        content = (
+            "{ Tools = ordered() { G = GroupOperator { Outputs = {}, }, "
+            "Other = Macro { Inputs = ordered() { Input1 = InstanceInput { Name = \"X\", }, }, }, } }"
+        )
+        with tempfile.TemporaryDirectory() as tmp:
+            path = _write(tmp, "outside.setting", content)
+            with self.assertRaisesRegex(ValueError, "no Inputs"):
+                parse_setting_file(path)
+
+
 class InputBlockParseUnitTest(unittest.TestCase):
     """Direct unit-level coverage of parse_instance_input_block — useful when
     debugging the balanced-brace walker without round-tripping through a file."""
@@ -0,0 +1,129 @@
+"""Tests for resolve_batch(): a warm handle chain and one deferred flush.
+
+Inside a batch the liveness probe and the ProjectManager lookup must happen
+once rather than per call, and rebuilds marked dirty must be coalesced into a
+single run when the outermost batch exits. Batch state is per thread and the
+block holds the dispatch lock, so other tool calls wait rather than share it.
+"""
+import threading
+import unittest
+from unittest import mock
+
+from src.granular import common
+
+
+class FakeProject:
+    def GetMediaPool(self):
+        return object()
+
+    def GetCurrentTimeline(self):
+        return object()
+
+
+class FakePM:
+    def __init__(self):
+        self.project = FakeProject()
+
+    def GetCurrentProject(self):
+        return self.project
+
+
+class FakeResolve:
+    def __init__(self):
+        self.version_calls = 0
+        self.pm_calls = 0
+        self.pm = FakePM()
+
+    def GetVersion(self):
+        self.version_calls += 1
+        return [20, 0, 0, 0, ""]
+
+    def GetProjectManager(self):
+        self.pm_calls += 1
+        return self.pm
+
+
+class ResolveBatchTests(unittest.TestCase):
+    def setUp(self):
+        self.fake = FakeResolve()
+        patcher = mock.patch.object(common, "resolve", self.fake)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        flushers = mock.patch.dict(common._batch_flushers)
+        flushers.start()
+        self.addCleanup(flushers.stop)
+        self.addCleanup(common.invalidate_handle_cache)
+
+    def test_chain_is_resolved_once_inside_a_batch(self):
+        with common.resolve_batch() as r:
+            self.assertIs(r, self.fake)
+            for _ in range(5):
+                _, mp, err = common._get_mp()
+                self.assertIsNone(err)
+                _, tl, err = common._get_timeline()
+                self.assertIsNone(err)
+        self.assertEqual(self.fake.version_calls, 1)
+        self.assertEqual(self.fake.pm_calls, 1)
+
+    def test_liveness_is_rechecked_per_call_outside_a_batch(self):
+        common._get_mp()
+        common._get_mp()
+        self.assertEqual(self.fake.version_calls, 2)
+
+    def test_dirty_rebuilds_are_coalesced_until_outermost_exit(self):
+        rebuilds = []
+        common.register_batch_flush("timelines", lambda: rebuilds.append("timelines"))
+        with common.resolve_batch():
+            common.mark_batch_dirty("timelines")
+            with common.resolve_batch():
+                common.mark_batch_dirty("timelines")
+            self.assertEqual(rebuilds, [])
+            common.mark_batch_dirty("timelines")
+        self.assertEqual(rebuilds, ["timelines"])
+
+    def test_dirty_outside_a_batch_rebuilds_immediately(self):
+        rebuilds = []
+        common.register_batch_flush("timelines", lambda: rebuilds.append(1))
+        common.mark_batch_dirty("timelines")
+        common.mark_batch_dirty("unregistered")
+        self.assertEqual(rebuilds, [1])
+
+    def test_batch_state_is_released_after_an_exception(self):
+        with self.assertRaises(RuntimeError):
+            with common.resolve_batch():
+                raise RuntimeError("boom")
+        self.assertEqual(common._batch()["depth"], 0)
+        self.assertIsNone(common._batch()["resolve"])
+
+    def test_another_thread_neither_sees_the_batch_nor_runs_during_it(self):
+        seen = {}
+
+        def other_thread():
+            with common.dispatch_lock:
+                seen["depth"] = common._batch()["depth"]
+
+        with common.resolve_batch():
+            worker = threading.Thread(target=other_thread)
+            worker.start()
+            worker.join(0.1)
+            self.assertTrue(worker.is_alive())  # waiting on the dispatch lock
+            self.assertEqual(common._batch()["depth"], 1)
+        worker.join(1)
+        self.assertEqual(seen, {"depth": 0})
+
+    def test_timeline_deletion_marks_the_index_dirty(self):
+        from src.granular import media_pool
+
+        with mock.patch.object(media_pool, "mark_batch_dirty") as mark, \
+                mock.patch.object(media_pool, "_get_mp", return_value=(mock.Mock(), mock.Mock(), None)) as get_mp:
+            project = get_mp.return_value[0]
+            timeline = mock.Mock()
+            timeline.GetUniqueId.return_value = "t1"
+            project.GetTimelineCount.return_value = 1
+            project.GetTimelineByIndex.return_value = timeline
+            media_pool.delete_timelines_by_id(["t1"])
+        mark.assert_called_once_with("timelines")
+
+
+if __name__ == "__main__":
+    unittest.main()
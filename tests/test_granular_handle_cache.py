@@ -0,0 +1,164 @@
+"""Tests for the granular ProjectManager memo.
+
+The manager is fetched once per Resolve handle. A stale handle, or a reconnect
+that produces a different one, must never be answered from the memo.
+"""
+import unittest
+from unittest import mock
+
+from src.granular import common
+
+
+class FakePM:
+    def GetCurrentProject(self):
+        return None
+
+    def GetDatabaseList(self):
+        return []
+
+
+class FakeResolve:
+    def __init__(self, live=True):
+        self.live = live
+        self.pm_calls = 0
+
+    def GetVersion(self):
+        return [20, 0, 0, 0, ""] if self.live else None
+
+    def GetProjectManager(self):
+        self.pm_calls += 1
+        return FakePM()
+
+
+class HandleCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.addCleanup(common.invalidate_handle_cache)
+
+    def test_project_manager_is_fetched_once_per_handle(self):
+        fake = FakeResolve()
+        with mock.patch.object(common, "resolve", fake):
+            first = common.get_project_manager()
+            self.assertIs(common.get_project_manager(), first)
+            common.get_current_project()
+        self.assertEqual(fake.pm_calls, 1)
+
+    def test_new_handle_gets_its_own_project_manager(self):
+        old, new = FakeResolve(), FakeResolve()
+        with mock.patch.object(common, "resolve", old):
+            old_pm = common.get_project_manager()
+        with mock.patch.object(common, "resolve", new):
+            self.assertIsNot(common.get_project_manager(), old_pm)
+        self.assertEqual(new.pm_calls, 1)
+
+    def test_stale_handle_drops_the_memo(self):
+        fake = FakeResolve()
+        with mock.patch.object(common, "resolve", fake):
+            common.get_project_manager()
+            fake.live = False
+            with mock.patch.object(common, "_try_connect", return_value=None), \
+                    mock.patch.object(common, "_launch_resolve", return_value=False):
+                self.assertIsNone(common.get_project_manager())
+        self.assertIsNone(common._handle_cache["pm"])
+
+    def test_tools_share_the_memoised_project_manager(self):
+        from src.granular import project as granular_project
+        from src.granular import timeline as granular_timeline
+
+        fake = FakeResolve()
+        with mock.patch.object(common, "resolve", fake):
+            for _ in range(3):
+                self.assertEqual(granular_timeline.create_timeline("T"),
+                                 "Error: No project currently open")
+                self.assertIsInstance(granular_project.get_database_list(), dict)
+        self.assertEqual(fake.pm_calls, 1)
+
+    def test_one_failed_probe_keeps_the_handle(self):
+        fake = FakeResolve()
+        answers = iter([None, [20, 0, 0, 0, ""]])
+        fake.GetVersion = lambda: next(answers)
+        with mock.patch.object(common, "resolve", fake), \
+                mock.patch.object(common, "_try_connect") as reconnect, \
+                mock.patch.object(common.time, "sleep") as sleep:
+            self.assertIs(common.get_resolve(), fake)
+        reconnect.assert_not_called()
+        # The re-probe waits briefly rather than hitting the same busy moment.
+        sleep.assert_called_once_with(common._HANDLE_RECHECK_DELAY)
+
+    def test_dvr_script_import_is_deferred_and_attempted_once(self):
+        imports = []
+
+        def fake_import(name, *args, **kwargs):
+            if name == "DaVinciResolveScript":
+                imports.append(name)
+                raise ImportError("not installed")
+            return real_import(name, *args, **kwargs)
+
+        import builtins
+        real_import = builtins.__import__
+        with mock.patch.object(common, "dvr_script", None), \
+                mock.patch.object(common, "_dvr_script_attempted", False), \
+                mock.patch.object(builtins, "__import__", fake_import):
+            self.assertIsNone(common._load_dvr_script())
+            self.assertIsNone(common._load_dvr_script())
+        self.assertEqual(imports, ["DaVinciResolveScript"])
+
+    def test_handle_without_get_version_is_not_live(self):
+        self.assertFalse(common._is_resolve_handle_live(object()))
+        self.assertFalse(common._is_resolve_handle_live(FakeResolve(live=False)))
+        self.assertTrue(common._is_resolve_handle_live(FakeResolve()))
+
+    def test_require_project_reports_each_missing_link(self):
+        with mock.patch.object(common, "get_resolve", return_value=None):
+            self.assertEqual(common._require_project(),
+                             (None, {"error": "Not connected to DaVinci Resolve"}))
+        with mock.patch.object(common, "resolve", FakeResolve()):
+            self.assertEqual(common._require_project(),
+                             (None, {"error": "No project currently open"}))
+            self.assertIs(common._require_project()[1], common._ERR_NO_PROJECT)
+
+    def test_with_project_error_prefix_replaces_the_outer_try(self):
+        @common.with_project(error="Failed to read")
+        def tool(project):
+            raise RuntimeError("bridge hiccup")
+
+        with mock.patch.object(common, "_require_project", return_value=(object(), None)):
+            self.assertEqual(tool(), {"error": "Failed to read: bridge hiccup"})
+
+    def test_resolve_constants_are_read_once_per_handle(self):
+        class ConstResolve(FakeResolve):
+            reads = 0
+
+            def __getattr__(self, name):
+                if not name.startswith("EXPORT_"):
+                    raise AttributeError(name)
+                type(self).reads += 1
+                return f"<{name}>"
+
+        first, second = ConstResolve(), ConstResolve()
+        with mock.patch.object(common, "resolve", first):
+            for _ in range(3):
+                self.assertEqual(common._resolve_constant("EXPORT_AAF"), "<EXPORT_AAF>")
+            self.assertEqual(common._resolve_constant("not_a_constant"), "not_a_constant")
+        self.assertEqual(ConstResolve.reads, 1)
+        with mock.patch.object(common, "resolve", second):
+            common._resolve_constant("EXPORT_AAF")
+        self.assertEqual(ConstResolve.reads, 2)
+
+    def test_with_project_passes_the_project_and_hides_the_parameter(self):
+        import inspect
+
+        @common.with_project
+        def tool(project, job_id: str, flag: bool = False):
+            return {"project": project, "job_id": job_id, "flag": flag}
+
+        self.assertEqual(list(inspect.signature(tool).parameters), ["job_id", "flag"])
+        project = object()
+        with mock.patch.object(common, "_require_project", return_value=(project, None)):
+            self.assertEqual(tool("j1", flag=True), {"project": project, "job_id": "j1", "flag": True})
+        err = {"error": "No project currently open"}
+        with mock.patch.object(common, "_require_project", return_value=(None, err)):
+            self.assertIs(tool("j1"), err)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+"""Tests for the granular project-setting tools in src/granular/project.py."""
+import unittest
+from unittest import mock
+
+from src.granular import project as granular_project
+
+
+class FakeProject:
+    def __init__(self, accept=lambda name, value: True):
+        self.accept = accept
+        self.set_calls = []
+
+    def SetSetting(self, name, value):
+        self.set_calls.append((name, value))
+        return self.accept(name, value)
+
+
+class SetProjectSettingTests(unittest.TestCase):
+    def _set(self, project, name, value):
+        with mock.patch.object(granular_project, "get_current_project", return_value=(None, project)):
+            return granular_project.set_project_setting(name, value)
+
+    def test_numeric_value_is_tried_as_a_number_first(self):
+        project = FakeProject()
+        self.assertIn("numeric value 1920", self._set(project, "timelineResolutionWidth", "1920"))
+        self.assertEqual(project.set_calls, [("timelineResolutionWidth", 1920)])
+
+    def test_fraction_forms_are_tried_as_floats(self):
+        for text, number in (("23.976", 23.976), ("-.5", -0.5), ("25.", 25.0)):
+            project = FakeProject()
+            self._set(project, "someFutureKey", text)
+            self.assertEqual(project.set_calls, [("someFutureKey", number)])
+
+    def test_non_numeric_text_goes_straight_to_string(self):
+        for text in ("1-.5", "1e5", "-", "Rec.709"):
+            project = FakeProject()
+            self._set(project, "someFutureKey", text)
+            self.assertEqual(project.set_calls, [("someFutureKey", text)])
+
+    def test_declared_string_setting_skips_the_numeric_attempt(self):
+        project = FakeProject(accept=lambda name, value: isinstance(value, str))
+        self.assertIn("Successfully", self._set(project, "timelineGamma", "2"))
+        self.assertEqual(project.set_calls, [("timelineGamma", "2")])
+
+    def test_typed_numbers_are_used_as_given(self):
+        project = FakeProject(accept=lambda name, value: isinstance(value, str))
+        self._set(project, "timelineFrameRate", 23.976)
+        self.assertEqual(project.set_calls, [("timelineFrameRate", 23.976), ("timelineFrameRate", "23.976")])
+
+    def test_bools_are_not_treated_as_numbers(self):
+        project = FakeProject()
+        self._set(project, "someFutureKey", True)
+        self.assertEqual(project.set_calls, [("someFutureKey", "True")])
+
+    def test_numeric_refusal_falls_back_to_string(self):
+        project = FakeProject(accept=lambda name, value: isinstance(value, str))
+        self._set(project, "someFutureKey", "3")
+        self.assertEqual(project.set_calls, [("someFutureKey", 3), ("someFutureKey", "3")])
+
+
+class CacheModeToolTests(unittest.TestCase):
+    def test_each_tool_sets_its_own_key_and_names_itself(self):
+        tools = (
+            (granular_project.set_cache_mode, "CacheMode", "cache mode"),
+            (granular_project.set_optimized_media_mode, "OptimizedMediaMode", "optimized media mode"),
+            (granular_project.set_proxy_mode, "ProxyMode", "proxy mode"),
+        )
+        for tool, key, label in tools:
+            project = FakeProject()
+            with mock.patch.object(granular_project, "get_current_project", return_value=(None, project)):
+                self.assertEqual(tool("OFF"), f"Successfully set {label} to 'off'")
+                self.assertTrue(tool("sometimes").startswith(f"Error: Invalid {label}."))
+            self.assertEqual(project.set_calls, [(key, "2")])
+
+
+if __name__ == "__main__":
+    unittest.main()
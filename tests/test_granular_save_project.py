@@ -0,0 +1,44 @@
+"""Tests for the granular save_project tool's fallback chain."""
+import unittest
+from unittest import mock
+
+from src.granular import project as granular_project
+
+
+class FakeProject:
+    def GetName(self):
+        return "Demo"
+
+
+class FakePM:
+    def __init__(self, saves=True):
+        self.saves = saves
+        self.exports = []
+
+    def SaveProject(self):
+        return self.saves
+
+    def ExportProject(self, name, path):
+        self.exports.append((name, path))
+        return False
+
+
+class SaveProjectTests(unittest.TestCase):
+    def _save(self, pm):
+        with mock.patch.object(granular_project, "get_current_project", return_value=(pm, FakeProject())):
+            return granular_project.save_project()
+
+    def test_project_manager_save_is_used_when_the_project_has_none(self):
+        pm = FakePM()
+        self.assertEqual(self._save(pm), "Successfully saved project 'Demo'")
+        self.assertEqual(pm.exports, [])
+
+    def test_export_fallback_reaches_the_project_manager(self):
+        pm = FakePM(saves=False)
+        out = self._save(pm)
+        self.assertIn("Manual save attempts failed", out)
+        self.assertEqual([name for name, _ in pm.exports], ["Demo"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+"""Tests for the granular timeline create/switch/delete tools.
+
+The handle CreateEmptyTimeline returns is the new timeline, so creating one
+must cost the same IPC calls however many timelines the project already has.
+"""
+import unittest
+from unittest import mock
+
+from src.granular import media_pool as granular_media_pool
+from src.granular import timeline as granular_timeline
+
+
+class FakeTimeline:
+    def __init__(self, name):
+        self.name = name
+
+    def GetName(self):
+        return self.name
+
+    def GetUniqueId(self):
+        return f"id-{self.name}"
+
+
+class FakeMediaPool:
+    def __init__(self, created_name=None):
+        self.created_name = created_name
+
+    def CreateEmptyTimeline(self, name):
+        if self.created_name is False:
+            return None
+        return FakeTimeline(self.created_name or name)
+
+
+class FakeProject:
+    def __init__(self, media_pool, timeline_count=50):
+        self.media_pool = media_pool
+        self.timeline_count = timeline_count
+        self.index_reads = 0
+
+    def GetMediaPool(self):
+        return self.media_pool
+
+    def GetTimelineCount(self):
+        return self.timeline_count
+
+    def GetTimelineByIndex(self, index):
+        self.index_reads += 1
+        return FakeTimeline(f"T{index}")
+
+    def GetCurrentTimeline(self):
+        return FakeTimeline("T3")
+
+    def SetCurrentTimeline(self, timeline):
+        self.switched_to = timeline.GetName()
+        return True
+
+
+class CreateTimelineTests(unittest.TestCase):
+    def _create(self, project, name="Edit"):
+        with mock.patch.object(granular_timeline, "_require_project", return_value=(project, None)):
+            return granular_timeline.create_timeline(name)
+
+    def test_created_handle_is_used_without_an_index_scan(self):
+        project = FakeProject(FakeMediaPool())
+        self.assertEqual(self._create(project), "Successfully created timeline 'Edit'")
+        self.assertEqual(project.index_reads, 0)
+
+    def test_name_mismatch_is_reported_from_the_handle(self):
+        project = FakeProject(FakeMediaPool(created_name="Edit 2"))
+        self.assertEqual(self._create(project),
+                         "Successfully created timeline 'Edit 2' (requested 'Edit')")
+
+    def test_refused_create_is_reported(self):
+        project = FakeProject(FakeMediaPool(created_name=False))
+        self.assertEqual(self._create(project), "Failed to create timeline 'Edit'")
+
+
+class SetCurrentTimelineTests(unittest.TestCase):
+    def _switch(self, project, name):
+        with mock.patch.object(granular_timeline, "_require_project", return_value=(project, None)):
+            return granular_timeline.set_current_timeline(name)
+
+    def test_already_current_timeline_skips_lookup_and_switch(self):
+        project = FakeProject(FakeMediaPool())
+        self.assertEqual(self._switch(project, "T3"), "Timeline 'T3' is already current")
+        self.assertEqual(project.index_reads, 0)
+        self.assertFalse(hasattr(project, "switched_to"))
+
+    def test_other_timeline_is_looked_up_and_switched(self):
+        project = FakeProject(FakeMediaPool(), timeline_count=5)
+        with mock.patch.object(granular_timeline, "find_timeline_by_name",
+                               return_value=FakeTimeline("T5")):
+            self.assertEqual(self._switch(project, "T5"),
+                             "Successfully switched to timeline 'T5'")
+        self.assertEqual(project.switched_to, "T5")
+
+
+class DeleteTimelinesByIdTests(unittest.TestCase):
+    def test_scan_stops_once_every_id_is_found(self):
+        deleted = []
+        media_pool = mock.Mock(DeleteTimelines=lambda tls: deleted.extend(tls) or True)
+        project = FakeProject(media_pool)
+        with mock.patch.object(granular_media_pool, "_get_mp", return_value=(project, media_pool, None)):
+            result = granular_media_pool.delete_timelines_by_id(["id-T2", "id-T4", "id-T2"])
+        self.assertEqual(result, {"success": True, "deleted_count": 2})
+        self.assertEqual([tl.name for tl in deleted], ["T2", "T4"])
+        self.assertEqual(project.index_reads, 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
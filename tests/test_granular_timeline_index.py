@@ -0,0 +1,97 @@
+"""Tests for the granular timeline name index (find_timeline_by_name)."""
+import unittest
+
+from src.granular import common
+
+
+class FakeTimeline:
+    def __init__(self, name):
+        self.name = name
+
+    def GetName(self):
+        return self.name
+
+
+class FakeProject:
+    def __init__(self, names):
+        self.timelines = [FakeTimeline(n) for n in names]
+        self.by_index_calls = 0
+
+    def GetTimelineCount(self):
+        return len(self.timelines)
+
+    def GetTimelineByIndex(self, index):
+        self.by_index_calls += 1
+        if 1 <= index <= len(self.timelines):
+            return self.timelines[index - 1]
+        return None
+
+
+class TimelineIndexTests(unittest.TestCase):
+    def setUp(self):
+        common._timeline_index.clear()
+        self.addCleanup(common._timeline_index.clear)
+
+    def test_repeat_lookup_is_one_fetch(self):
+        project = FakeProject(["A", "B", "C", "D"])
+        self.assertIs(common.find_timeline_by_name(project, "C"), project.timelines[2])
+        project.by_index_calls = 0
+        self.assertIs(common.find_timeline_by_name(project, "C"), project.timelines[2])
+        self.assertIs(common.find_timeline_by_name(project, "A"), project.timelines[0])
+        self.assertEqual(project.by_index_calls, 2)
+
+    def test_stale_index_is_rebuilt_after_delete(self):
+        project = FakeProject(["A", "B", "C"])
+        common.find_timeline_by_name(project, "C")
+        del project.timelines[0]
+        self.assertIs(common.find_timeline_by_name(project, "C"), project.timelines[1])
+
+    def test_new_timeline_is_found_and_missing_returns_none(self):
+        project = FakeProject(["A"])
+        common.find_timeline_by_name(project, "A")
+        project.timelines.append(FakeTimeline("B"))
+        self.assertIs(common.find_timeline_by_name(project, "B"), project.timelines[1])
+        self.assertIsNone(common.find_timeline_by_name(project, "Z"))
+
+    def test_project_switch_does_not_return_other_projects_timeline(self):
+        first = FakeProject(["A", "B"])
+        common.find_timeline_by_name(first, "B")
+        second = FakeProject(["B", "X"])
+        self.assertIs(common.find_timeline_by_name(second, "B"), second.timelines[0])
+
+    def test_rebuild_returns_the_handle_it_scanned(self):
+        project = FakeProject(["A", "gone", "B"])
+        project.timelines[1] = None
+        self.assertIs(common.find_timeline_by_name(project, "B"), project.timelines[2])
+        self.assertEqual(project.by_index_calls, 3)
+        self.assertEqual(common._timeline_index, {"A": 1, "B": 3})
+
+    def test_listing_timelines_seeds_the_index(self):
+        from unittest import mock
+        from src.granular import timeline as granular_timeline
+
+        project = FakeProject(["A", "B", "C"])
+        with mock.patch.object(granular_timeline, "_require_project", return_value=(project, None)):
+            self.assertEqual(granular_timeline.list_timelines(), ["A", "B", "C"])
+        project.by_index_calls = 0
+        self.assertIs(common.find_timeline_by_name(project, "B"), project.timelines[1])
+        self.assertEqual(project.by_index_calls, 1)
+
+    def test_listing_logs_a_summary_not_a_line_per_timeline(self):
+        from unittest import mock
+        from src.granular import timeline as granular_timeline
+
+        project = FakeProject([f"T{i}" for i in range(1, 41)])
+        with mock.patch.object(granular_timeline, "_require_project", return_value=(project, None)), \
+                self.assertLogs(common.logger, level="INFO") as logs:
+            granular_timeline.list_timelines()
+        self.assertLessEqual(len(logs.records), 3)
+
+    def test_invalidation_clears_the_index(self):
+        common.find_timeline_by_name(FakeProject(["A"]), "A")
+        common.invalidate_timeline_index()
+        self.assertEqual(common._timeline_index, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
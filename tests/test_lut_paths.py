@@ -124,6 +124,18 @@ class EnsureLutInMasterTest(unittest.TestCase):
         with open(dst, encoding="utf-8") as f:
             self.assertEqual(f.read(), "ORIG\n")
 
+    def test_unchanged_source_is_copied_once(self):
+        src = self._write(os.path.join(self.user, "Batch.cube"))
+        with patch.object(lut_paths.shutil, "copy2", wraps=lut_paths.shutil.copy2) as copy2:
+            lut_paths.ensure_lut_in_master("Batch.cube")
+            lut_paths.ensure_lut_in_master("Batch.cube")
+            self.assertEqual(copy2.call_count, 1)
+            self._write(src, body="LUT_3D_SIZE 17\n")
+            lut_paths.ensure_lut_in_master("Batch.cube")
+            self.assertEqual(copy2.call_count, 2)
+        with open(os.path.join(self.master, self.subdir, "Batch.cube"), encoding="utf-8") as f:
+            self.assertEqual(f.read(), "LUT_3D_SIZE 17\n")
+
     def test_missing_source_returns_none(self):
         self.assertIsNone(lut_paths.ensure_lut_in_master("Nope.cube"))
 
@@ -2154,6 +2154,16 @@ class MediaAnalysisPlanningTests(unittest.TestCase):
         self.assertFalse(scene["changed"])
         self.assertEqual(scene["reason"], "preserved_existing_fill_empty_field")
 
+    def test_publish_metadata_owned_block_keeps_backslashes_in_the_body(self):
+        comments = _media_analysis_merge_metadata_field(
+            "Comments",
+            "[DaVinci Resolve MCP Analysis]\nold\n[/DaVinci Resolve MCP Analysis]",
+            "Path: D:\\media\\1_take",
+            {},
+        )
+        self.assertIn("Path: D:\\media\\1_take", comments["value"])
+        self.assertNotIn("old", comments["value"])
+
     def test_publish_metadata_provenance_uses_namespaced_third_party_keys(self):
         provenance = _media_analysis_provenance_metadata(
             {
@@ -4062,6 +4072,10 @@ class MediaAnalysisPlanningTests(unittest.TestCase):
             self.assertEqual(final["succeeded_clips"], 2)
             self.assertTrue(os.path.exists(final["paths"]["progress_json"]))
             self.assertTrue(os.path.exists(final["paths"]["events_jsonl"]))
+            with open(final["paths"]["events_jsonl"], encoding="utf-8") as handle:
+                events = [json.loads(line) for line in handle]
+            self.assertTrue(events)
+            self.assertTrue(all({"time", "level", "message"} <= set(event) for event in events))
 
             jobs = list_batch_jobs(job["project_root"])
             index = analysis_index_status(job["project_root"])
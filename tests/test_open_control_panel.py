@@ -168,5 +168,27 @@ class ControlPanelProbe(unittest.TestCase):
         self.assertEqual(result, {"is_dashboard": False, "version": None})
 
 
+class CloseControlPanel(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.pidfile = os.path.join(self.tmp.name, "control_panel.pid")
+        with open(self.pidfile, "w", encoding="utf-8") as fh:
+            json.dump({"pid": 4242, "port": 8765}, fh)
+        patcher = mock.patch.object(server, "_control_panel_pidfile", return_value=self.pidfile)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_quick_exit_is_not_waited_on(self) -> None:
+        alive = iter([True, True, False])
+        with mock.patch.object(server, "_control_panel_pid_alive", side_effect=lambda pid: next(alive)), \
+             mock.patch.object(server.os, "kill"), \
+             mock.patch.object(server.time, "sleep") as sleep:
+            result = server._close_control_panel()
+        self.assertEqual(result, {"success": True, "was_running": True, "pid": 4242})
+        self.assertEqual([c.args[0] for c in sleep.call_args_list], [0.05])
+        self.assertFalse(os.path.exists(self.pidfile))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -78,5 +78,19 @@ class ResolvePathEnvOverrideTest(unittest.TestCase):
         )
 
 
+class SetupEnvironmentTest(unittest.TestCase):
+    def test_failure_is_logged_not_printed_to_stdout(self):
+        import io
+        from contextlib import redirect_stdout
+
+        out = io.StringIO()
+        with patch.object(platform_utils, "get_resolve_paths", side_effect=OSError("boom")), \
+                self.assertLogs("davinci-resolve-mcp.platform", level="WARNING") as logs, \
+                redirect_stdout(out):
+            self.assertFalse(platform_utils.setup_environment())
+        self.assertEqual(out.getvalue(), "")
+        self.assertIn("boom", logs.output[0])
+
+
 if __name__ == "__main__":
     unittest.main()
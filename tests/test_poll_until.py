@@ -0,0 +1,46 @@
+"""Tests for the compound server's backoff poll helper."""
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from src import server as s
+
+
+class PollUntilTests(unittest.TestCase):
+    def test_settled_state_costs_one_check_and_no_sleep(self):
+        with mock.patch.object(s.time, "sleep") as sleep:
+            self.assertEqual(s._poll_until(lambda: {"a.tif"}), {"a.tif"})
+        sleep.assert_not_called()
+
+    def test_sleeps_grow_until_the_predicate_holds(self):
+        answers = iter([set(), set(), {"a.tif"}])
+        with mock.patch.object(s.time, "sleep") as sleep:
+            self.assertEqual(s._poll_until(lambda: next(answers)), {"a.tif"})
+        self.assertEqual([c.args[0] for c in sleep.call_args_list], [0.02, 0.04])
+
+    def test_gives_up_with_the_last_result_at_the_timeout(self):
+        with mock.patch.object(s.time, "sleep"):
+            self.assertEqual(s._poll_until(set, timeout=0), set())
+
+
+class SettledStillExportTests(unittest.TestCase):
+    def _write(self, folder, name, data):
+        with open(os.path.join(folder, name), "wb") as handle:
+            handle.write(data)
+
+    def test_waits_for_both_files_and_for_their_sizes_to_hold(self):
+        with tempfile.TemporaryDirectory() as folder:
+            self._write(folder, "old.tif", b"x")
+            check = s._settled_still_export(folder, {"old.tif"})
+            self._write(folder, "still_1.tif", b"ab")
+            self.assertIsNone(check())  # no .drx yet
+            self._write(folder, "still_1.drx", b"<x/>")
+            self.assertIsNone(check())  # both present, sizes not yet confirmed
+            self._write(folder, "still_1.tif", b"abcd")
+            self.assertIsNone(check())  # image still growing
+            self.assertEqual(check(), ["still_1.drx", "still_1.tif"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,245 @@
+"""Tests for the project-properties helpers in src/utils/project_properties.py."""
+import unittest
+from unittest import mock
+
+from src.utils import project_properties as pp
+
+
+class FakeProject:
+    def __init__(self, settings=None, unique_id="project-1"):
+        self.unique_id = unique_id
+        self.settings = dict(settings or {
+            "timelineFrameRate": "24",
+            "timelineResolutionWidth": "1920",
+            "timelineResolutionHeight": "1080",
+            "timelineOutputResolutionWidth": "1920",
+            "timelineOutputResolutionHeight": "1080",
+            "timelineInterlaceProcessing": "0",
+            "colorScienceMode": "0",
+            "superScaleEnabled": "0",
+            "superScaleQuality": "0",
+        })
+        self.get_calls = []
+        self.set_calls = []
+
+    def GetUniqueId(self):
+        return self.unique_id
+
+    def GetSetting(self, name=""):
+        self.get_calls.append(name)
+        if name == "":
+            return dict(self.settings)
+        return self.settings.get(name)
+
+    def SetSetting(self, name, value):
+        self.set_calls.append((name, value))
+        self.settings[name] = str(value)
+        return True
+
+
+class SettingsSnapshotTests(unittest.TestCase):
+    def setUp(self):
+        pp.invalidate_settings_snapshot()
+        self.addCleanup(pp.invalidate_settings_snapshot)
+
+    def test_multi_key_helper_reads_settings_in_one_call(self):
+        project = FakeProject()
+        settings = pp.get_timeline_format_settings(project)
+        self.assertEqual(settings["timelineResolutionWidth"], 1920)
+        self.assertEqual(settings["resolutionName"], "FHD 1080p")
+        self.assertEqual(project.get_calls, [""])
+
+    def test_snapshot_is_reused_within_ttl_and_refetched_after(self):
+        project = FakeProject()
+        clock = [100.0]
+        with mock.patch.object(pp.time, "monotonic", lambda: clock[0]):
+            pp.settings_snapshot(project)
+            pp.settings_snapshot(project)
+            self.assertEqual(project.get_calls, [""])
+            clock[0] += pp.SETTINGS_SNAPSHOT_TTL
+            self.assertEqual(pp.read_setting(project, "colorScienceMode"), "0")
+        self.assertEqual(project.get_calls, ["", "colorScienceMode"])
+
+    def test_snapshot_is_shared_by_fresh_wrappers_of_one_project(self):
+        # GetCurrentProject() returns a new wrapper on every tool call.
+        first = FakeProject()
+        pp.settings_snapshot(first)
+        second = FakeProject()
+        self.assertEqual(pp.settings_snapshot(second)["colorScienceMode"], "0")
+        self.assertEqual((first.get_calls, second.get_calls), ([""], []))
+
+    def test_object_without_an_identity_is_not_cached(self):
+        project = FakeProject(unique_id="")
+        project.GetName = lambda: ""
+        pp.settings_snapshot(project)
+        pp.settings_snapshot(project)
+        self.assertEqual(project.get_calls, ["", ""])
+
+    def test_accepted_set_is_read_back_without_a_fetch(self):
+        project = FakeProject()
+        pp.settings_snapshot(project)
+        self.assertTrue(pp.set_project_property(project, "timelineResolutionWidth", 3840))
+        self.assertEqual(pp.get_project_property(project, "timelineResolutionWidth"), 3840)
+        self.assertTrue(pp.set_project_property(project, "superScaleEnabled", True))
+        self.assertIs(pp.get_project_property(project, "superScaleEnabled"), True)
+        self.assertEqual(project.get_calls, [""])
+
+    def test_refused_set_drops_the_snapshot(self):
+        project = FakeProject()
+        pp.settings_snapshot(project)
+        project.SetSetting = lambda name, value: False
+        self.assertFalse(pp.set_project_property(project, "timelineResolutionWidth", 3840))
+        self.assertEqual(pp.get_project_property(project, "timelineResolutionWidth"), 1920)
+        self.assertEqual(project.get_calls, ["", "timelineResolutionWidth"])
+
+    def test_single_reads_are_reused_within_ttl(self):
+        project = FakeProject()
+        clock = [100.0]
+        with mock.patch.object(pp.time, "monotonic", lambda: clock[0]):
+            for _ in range(3):
+                self.assertEqual(pp.read_setting(project, "colorScienceMode"), "0")
+            self.assertEqual(project.get_calls, ["colorScienceMode"])
+            clock[0] += pp.SETTINGS_SNAPSHOT_TTL
+            pp.read_setting(project, "colorScienceMode")
+        self.assertEqual(project.get_calls, ["colorScienceMode", "colorScienceMode"])
+
+    def test_single_reads_are_shared_by_fresh_wrappers_of_one_project(self):
+        # Polling a key across tool calls sees a new wrapper each time.
+        first, second = FakeProject(), FakeProject()
+        self.assertEqual(pp.read_setting(first, "colorScienceMode"), "0")
+        self.assertEqual(pp.read_setting(second, "colorScienceMode"), "0")
+        self.assertEqual((first.get_calls, second.get_calls), (["colorScienceMode"], []))
+        other = FakeProject({"colorScienceMode": "2"}, unique_id="project-2")
+        self.assertEqual(pp.read_setting(other, "colorScienceMode"), "2")
+
+    def test_writes_and_invalidation_drop_single_reads(self):
+        project = FakeProject()
+        pp.read_setting(project, "colorScienceMode")
+        pp.set_project_property(project, "colorScienceMode", 2)
+        self.assertEqual(pp.read_setting(project, "colorScienceMode"), "2")
+        project.settings["colorScienceMode"] = "1"
+        pp.invalidate_settings_snapshot(project)
+        self.assertEqual(pp.read_setting(project, "colorScienceMode"), "1")
+
+    def test_snapshots_are_per_object(self):
+        a = FakeProject()
+        b = FakeProject({"colorScienceMode": "2"}, unique_id="project-2")
+        pp.settings_snapshot(a)
+        self.assertEqual(pp.read_setting(b, "colorScienceMode"), "2")
+
+    def test_non_dict_bulk_answer_falls_back_to_single_reads(self):
+        project = FakeProject()
+        project.GetSetting = lambda name="": None if name == "" else "1"
+        self.assertIsNone(pp.settings_snapshot(project))
+        self.assertEqual(pp.read_setting(project, "superScaleEnabled"), "1")
+
+    def test_single_write_is_skipped_when_snapshot_already_matches(self):
+        project = FakeProject()
+        pp.settings_snapshot(project)
+        self.assertTrue(pp.set_project_property(project, "timelineResolutionWidth", 1920))
+        self.assertEqual(project.set_calls, [])
+
+    def test_multi_write_helper_only_writes_changed_properties(self):
+        project = FakeProject()
+        self.assertTrue(pp.set_timeline_format(project, 3840, 1080, 24, interlaced=False))
+        self.assertEqual(project.set_calls, [("timelineResolutionWidth", 3840)])
+        self.assertEqual(project.get_calls, [""])
+
+    def test_bool_compares_against_resolve_digit_form(self):
+        project = FakeProject()
+        self.assertTrue(pp.set_superscale_settings(project, True, 0))
+        self.assertEqual(project.set_calls, [("superScaleEnabled", True)])
+
+
+class CoercePropertyValueTests(unittest.TestCase):
+    def test_declared_types_are_converted(self):
+        self.assertEqual(pp.coerce_property_value("timelineResolutionWidth", "3840"), (3840, None))
+        self.assertEqual(pp.coerce_property_value("timelineFrameRate", "23.976"), (23.976, None))
+        self.assertEqual(pp.coerce_property_value("superScaleEnabled", "On"), (True, None))
+        self.assertEqual(pp.coerce_property_value("superScaleEnabled", 0), (False, None))
+
+    def test_bool_strings_outside_both_vocabularies_are_rejected(self):
+        self.assertEqual(pp.coerce_property_value("superScaleEnabled", "off"), (False, None))
+        self.assertEqual(pp.coerce_property_value("superScaleEnabled", ""), (False, None))
+        value, error = pp.coerce_property_value("superScaleEnabled", "maybe")
+        self.assertEqual(value, "maybe")
+        self.assertIn("superScaleEnabled", error)
+
+    def test_values_already_typed_pass_through(self):
+        self.assertEqual(pp.coerce_property_value("superScaleQuality", 2), (2, None))
+
+    def test_incoming_names_are_interned_to_the_schema_key(self):
+        name = "".join(["timeline", "FrameRate"])
+        schema_key = next(k for k in pp.PROJECT_PROPERTY_TYPES if k == name)
+        self.assertIs(pp._intern_name(name), schema_key)
+        self.assertIsNone(pp._intern_name(None))
+
+    def test_unknown_property_is_untouched(self):
+        self.assertEqual(pp.coerce_property_value("someFutureKey", "7"), ("7", None))
+
+    def test_unconvertible_value_is_returned_with_error(self):
+        value, error = pp.coerce_property_value("colorScienceMode", "davinciYRGB")
+        self.assertEqual(value, "davinciYRGB")
+        self.assertIn("colorScienceMode", error)
+
+    def test_get_keeps_raw_value_and_set_still_writes_it(self):
+        project = FakeProject({"colorScienceMode": "davinciYRGB"})
+        self.assertEqual(pp.get_project_property(project, "colorScienceMode"), "davinciYRGB")
+        self.assertTrue(pp.set_project_property(project, "colorScienceMode", "acescct"))
+        self.assertEqual(project.set_calls, [("colorScienceMode", "acescct")])
+
+
+class FakeTimeline:
+    def __init__(self, owner, name):
+        self.owner = owner
+        self.name = name
+
+    def GetName(self):
+        self.owner.name_reads += 1
+        return self.name
+
+    def GetStartFrame(self):
+        return 0
+
+    def GetEndFrame(self):
+        return 99
+
+
+class ProjectWithTimelines(FakeProject):
+    def __init__(self, names):
+        super().__init__()
+        self.name_reads = 0
+        self.count_reads = 0
+        self.timelines = [FakeTimeline(self, n) for n in names]
+
+    def GetName(self):
+        return "Proj"
+
+    def GetTimelineCount(self):
+        self.count_reads += 1
+        return len(self.timelines)
+
+    def GetTimelineByIndex(self, index):
+        return self.timelines[index - 1]
+
+    def GetCurrentTimeline(self):
+        return self.timelines[1]
+
+
+class ProjectInfoTests(unittest.TestCase):
+    def setUp(self):
+        pp.invalidate_settings_snapshot()
+        self.addCleanup(pp.invalidate_settings_snapshot)
+
+    def test_each_timeline_name_is_read_once(self):
+        project = ProjectWithTimelines(["A", "B", "C"])
+        info = pp.get_project_info(project)
+        self.assertEqual([(t["name"], t["isCurrent"]) for t in info["timelines"]],
+                         [("A", False), ("B", True), ("C", False)])
+        # One read for the metadata's current timeline, one per timeline.
+        self.assertEqual(project.name_reads, 1 + 3)
+        self.assertEqual(project.count_reads, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+"""Tests for _read_settings(), the bulk settings read behind spec live_state()."""
+import unittest
+
+from src import server as s
+
+
+class FakeSettingsObject:
+    def __init__(self, bulk, single=None):
+        self.bulk = bulk
+        self.single = single or {}
+        self.calls = []
+
+    def GetSetting(self, name=""):
+        self.calls.append(name)
+        if name == "":
+            return self.bulk
+        if name == "boom":
+            raise RuntimeError("boom")
+        return self.single.get(name)
+
+
+class ReadSettingsTests(unittest.TestCase):
+    def test_keys_in_the_bulk_answer_cost_no_extra_read(self):
+        obj = FakeSettingsObject({"timelineFrameRate": "24", "colorScienceMode": "0"})
+        out = s._read_settings(obj, ["timelineFrameRate", "colorScienceMode"])
+        self.assertEqual(out, {"timelineFrameRate": "24", "colorScienceMode": "0"})
+        self.assertEqual(obj.calls, [""])
+
+    def test_missing_keys_fall_back_to_single_reads(self):
+        obj = FakeSettingsObject({"timelineFrameRate": "24"}, {"hidden": "1"})
+        out = s._read_settings(obj, ["timelineFrameRate", "hidden", "absent", "boom"])
+        self.assertEqual(out, {"timelineFrameRate": "24", "hidden": "1"})
+        self.assertEqual(obj.calls, ["", "hidden", "absent", "boom"])
+
+    def test_non_dict_bulk_answer_reads_every_key(self):
+        obj = FakeSettingsObject(None, {"timelineFrameRate": "25"})
+        self.assertEqual(s._read_settings(obj, ["timelineFrameRate"]), {"timelineFrameRate": "25"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -38,6 +38,15 @@ class AuditTest(unittest.TestCase):
         _, _, high, _low = audit_rw.audit(src)
         self.assertEqual(high, [])
 
+    def test_spliced_constant_actions_are_audited(self):
+        src = (
+            '_KERNEL = ["set_mode"]\n'
+            'def tool(action):\n'
+            '    return _unknown(action, ["get_name", *_KERNEL])\n'
+        )
+        _, _, high, _low = audit_rw.audit(src)
+        self.assertEqual(high, ["set_mode"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,149 @@
+"""Tests for the render formats/codecs/presets memo in src/utils/render_catalogue.py."""
+import unittest
+from unittest import mock
+
+from src.utils import render_catalogue as rc
+
+
+class FakeProject:
+    def __init__(self, unique_id="project-1", calls=None):
+        self.unique_id = unique_id
+        self.calls = [] if calls is None else calls
+        self.presets = ["H.264 Master"]
+
+    def GetUniqueId(self):
+        return self.unique_id
+
+    def GetName(self):
+        return "Project"
+
+    def GetRenderFormats(self):
+        self.calls.append("formats")
+        return {"QuickTime": "mov"}
+
+    def GetRenderCodecs(self, format_id):
+        self.calls.append(("codecs", format_id))
+        return {"Apple ProRes 422 HQ": "ProRes422HQ"}
+
+    def GetRenderPresetList(self):
+        self.calls.append("presets")
+        return list(self.presets)
+
+    def LoadRenderPreset(self, name):
+        return name in self.presets
+
+
+class RenderCatalogueTests(unittest.TestCase):
+    def setUp(self):
+        rc.invalidate_render_catalogue()
+        self.addCleanup(rc.invalidate_render_catalogue)
+
+    def test_reads_are_reused_within_ttl_and_refetched_after(self):
+        project = FakeProject()
+        clock = [50.0]
+        with mock.patch.object(rc.time, "monotonic", lambda: clock[0]):
+            for _ in range(3):
+                rc.cached_render_formats(project)
+                rc.cached_render_codecs(project, "mov")
+            self.assertEqual(project.calls, ["formats", ("codecs", "mov")])
+            clock[0] += rc.RENDER_CATALOGUE_TTL
+            rc.cached_render_formats(project)
+        self.assertEqual(project.calls, ["formats", ("codecs", "mov"), "formats"])
+
+    def test_a_fresh_wrapper_for_the_same_project_hits_the_cache(self):
+        # GetCurrentProject() returns a new wrapper on every tool call.
+        calls = []
+        for _ in range(3):
+            project = FakeProject(calls=calls)
+            rc.cached_render_formats(project)
+            rc.cached_render_codecs(project, "mov")
+        self.assertEqual(calls, ["formats", ("codecs", "mov")])
+        rc.invalidate_render_catalogue(FakeProject(calls=calls), "formats")
+        rc.cached_render_formats(FakeProject(calls=calls))
+        self.assertEqual(calls, ["formats", ("codecs", "mov"), "formats"])
+
+    def test_a_project_without_an_identity_is_not_cached(self):
+        project = FakeProject(unique_id="")
+        project.GetName = lambda: ""
+        rc.cached_render_formats(project)
+        rc.cached_render_formats(project)
+        self.assertEqual(project.calls, ["formats", "formats"])
+
+    def test_callers_get_their_own_copy(self):
+        project = FakeProject()
+        rc.cached_render_formats(project)["Injected"] = "x"
+        self.assertNotIn("Injected", rc.cached_render_formats(project))
+
+    def test_entries_are_per_project_and_per_format(self):
+        a, b = FakeProject("project-a"), FakeProject("project-b")
+        rc.cached_render_codecs(a, "mov")
+        rc.cached_render_codecs(a, "mp4")
+        rc.cached_render_codecs(b, "mov")
+        self.assertEqual(a.calls, [("codecs", "mov"), ("codecs", "mp4")])
+        self.assertEqual(b.calls, [("codecs", "mov")])
+
+    def test_invalidation_can_target_one_kind(self):
+        project = FakeProject()
+        rc.cached_render_formats(project)
+        rc.cached_render_presets(project)
+        rc.invalidate_render_catalogue(project, "presets")
+        rc.cached_render_formats(project)
+        rc.cached_render_presets(project)
+        self.assertEqual(project.calls, ["formats", "presets", "presets"])
+
+    def test_preset_names_share_the_list_read(self):
+        project = FakeProject()
+        self.assertEqual(rc.cached_render_presets(project), ["H.264 Master"])
+        self.assertEqual(rc.cached_render_preset_names(project), frozenset({"H.264 Master"}))
+        self.assertEqual(project.calls, ["presets"])
+
+    def test_all_codecs_are_keyed_by_format_id_and_memoised(self):
+        from src import server as s
+
+        project = FakeProject()
+        for _ in range(2):
+            out = s._render_all_codecs(project, {})
+        self.assertEqual(out, {"codecs": {"mov": {"Apple ProRes 422 HQ": "ProRes422HQ"}}, "errors": []})
+        self.assertEqual(project.calls, ["formats", ("codecs", "mov")])
+
+    def test_job_and_state_changes_keep_the_catalogue_warm(self):
+        from src import server as s
+
+        project = FakeProject()
+        project.AddRenderJob = lambda: "job-1"
+        project.DeleteRenderJob = lambda job_id: True
+        project.StartRendering = lambda *args: True
+        project.StopRendering = lambda: None
+        project.SetRenderSettings = lambda settings: True
+        project.SaveAsNewRenderPreset = lambda name: True
+        with mock.patch.object(s, "_check", return_value=(mock.Mock(), project, None)):
+            s.render("get_codecs", {"format": "mov"})
+            s.render("list_presets")
+            s.render("add_job")
+            s.render("delete_job", {"job_id": "job-1"})
+            s.render("start")
+            s.render("stop")
+            s.render("load_preset", {"name": "H.264 Master"})
+            s.render("set_settings", {"settings": {"SelectAllFrames": True}})
+            s.render("get_codecs", {"format": "mov"})
+            s.render("list_presets")
+            self.assertEqual(project.calls, ["formats", ("codecs", "mov"), "presets"])
+            # Saving a preset drops the preset list and nothing else.
+            s.render("save_preset", {"name": "New"})
+            s.render("get_codecs", {"format": "mov"})
+            s.render("list_presets")
+        self.assertEqual(project.calls, ["formats", ("codecs", "mov"), "presets", "presets"])
+
+    def test_preset_pin_rereads_before_refusing_an_unknown_name(self):
+        from src import server as s
+
+        project = FakeProject()
+        rc.cached_render_presets(project)
+        project.presets.append("Made In The UI")
+        result, err = s._render_preset_pin(project, "Made In The UI")
+        self.assertIsNone(err)
+        self.assertEqual(project.calls, ["presets", "presets"])
+
+
+if __name__ == "__main__":
+    unittest.main()
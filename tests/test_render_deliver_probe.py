@@ -5,6 +5,7 @@ from src.server import (
     _list_delivery_targets,
     _prepare_delivery_job,
     _prepare_render_job,
+    _prepare_render_jobs,
     _probe_render_matrix,
     _resolve_delivery_target_live,
     _quick_export_capabilities,
@@ -277,6 +278,54 @@ class RenderDeliverProbeTest(unittest.TestCase):
             [w["code"] for w in result.get("warnings", [])],
         )
 
+    def test_prepare_render_jobs_reloads_the_preset_only_when_keys_could_leak(self):
+        project = RenderProjectStub()
+        loads = []
+        project.LoadRenderPreset = lambda name: (loads.append(name), True)[1]
+
+        result = _prepare_render_jobs(
+            project,
+            {
+                "target_dir": tempfile.gettempdir(),
+                "from_preset": "H.264 Master",
+                "jobs": [
+                    {"custom_name": "a"},
+                    {"custom_name": "b"},
+                    {"custom_name": "c", "settings": {"ExportAudio": False}},
+                    {"custom_name": "d"},
+                ],
+            },
+        )
+
+        self.assertTrue(result["success"])
+        self.assertEqual(result["job_ids"], ["job-1", "job-2", "job-3", "job-4"])
+        # b and c overwrite every key applied since the pin; d would inherit
+        # c's ExportAudio, so only d reloads.
+        self.assertEqual(len(loads), 2)
+        self.assertEqual(
+            [r["preset_pinned"].get("reused", False) for r in result["results"]],
+            [False, True, True, False],
+        )
+        self.assertIn("before", result)
+        self.assertNotIn("before", result["results"][0])
+
+    def test_prepare_render_jobs_stops_at_the_first_failure_by_default(self):
+        project = RenderProjectStub()
+        jobs = [{"custom_name": "a"}, {"custom_name": "b", "from_preset": "Audio Only"}, {"custom_name": "c"}]
+
+        stopped = _prepare_render_jobs(project, {"target_dir": tempfile.gettempdir(), "jobs": jobs})
+        self.assertFalse(stopped["success"])
+        self.assertEqual((stopped["failed"], stopped["not_attempted"]), ([1], 1))
+
+        project = RenderProjectStub()
+        kept_going = _prepare_render_jobs(
+            project, {"target_dir": tempfile.gettempdir(), "jobs": jobs, "continue_on_error": True})
+        self.assertEqual(kept_going["job_ids"], ["job-1", "job-2"])
+        self.assertEqual(kept_going["failed"], [1])
+
+    def test_prepare_render_jobs_requires_a_job_list(self):
+        self.assertIn("error", _prepare_render_jobs(RenderProjectStub(), {"jobs": []}))
+
     def test_prepare_render_job_rejects_unknown_preset_without_queueing(self):
         project = RenderProjectStub()
 
@@ -0,0 +1,125 @@
+"""Tests for the render queue actions: get_job_statuses and start."""
+import unittest
+from unittest import mock
+
+from src import server as s
+
+
+class QueueStub:
+    def __init__(self, rows, statuses=None, unique_id="project-1"):
+        self.rows = rows
+        self.unique_id = unique_id
+        self.statuses = statuses or {}
+        self.list_calls = 0
+        self.status_calls = []
+
+    def GetUniqueId(self):
+        return self.unique_id
+
+    def GetRenderJobList(self):
+        self.list_calls += 1
+        return self.rows
+
+    def GetRenderJobStatus(self, job_id):
+        self.status_calls.append(job_id)
+        return self.statuses.get(job_id, {})
+
+
+class RenderJobStatusesTests(unittest.TestCase):
+    def test_status_fields_embedded_in_the_list_need_no_per_job_call(self):
+        proj = QueueStub([
+            {"JobId": "a", "TargetDir": "/tmp", "JobStatus": "Complete", "CompletionPercentage": 100},
+            {"JobId": "b", "JobStatus": "Rendering", "CompletionPercentage": 40},
+        ])
+        out = s._render_job_statuses(proj, {})
+        self.assertEqual(out["statuses"], {
+            "a": {"JobStatus": "Complete", "CompletionPercentage": 100},
+            "b": {"JobStatus": "Rendering", "CompletionPercentage": 40},
+        })
+        self.assertEqual((proj.list_calls, proj.status_calls), (1, []))
+
+    def test_rows_without_status_fall_back_to_one_call_per_job(self):
+        proj = QueueStub(
+            [{"JobId": "a"}, {"JobId": "b"}],
+            {"a": {"JobStatus": "Ready", "CompletionPercentage": 0}},
+        )
+        out = s._render_job_statuses(proj, {"job_ids": ["a", "a", "zzz"]})
+        self.assertEqual(out["statuses"]["a"]["JobStatus"], "Ready")
+        self.assertIn("error", out["statuses"]["zzz"])
+        self.assertEqual(proj.status_calls, ["a", "zzz"])
+
+    def test_rejects_bad_job_ids(self):
+        self.assertIn("error", s._render_job_statuses(QueueStub([]), {"job_ids": "a"}))
+
+
+class RenderJobChangesTests(unittest.TestCase):
+    def setUp(self):
+        self.addCleanup(s._render_job_watch.clear)
+
+    def test_only_moved_jobs_are_reported_after_the_first_call(self):
+        proj = QueueStub([
+            {"JobId": "a", "JobStatus": "Rendering", "CompletionPercentage": 10},
+            {"JobId": "b", "JobStatus": "Ready", "CompletionPercentage": 0},
+        ])
+        first = s._render_job_changes(proj, {})
+        self.assertEqual(sorted(first["changed"]), ["a", "b"])
+        proj.rows[0]["CompletionPercentage"] = 55
+        second = s._render_job_changes(proj, {})
+        self.assertEqual(second, {
+            "changed": {"a": {"JobStatus": "Rendering", "CompletionPercentage": 55}},
+            "removed": [],
+            "unchanged": 1,
+        })
+        self.assertEqual(s._render_job_changes(proj, {})["changed"], {})
+
+    def test_a_fresh_wrapper_for_the_same_project_continues_the_watch(self):
+        # GetCurrentProject() returns a new wrapper on every tool call.
+        rows = [{"JobId": "a", "JobStatus": "Rendering", "CompletionPercentage": 10}]
+        s._render_job_changes(QueueStub(rows), {})
+        self.assertEqual(s._render_job_changes(QueueStub(rows), {})["changed"], {})
+        other = s._render_job_changes(QueueStub(rows, unique_id="project-2"), {})
+        self.assertEqual(list(other["changed"]), ["a"])
+
+    def test_deleted_jobs_are_reported_and_reset_starts_over(self):
+        proj = QueueStub([{"JobId": "a", "JobStatus": "Complete", "CompletionPercentage": 100}])
+        s._render_job_changes(proj, {})
+        proj.rows = []
+        self.assertEqual(s._render_job_changes(proj, {})["removed"], ["a"])
+        proj.rows = [{"JobId": "b", "JobStatus": "Ready", "CompletionPercentage": 0}]
+        s._render_job_changes(proj, {})
+        self.assertEqual(list(s._render_job_changes(proj, {"reset": True})["changed"]), ["b"])
+
+
+class RenderStartTests(unittest.TestCase):
+    def _start(self, params):
+        proj = mock.Mock()
+        proj.StartRendering.return_value = True
+        proj.GetRenderJobList.return_value = [{"JobId": "a"}, {"JobId": "b"}]
+        with mock.patch.object(s, "_check", return_value=(mock.Mock(), proj, None)):
+            return proj, s.render("start", params)
+
+    def test_whole_queue_starts_without_reading_it(self):
+        proj, out = self._start({})
+        self.assertEqual(out, {"success": True})
+        proj.StartRendering.assert_called_once_with(False)
+        proj.GetRenderJobList.assert_not_called()
+
+    def test_job_ids_are_deduplicated(self):
+        proj, out = self._start({"job_ids": ["a", "b", "a"], "return_job_ids": True})
+        proj.StartRendering.assert_called_once_with(["a", "b"], False)
+        self.assertEqual(out["job_ids"], ["a", "b"])
+        proj.GetRenderJobList.assert_not_called()
+
+    def test_malformed_job_ids_are_refused_before_starting(self):
+        for bad in ("abc", [{"id": "a"}], ["a", ""], [1]):
+            proj, out = self._start({"job_ids": bad})
+            self.assertIn("error", out)
+            proj.StartRendering.assert_not_called()
+
+    def test_return_job_ids_reads_the_queue_on_request(self):
+        _, out = self._start({"return_job_ids": True})
+        self.assertEqual(out["job_ids"], ["a", "b"])
+
+
+if __name__ == "__main__":
+    unittest.main()
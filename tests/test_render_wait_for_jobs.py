@@ -0,0 +1,78 @@
+"""Tests for render(action='wait_for_jobs'): server-side polling with backoff."""
+import unittest
+from unittest import mock
+
+from src import server as s
+
+
+class RenderQueueStub:
+    """Jobs advance one status step per poll while the queue is rendering."""
+
+    def __init__(self, steps, rendering=True):
+        self.steps = {job_id: list(seq) for job_id, seq in steps.items()}
+        self.rendering = rendering
+        self.status_calls = []
+
+    def GetRenderJobList(self):
+        return [{"JobId": job_id} for job_id in self.steps]
+
+    def GetRenderJobStatus(self, job_id):
+        self.status_calls.append(job_id)
+        seq = self.steps[job_id]
+        status = seq.pop(0) if len(seq) > 1 else seq[0]
+        return {"JobStatus": status, "CompletionPercentage": 100 if status == "Complete" else 50}
+
+    def IsRenderingInProgress(self):
+        return self.rendering
+
+
+class WaitForRenderJobsTests(unittest.TestCase):
+    def setUp(self):
+        self.clock = [0.0]
+        self.sleeps = []
+
+        def sleep(seconds):
+            self.sleeps.append(seconds)
+            self.clock[0] += seconds
+
+        for name, fn in (("monotonic", lambda: self.clock[0]), ("sleep", sleep)):
+            patcher = mock.patch.object(s.time, name, fn)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_returns_once_every_job_is_terminal_with_growing_interval(self):
+        proj = RenderQueueStub({
+            "a": ["Rendering", "Rendering", "Complete"],
+            "b": ["Rendering", "Rendering", "Rendering", "Failed"],
+        })
+        out = s._wait_for_render_jobs(proj, {})
+        self.assertTrue(out["success"])
+        self.assertEqual(out["completed"]["a"]["JobStatus"], "Complete")
+        self.assertEqual(out["completed"]["b"]["JobStatus"], "Failed")
+        self.assertEqual(self.sleeps, [0.5, 0.75, 1.125])
+        # A finished job is not polled again.
+        self.assertEqual(proj.status_calls.count("a"), 3)
+
+    def test_times_out_with_the_pending_ids(self):
+        proj = RenderQueueStub({"a": ["Rendering"]})
+        out = s._wait_for_render_jobs(proj, {"job_ids": ["a"], "timeout": 2, "max_interval": 1})
+        self.assertEqual((out["pending"], out["timed_out"], out["idle"]), (["a"], True, False))
+        self.assertLessEqual(self.clock[0], 2)
+
+    def test_idle_queue_returns_without_waiting(self):
+        proj = RenderQueueStub({"a": ["Ready"]}, rendering=False)
+        out = s._wait_for_render_jobs(proj, {"job_ids": ["a"]})
+        self.assertEqual((out["pending"], out["idle"], out["timed_out"]), (["a"], True, False))
+        self.assertEqual(self.sleeps, [])
+
+    def test_timeout_is_capped(self):
+        proj = RenderQueueStub({"a": ["Rendering"]})
+        s._wait_for_render_jobs(proj, {"job_ids": ["a"], "timeout": 10_000})
+        self.assertLessEqual(self.clock[0], s._RENDER_WAIT_MAX_SECONDS)
+
+    def test_rejects_bad_job_ids(self):
+        self.assertIn("error", s._wait_for_render_jobs(RenderQueueStub({}), {"job_ids": "a"}))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -514,5 +514,16 @@ class RemoveMotionBlurStringReturnTest(unittest.TestCase):
         self.assertNotIn("error", out)
 
 
+class MethodProbeIsPerObjectTest(unittest.TestCase):
+    def test_same_type_name_does_not_share_an_answer(self):
+        # Live objects all report type PyRemoteObject; a type-keyed memo would
+        # let the first probe decide for every object after it.
+        PyRemoteObject = type("PyRemoteObject", (), {})
+        timeline, legacy = PyRemoteObject(), PyRemoteObject()
+        timeline.AnalyzeForSlate = lambda color: True
+        self.assertTrue(compound._has_method(timeline, "AnalyzeForSlate"))
+        self.assertIsNotNone(compound._requires_method(legacy, "AnalyzeForSlate", "21.0"))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -52,6 +52,15 @@ class SigningTests(unittest.TestCase):
         b = {"operation": "health", "id": "x", "protocol": "1.0"}
         self.assertEqual(rb.canonical_request(a), rb.canonical_request(b))
 
+    def test_canonical_form_is_unchanged_byte_for_byte(self) -> None:
+        # An installed in-Resolve copy may predate the client; both must sign
+        # exactly the bytes `json.dumps` produced with these options.
+        request = {"id": "é", "arguments": {"b": [1, 2.5, None], "a": True}, "nonce": "n" * 20}
+        self.assertEqual(
+            rb.canonical_request(request),
+            json.dumps(request, sort_keys=True, separators=(",", ":"), ensure_ascii=True).encode("utf-8"),
+        )
+
     def test_a_different_token_does_not_verify(self) -> None:
         request = signed(TOKEN, timestamp=1000, nonce="n" * 20)
         self.assertFalse(rb.signature_is_valid("x" * 48, request, request["signature"]))
@@ -405,6 +414,14 @@ class OperationSurfaceTests(unittest.TestCase):
         self.assertEqual(set(health["operations"]), set(ops.ResolveOperations.OPERATIONS))
         self.assertEqual(health["edition"], "free")
 
+    def test_health_surface_lists_are_sorted_copies(self) -> None:
+        bridge = self._ops()
+        first = bridge.dispatch("health", {})
+        self.assertEqual(first["operations"], sorted(bridge.OPERATIONS))
+        self.assertEqual(first["write_operations"], sorted(bridge.WRITE_OPERATIONS))
+        first["operations"].clear()
+        self.assertEqual(bridge.dispatch("health", {})["operations"], sorted(bridge.OPERATIONS))
+
     def test_studio_edition_is_detected(self) -> None:
         health = self._ops(product="DaVinci Resolve Studio").dispatch("health", {})
         self.assertEqual(health["edition"], "studio")
@@ -438,6 +455,15 @@ class OperationSurfaceTests(unittest.TestCase):
             self._ops(fail=["no_project"]).dispatch("get_project", {})
         self.assertEqual(ctx.exception.code, "no_project")
 
+    def test_project_summary_reads_the_current_timeline_once(self) -> None:
+        resolve = FakeResolve(timelines=["Cut v1", "Cut v2"])
+        reads = []
+        current = resolve.GetCurrentTimeline
+        resolve.GetCurrentTimeline = lambda: reads.append(1) or current()
+        summary = self._ops(resolve=resolve).dispatch("get_project", {})
+        self.assertEqual(summary, {"name": "Alpha", "timeline_count": 2, "current_timeline": "Cut v1"})
+        self.assertEqual(len(reads), 1)
+
     def test_duplicate_timeline_names_are_ambiguous_not_arbitrary(self) -> None:
         from src.utils import resolve_bridge_ops as ops
         with self.assertRaises(ops.OperationError) as ctx:
@@ -1137,6 +1163,20 @@ class ProxyTests(unittest.TestCase):
         name = self.resolve.GetProjectManager().GetCurrentProject().GetName()
         self.assertEqual(name, "Alpha")
 
+    def test_request_ids_are_distinct_per_call(self) -> None:
+        from unittest import mock
+
+        sign = self.rbc._bridge.sign_request
+        with mock.patch.object(self.rbc._bridge, "sign_request", wraps=sign) as signed:
+            self.transport.request("health", {})
+            self.transport.request("health", {})
+        # The in-process server verifies with the same function, so each
+        # request is seen twice; distinct ids and nonces collapse to two.
+        pairs = {(c.args[1]["id"], c.args[1]["nonce"]) for c in signed.call_args_list}
+        self.assertEqual(len(pairs), 2)
+        self.assertEqual(len({request_id for request_id, _nonce in pairs}), 2)
+        self.assertEqual(len({nonce for _id, nonce in pairs}), 2)
+
     def test_scalars_come_back_as_scalars(self) -> None:
         project = self.resolve.GetProjectManager().GetCurrentProject()
         self.assertEqual(project.GetTimelineCount(), 2)
@@ -1896,6 +1936,7 @@ class ServerReachesTheBridgeTests(unittest.TestCase):
         server = self._server_module()
         sentinel = mock.MagicMock(name="bridge-proxy")
         with mock.patch.object(server, "dvr_script", None), \
+                mock.patch.object(server, "_dvr_script_attempted", True), \
                 mock.patch.object(server, "_bridge_requested", return_value=True), \
                 mock.patch.object(server, "connect_resolve", return_value=sentinel) as connect, \
                 mock.patch.object(server, "_is_resolve_handle_live", return_value=True):
@@ -1903,11 +1944,31 @@ class ServerReachesTheBridgeTests(unittest.TestCase):
         # And it was handed None, which is exactly what bridge mode expects.
         connect.assert_called_once_with(None)
 
+    def test_scripting_module_is_imported_lazily_and_once(self) -> None:
+        import sys
+        from unittest import mock
+
+        server = self._server_module()
+        fake = mock.MagicMock(name="DaVinciResolveScript")
+        with mock.patch.object(server, "dvr_script", None), \
+                mock.patch.object(server, "_dvr_script_attempted", False):
+            with mock.patch.dict(sys.modules, {"DaVinciResolveScript": None}):
+                self.assertIsNone(server._load_dvr_script())
+            # A failed import is not retried on the next connection attempt.
+            with mock.patch.dict(sys.modules, {"DaVinciResolveScript": fake}):
+                self.assertIsNone(server._load_dvr_script())
+        with mock.patch.object(server, "dvr_script", None), \
+                mock.patch.object(server, "_dvr_script_attempted", False), \
+                mock.patch.dict(sys.modules, {"DaVinciResolveScript": fake}):
+            self.assertIs(server._load_dvr_script(), fake)
+            self.assertIs(server.dvr_script, fake)
+
     def test_without_the_bridge_a_missing_module_still_short_circuits(self) -> None:
         from unittest import mock
 
         server = self._server_module()
         with mock.patch.object(server, "dvr_script", None), \
+                mock.patch.object(server, "_dvr_script_attempted", True), \
                 mock.patch.object(server, "_bridge_requested", return_value=False), \
                 mock.patch.object(server, "connect_resolve") as connect:
             self.assertIsNone(server._try_connect())
@@ -0,0 +1,91 @@
+"""restore_state only switches timelines when the saved one is no longer current.
+
+Every SetCurrentTimeline repaints Resolve's UI, and finding the timeline by id
+is a scan over the whole project.
+"""
+import unittest
+from unittest.mock import patch
+
+from src import server
+
+
+class FakeTimeline:
+    def __init__(self, uid):
+        self.uid = uid
+        self.timecodes = []
+
+    def GetUniqueId(self):
+        return self.uid
+
+    def SetCurrentTimecode(self, tc):
+        self.timecodes.append(tc)
+        return True
+
+
+class FakeProject:
+    def __init__(self, timelines, current):
+        self.timelines = timelines
+        self.current = current
+        self.switches = []
+        self.by_index_calls = 0
+
+    def GetCurrentTimeline(self):
+        return self.current
+
+    def GetTimelineCount(self):
+        return len(self.timelines)
+
+    def GetTimelineByIndex(self, i):
+        self.by_index_calls += 1
+        return self.timelines[i - 1]
+
+    def SetCurrentTimeline(self, tl):
+        self.switches.append(tl)
+        self.current = tl
+        return True
+
+
+class FakePM:
+    def __init__(self, project):
+        self.project = project
+
+    def GetCurrentProject(self):
+        return self.project
+
+
+class FakeResolve:
+    def __init__(self, project):
+        self.pm = FakePM(project)
+
+    def GetProjectManager(self):
+        return self.pm
+
+
+class RestoreStateTimelineTests(unittest.TestCase):
+    def _restore(self, project, timeline_id):
+        token = "tok-restore-test"
+        state = {"current_timeline_id": timeline_id, "current_timecode": "01:00:00:00"}
+        with patch.dict(server._RESOLVE_STATE_SNAPSHOTS, {token: state}), \
+                patch("src.server.get_resolve", return_value=FakeResolve(project)):
+            return server._resolve_restore_state({"state_token": token})["restored"]
+
+    def test_already_current_timeline_is_not_switched(self):
+        a, b = FakeTimeline("a"), FakeTimeline("b")
+        project = FakeProject([a, b], current=b)
+        out = self._restore(project, "b")
+        self.assertEqual(out["current_timeline_id"], "b")
+        self.assertEqual(project.switches, [])
+        self.assertEqual(project.by_index_calls, 0)
+        self.assertEqual(b.timecodes, ["01:00:00:00"])
+
+    def test_other_timeline_is_found_and_switched_to(self):
+        a, b = FakeTimeline("a"), FakeTimeline("b")
+        project = FakeProject([a, b], current=b)
+        out = self._restore(project, "a")
+        self.assertEqual(out["current_timeline_id"], "a")
+        self.assertEqual(project.switches, [a])
+        self.assertEqual(a.timecodes, ["01:00:00:00"])
+
+
+if __name__ == "__main__":
+    unittest.main()
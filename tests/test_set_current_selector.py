@@ -29,6 +29,9 @@ class ProjectStub:
     def GetTimelineByIndex(self, index):
         return self._timelines[index - 1] if 1 <= index <= len(self._timelines) else None
 
+    def GetCurrentTimeline(self):
+        return self.set_to
+
     def SetCurrentTimeline(self, tl):
         self.set_to = tl
         return True
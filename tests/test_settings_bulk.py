@@ -0,0 +1,78 @@
+"""project_settings/timeline set_settings: several writes on one handle.
+
+One GetSetting("") up front lets keys that already hold the value skip their
+SetSetting, and each refusal reports per key, with the api_truth entry when the
+key is a known limitation.
+"""
+import unittest
+from unittest import mock
+
+from src import server as s
+
+
+class FakeSettingsTarget:
+    def __init__(self, settings, refuse=()):
+        self.settings = dict(settings)
+        self.refuse = set(refuse)
+        self.set_calls = []
+        self.get_calls = []
+
+    def GetSetting(self, name=""):
+        self.get_calls.append(name)
+        return dict(self.settings) if name == "" else self.settings.get(name)
+
+    def SetSetting(self, name, value):
+        self.set_calls.append((name, value))
+        if name in self.refuse:
+            return False
+        self.settings[name] = str(value)
+        return True
+
+
+class ProjectSetSettingsTests(unittest.TestCase):
+    def _call(self, proj, params):
+        with mock.patch.object(s, "_check", return_value=(None, proj, None)):
+            return s.project_settings("set_settings", params)
+
+    def test_only_changed_keys_are_written(self):
+        proj = FakeSettingsTarget({"timelineResolutionWidth": "1920", "timelineResolutionHeight": "1080"})
+        out = self._call(proj, {"settings": {"timelineResolutionWidth": 3840, "timelineResolutionHeight": "1080"}})
+        self.assertTrue(out["success"])
+        self.assertEqual(out["updated"], ["timelineResolutionWidth"])
+        self.assertEqual(out["unchanged"], ["timelineResolutionHeight"])
+        self.assertEqual(proj.set_calls, [("timelineResolutionWidth", 3840)])
+        self.assertEqual(proj.get_calls, [""])
+
+    def test_refusals_are_reported_per_key(self):
+        proj = FakeSettingsTarget({}, refuse={"badKey"})
+        out = self._call(proj, {"settings": {"badKey": "1", "goodKey": "2"}})
+        self.assertFalse(out["success"])
+        self.assertEqual(out["updated"], ["goodKey"])
+        self.assertIn("error", out["failed"]["badKey"])
+
+    def test_known_limitation_is_attached(self):
+        proj = FakeSettingsTarget({}, refuse={"badKey"})
+        known = {"symbol": "Project.SetSetting('badKey')", "reality": "r", "recommended": "x"}
+        with mock.patch.object(s, "_setting_limitation", return_value=known):
+            out = self._call(proj, {"settings": {"badKey": "1"}})
+        self.assertEqual(out["failed"]["badKey"]["known_limitation"]["reality"], "r")
+
+    def test_settings_must_be_a_non_empty_object(self):
+        for bad in (None, {}, ["a"]):
+            out = self._call(FakeSettingsTarget({}), {"settings": bad})
+            self.assertIn("error", out)
+
+
+class TimelineSetSettingsTests(unittest.TestCase):
+    def test_timeline_limitation_lookup_uses_timeline_object(self):
+        tl = FakeSettingsTarget({}, refuse={"timelinePlaybackFrameRate"})
+        with mock.patch.object(s, "_setting_limitation", return_value=None) as lookup:
+            out = s._set_settings_bulk(tl, {"timelinePlaybackFrameRate": "24"}, obj="Timeline")
+        lookup.assert_called_once_with("timelinePlaybackFrameRate", obj="Timeline")
+        # No api_truth entry still leaves a reason, never a bare None.
+        self.assertEqual(list(out["failed"]), ["timelinePlaybackFrameRate"])
+        self.assertEqual(set(out["failed"]["timelinePlaybackFrameRate"]), {"error"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,6 +6,7 @@ import unittest
 import anyio
 
 from src.server import _install_threaded_tool_dispatch
+from src.utils.mcp_dispatch import install_threaded_tool_dispatch
 
 
 class FakeTool:
@@ -50,6 +51,16 @@ class ThreadedToolDispatchTest(unittest.TestCase):
         self.assertEqual(result["value"], 42)
         self.assertNotEqual(result["thread"], main_thread)  # ran off the event-loop thread
 
+    def test_bodies_run_under_the_callers_lock(self):
+        # The granular entrypoint passes its own lock rather than the compound
+        # server's _bridge_lock.
+        lock = threading.Lock()
+        tool = FakeTool(lambda **kw: lock.locked(), name="held")
+        install_threaded_tool_dispatch(FakeMCP({"held": tool}), lock)
+
+        self.assertTrue(anyio.run(lambda: tool.fn()))
+        self.assertFalse(lock.locked())
+
     def test_missing_tool_manager_is_a_noop(self):
         self.assertEqual(_install_threaded_tool_dispatch(object()), 0)
 
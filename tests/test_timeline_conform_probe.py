@@ -1,5 +1,7 @@
+import os
 import tempfile
 import unittest
+from unittest import mock
 from pathlib import Path
 
 from src.server import (
@@ -9,6 +11,7 @@ from src.server import (
     _detect_gaps_overlaps_from_snapshot,
     _detect_missing_media_from_snapshot,
     _export_timeline_checked,
+    _export_timelines_checked,
     _source_ranges_from_snapshot,
     _timeline_conform_snapshot,
     _timeline_export_spec,
@@ -191,6 +194,65 @@ class TimelineConformProbeTest(unittest.TestCase):
         self.assertTrue(result["is_directory"])
         self.assertTrue(result["primary_file"].endswith("Info.fcpxml"))
 
+    def test_export_checked_dry_run_creates_no_folder(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            folder = Path(tmp) / "exports"
+            result = _export_timeline_checked(
+                self._timeline(),
+                {"format": "edl", "path": str(folder / "cut.edl"), "dry_run": True,
+                 "require_temp_path": False},
+            )
+            self.assertTrue(result["would_export"])
+            self.assertFalse(folder.exists())
+
+    def test_export_timelines_checked_exports_each_selected_timeline(self):
+        class NamedTimeline(TimelineStub):
+            def __init__(self, name, uid):
+                super().__init__({})
+                self.name, self.uid = name, uid
+
+            def GetName(self):
+                return self.name
+
+            def GetUniqueId(self):
+                return self.uid
+
+        timelines = [NamedTimeline("Cut A", "ta"), NamedTimeline("Cut/B", "tb"), NamedTimeline("Cut A", "tc")]
+
+        class ProjectStub:
+            def GetTimelineCount(self):
+                return len(timelines)
+
+            def GetTimelineByIndex(self, index):
+                return timelines[index - 1]
+
+        with tempfile.TemporaryDirectory() as tmp:
+            result = _export_timelines_checked(ProjectStub(), {
+                "timeline_ids": ["tb", "tc", "missing"], "timeline_names": ["Cut A"],
+                "format": "edl", "output_dir": tmp, "require_temp_path": False,
+            })
+            written = sorted(p.name for p in Path(tmp).iterdir())
+
+        self.assertEqual((result["exported"], result["count"]), (3, 4))
+        self.assertFalse(result["success"])
+        self.assertEqual([row.get("name") for row in result["results"]], ["Cut/B", "Cut A", None, "Cut A"])
+        self.assertEqual(written, ["Cut_A.edl", "Cut_A_2.edl", "Cut_B.edl"])
+
+    def test_export_timelines_checked_dry_run_creates_no_output_dir(self):
+        class EmptyProject:
+            def GetTimelineCount(self):
+                return 0
+
+        with mock.patch("tempfile.mkdtemp") as mkdtemp:
+            result = _export_timelines_checked(EmptyProject(), {"timeline_names": ["Cut A"], "dry_run": True})
+        mkdtemp.assert_not_called()
+        self.assertTrue(result["output_dir"].startswith(tempfile.gettempdir()))
+        self.assertFalse(os.path.exists(result["output_dir"]))
+
+    def test_export_timelines_checked_requires_selectors(self):
+        self.assertIn("error", _export_timelines_checked(object(), {"timeline_ids": "ta"}))
+        self.assertIn("error", _export_timelines_checked(object(), {}))
+
     def test_missing_media_and_relink_plan(self):
         with tempfile.TemporaryDirectory() as tmp:
             missing_path = str(Path(tmp) / "offline" / "lost.mov")
@@ -3,6 +3,7 @@ import unittest
 from src.utils.timeline_kernel_probe import (
     ProbeRecorder,
     parse_api_class_methods,
+    parse_api_classes_methods,
     parse_timeline_item_property_keys,
     render_markdown_report,
     values_match,
@@ -33,6 +34,11 @@ TimelineItem
 """
 
         self.assertEqual(parse_api_class_methods(api_text, "Timeline"), ["GetTrackCount", "DeleteClips"])
+        self.assertEqual(parse_api_classes_methods(api_text, ["Timeline", "TimelineItem", "Missing"]), {
+            "Timeline": ["GetTrackCount", "DeleteClips"],
+            "TimelineItem": ["GetName"],
+            "Missing": [],
+        })
 
     def test_probe_recorder_counts_and_validates_status(self):
         recorder = ProbeRecorder()
@@ -0,0 +1,135 @@
+"""Tests for the compound server's timeline name/id lookup index."""
+import unittest
+from unittest import mock
+
+from src import server as s
+
+
+class FakeTimeline:
+    def __init__(self, name, uid):
+        self.name = name
+        self.uid = uid
+
+    def GetName(self):
+        return self.name
+
+    def GetUniqueId(self):
+        return self.uid
+
+
+class FakeProject:
+    def __init__(self, names):
+        self.timelines = [FakeTimeline(n, f"id-{n}") for n in names]
+        self.index_calls = 0
+
+    def GetTimelineCount(self):
+        return len(self.timelines)
+
+    def GetTimelineByIndex(self, index):
+        self.index_calls += 1
+        return self.timelines[index - 1] if 1 <= index <= len(self.timelines) else None
+
+
+class TimelineLookupIndexTests(unittest.TestCase):
+    def setUp(self):
+        s._timeline_lookup_index.clear()
+        self.addCleanup(s._timeline_lookup_index.clear)
+
+    def test_repeat_lookups_skip_the_scan(self):
+        proj = FakeProject([f"T{i}" for i in range(1, 51)])
+        tl, index = s._find_timeline_by_name(proj, "T40")
+        self.assertEqual((tl.GetName(), index), ("T40", 40))
+        proj.index_calls = 0
+        self.assertEqual(s._find_timeline_by_name(proj, "T7")[1], 7)
+        self.assertEqual(s._find_timeline_by_id(proj, "id-T7")[1], 7)
+        self.assertEqual(proj.index_calls, 1 + 50)
+
+    def test_stale_entries_are_rescanned_not_trusted(self):
+        proj = FakeProject(["A", "B", "C"])
+        s._find_timeline_by_name(proj, "C")
+        del proj.timelines[0]
+        self.assertEqual(s._find_timeline_by_name(proj, "C")[1], 2)
+        proj.timelines[0].name = "Renamed"
+        self.assertEqual(s._find_timeline_by_name(proj, "B"), (None, None))
+
+    def test_duplicate_names_resolve_to_the_first(self):
+        proj = FakeProject(["Dup", "Dup"])
+        self.assertEqual(s._find_timeline_by_name(proj, "Dup")[1], 1)
+        self.assertEqual(s._find_timeline_by_name(proj, "Dup")[1], 1)
+
+    def test_unique_name_scan_seeds_the_name_index(self):
+        proj = FakeProject(["Edit", "Edit v02", "Other"])
+        self.assertEqual(s._unique_timeline_name(proj, "Edit"), "Edit v03")
+        proj.index_calls = 0
+        self.assertEqual(s._find_timeline_by_name(proj, "Other")[1], 3)
+        self.assertEqual(proj.index_calls, 1)
+
+    def test_new_timeline_is_found_without_a_scan(self):
+        proj = FakeProject([f"T{i}" for i in range(1, 21)])
+        proj.timelines.append(FakeTimeline("Variant", "id-Variant"))
+        self.assertEqual(s._remember_new_timeline(proj, proj.timelines[-1]), ("Variant", "id-Variant"))
+        self.assertEqual(s._find_timeline_by_name(proj, "Variant")[1], 21)
+        self.assertEqual(s._find_timeline_by_id(proj, "id-Variant")[1], 21)
+        self.assertEqual(proj.index_calls, 2)
+
+
+class SetCurrentTimelineTests(unittest.TestCase):
+    def setUp(self):
+        s._timeline_lookup_index.clear()
+        self.addCleanup(s._timeline_lookup_index.clear)
+
+    def _project(self):
+        proj = FakeProject(["A", "B", "C"])
+        proj.current = proj.timelines[1]
+        proj.switches = []
+        proj.GetCurrentTimeline = lambda: proj.current
+        proj.SetCurrentTimeline = lambda tl: proj.switches.append(tl.GetName()) or True
+        return proj
+
+    def _set_current(self, proj, params):
+        with mock.patch.object(s, "_check", return_value=(object(), proj, None)):
+            return s.timeline("set_current", params)
+
+    def test_reselecting_the_current_timeline_is_a_no_op(self):
+        proj = self._project()
+        for params in ({"name": "B"}, {"id": "id-B"}):
+            self.assertEqual(self._set_current(proj, params), {"success": True, "already_current": True})
+        self.assertEqual((proj.index_calls, proj.switches), (0, []))
+
+    def test_other_timeline_is_switched_to(self):
+        proj = self._project()
+        self.assertEqual(self._set_current(proj, {"name": "C"}), {"success": True})
+        self.assertEqual(self._set_current(proj, {"id": "id-A", "name": "B"}), {"success": True})
+        self.assertEqual(proj.switches, ["C", "A"])
+
+
+class DuplicateTimelineTests(unittest.TestCase):
+    def setUp(self):
+        s._timeline_lookup_index.clear()
+        self.addCleanup(s._timeline_lookup_index.clear)
+
+    def _duplicate(self, proj, params):
+        with mock.patch.object(s, "_check", return_value=(object(), proj, None)):
+            return s.timeline("duplicate", params)
+
+    def test_success_never_scans(self):
+        proj = FakeProject(["A", "B"])
+        source = proj.timelines[0]
+        source.DuplicateTimeline = lambda name: FakeTimeline(name, "id-new")
+        proj.GetCurrentTimeline = lambda: source
+        self.assertEqual(self._duplicate(proj, {}), {"success": True, "name": "A Copy"})
+        self.assertEqual(proj.index_calls, 0)
+
+    def test_refused_duplicate_names_the_colliding_timeline(self):
+        proj = FakeProject(["A", "B"])
+        source = proj.timelines[0]
+        source.DuplicateTimeline = lambda name: None
+        proj.GetCurrentTimeline = lambda: source
+        out = self._duplicate(proj, {"name": "B"})
+        self.assertEqual(out["error"]["code"], "TIMELINE_NAME_TAKEN")
+        self.assertEqual(out["error"]["state"]["existing_timeline"], {"name": "B", "id": "id-B", "index": 2})
+        self.assertEqual(self._duplicate(proj, {"name": "C"})["error"]["message"], "Failed to duplicate")
+
+
+if __name__ == "__main__":
+    unittest.main()
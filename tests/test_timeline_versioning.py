@@ -452,6 +452,16 @@ class DiffTimelinesTests(unittest.TestCase):
         self.assertFalse(out["success"])
         self.assertIn("Nope", out["error"])
 
+    def test_name_lookup_stops_once_every_name_is_found(self) -> None:
+        project = self._project()
+        project._timelines.append(_MockTimeline("Later", unique_id="tl_later", tracks={}))
+        reads = []
+        original = project.GetTimelineByIndex
+        project.GetTimelineByIndex = lambda idx: reads.append(idx) or original(idx)
+        found = timeline_versioning._find_timelines_by_name(project, "Variant", "Source")
+        self.assertEqual(set(found), {"Source", "Variant"})
+        self.assertEqual(reads, [1, 2])
+
 
 if __name__ == "__main__":
     unittest.main()
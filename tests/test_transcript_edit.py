@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import subprocess
+import sys
 import unittest
 
 from src.utils import transcript_edit as te
@@ -68,6 +70,11 @@ class FillerAndPauseTests(unittest.TestCase):
 
         self.assertEqual(set(te.FILLER_WORDS), set(HESITATION_WORDS))
 
+    def test_import_does_not_load_the_analyzer_stack(self) -> None:
+        probe = "import sys, src.utils.transcript_edit; print('numpy' in sys.modules)"
+        out = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True)
+        self.assertEqual(out.stdout.strip(), "False")
+
     def test_long_pause_is_collapsed_with_handles(self) -> None:
         stream = words(("one", 0.0, 0.5), ("two", 3.0, 3.5))
         hits = te.detect_long_pauses(stream, max_pause=0.6, handle=0.15, min_cut=0.15)
@@ -38,8 +38,8 @@ class DeleteTimelinesReadbackTest(unittest.TestCase):
         fake_proj.GetTimelineByIndex.return_value = fake_tl
         fake_mp = mock.Mock()
         fake_mp.DeleteTimelines.return_value = True
-        # GetTimelineCount: once to build the list (1), then before(2), then after(1).
-        fake_proj.GetTimelineCount.side_effect = [1, 2, 1]
+        # GetTimelineCount: once to build the list, reused as before (2), then after (1).
+        fake_proj.GetTimelineCount.side_effect = [2, 1]
         with mock.patch.object(s, "_check", return_value=(mock.Mock(), fake_proj, None)), \
              mock.patch.object(s, "_get_mp", return_value=(mock.Mock(), fake_proj, fake_mp, None)), \
              mock.patch.object(s, "_confirm_token_required", return_value=False):
@@ -49,6 +49,36 @@ class DeleteTimelinesReadbackTest(unittest.TestCase):
         self.assertTrue(out["verified"])
         self.assertLess(out["timelines_after"], out["timelines_before"])
 
+    def _delete(self, ids, counts, remaining):
+        def tl(uid):
+            t = mock.Mock()
+            t.GetUniqueId.return_value = uid
+            t.GetName.return_value = uid
+            return t
+
+        fake_proj = mock.Mock()
+        lookups = [tl("a"), tl("b"), tl("c")]
+        fake_proj.GetTimelineByIndex.side_effect = lambda i: (
+            lookups[i - 1] if not fake_mp.DeleteTimelines.called else tl(remaining[i - 1]))
+        fake_proj.GetTimelineCount.side_effect = counts
+        fake_mp = mock.Mock()
+        fake_mp.DeleteTimelines.return_value = True
+        with mock.patch.object(s, "_check", return_value=(mock.Mock(), fake_proj, None)), \
+             mock.patch.object(s, "_get_mp", return_value=(mock.Mock(), fake_proj, fake_mp, None)), \
+             mock.patch.object(s, "_confirm_token_required", return_value=False):
+            out = s.media_pool("delete_timelines", {"timeline_ids": ids})
+        return out, fake_proj
+
+    def test_exact_count_drop_needs_no_survivor_scan(self):
+        out, proj = self._delete(["a", "b"], [3, 1], ["c"])
+        self.assertTrue(out["verified"])
+        self.assertEqual(proj.GetTimelineByIndex.call_count, 2)
+
+    def test_partial_drop_names_the_survivor(self):
+        out, _ = self._delete(["a", "b"], [3, 2], ["b", "c"])
+        self.assertFalse(out["verified"])
+        self.assertEqual(out["not_deleted"], ["b"])
+
 
 class RawSetCdlValidationTest(unittest.TestCase):
     def test_malformed_cdl_rejected(self):